@@ -0,0 +1,1340 @@
+"""Precompiled rule parser.
+
+Generated by ``python -m annual.ruleparser``. Do not edit.
+"""
+
+# fmt: off
+GRAMMAR_DIGEST = (
+    '42901740c59d3d98160eddae06061d12ca52767df04361db24ada8fa76a9ee10'
+)
+LARK_VERSION = '1.3.1'
+PARSER = (b'\x80\x05\x95\xc2\x95\x00\x00\x00\x00\x00\x00}\x94(\x8c\x04data\x94}\x94('
+ b'\x8c\x06parser\x94}\x94(\x8c\nlexer_conf\x94}\x94(\x8c\tterminals\x94'
+ b']\x94(}\x94\x8c\x01@\x94K\x00s}\x94h\nK\x01s}\x94h\nK\x02s}\x94h\nK\x03'
+ b's}\x94h\nK\x04s}\x94h\nK\x05s}\x94h\nK\x06s}\x94h\nK\x07s}\x94h\nK\x08s'
+ b'}\x94h\nK\ts}\x94h\nK\ns}\x94h\nK\x0bs}\x94h\nK\x0cs}\x94h\nK\rs}\x94h\nK'
+ b'\x0es}\x94h\nK\x0fs}\x94h\nK\x10s}\x94h\nK\x11s}\x94h\nK\x12s}\x94h\nK\x13'
+ b's}\x94h\nK\x14s}\x94h\nK\x15s}\x94h\nK\x16s}\x94h\nK\x17s}\x94h\nK\x18s'
+ b'}\x94h\nK\x19s}\x94h\nK\x1as}\x94h\nK\x1bs}\x94h\nK\x1cs}\x94h\nK\x1ds}'
+ b'\x94h\nK\x1es}\x94h\nK\x1fs}\x94h\nK s}\x94h\nK!s}\x94h\nK"s}\x94h\nK#'
+ b"s}\x94h\nK$s}\x94h\nK%s}\x94h\nK&s}\x94h\nK's}\x94h\nK(s}\x94h\nK)s}"
+ b'\x94h\nK*s}\x94h\nK+s}\x94h\nK,s}\x94h\nK-s}\x94h\nK.s}\x94h\nK/s}\x94h'
+ b'\nK0s}\x94h\nK1s}\x94h\nK2s}\x94h\nK3se\x8c\x06ignore\x94]\x94\x8c\n__IGN'
+ b'ORE_0\x94a\x8c\rg_regex_flags\x94K\x00\x8c\tuse_bytes\x94\x89\x8c\nlexer_ty'
+ b'pe\x94\x8c\ncontextual\x94\x8c\x08__type__\x94\x8c\tLexerConf\x94u'
+ b'\x8c\x0bparser_conf\x94}\x94(\x8c\x05rules\x94]\x94(}\x94h\nK4s}\x94h\nK'
+ b'5s}\x94h\nK6s}\x94h\nK7s}\x94h\nK8s}\x94h\nK9s}\x94h\nK:s}\x94h\nK;s'
+ b'}\x94h\nK<s}\x94h\nK=s}\x94h\nK>s}\x94h\nK?s}\x94h\nK@s}\x94h\nKAs}\x94'
+ b'h\nKBs}\x94h\nKCs}\x94h\nKDs}\x94h\nKEs}\x94h\nKFs}\x94h\nKGs}\x94h\nKHs}'
+ b'\x94h\nKIs}\x94h\nKJs}\x94h\nKKs}\x94h\nKLs}\x94h\nKMs}\x94h\nKNs}\x94h'
+ b'\nKOs}\x94h\nKPs}\x94h\nKQs}\x94h\nKRs}\x94h\nKSs}\x94h\nKTs}\x94h\nK'
+ b'Us}\x94h\nKVs}\x94h\nKWs}\x94h\nKXs}\x94h\nKYs}\x94h\nKZs}\x94h\nK[s'
+ b'}\x94h\nK\\s}\x94h\nK]s}\x94h\nK^s}\x94h\nK_s}\x94h\nK`s}\x94h\nKas}\x94'
+ b'h\nKbs}\x94h\nKcs}\x94h\nKds}\x94h\nKes}\x94h\nKfs}\x94h\nKgs}\x94h\nKhs}'
+ b'\x94h\nKis}\x94h\nKjs}\x94h\nKks}\x94h\nKls}\x94h\nKms}\x94h\nKns}\x94h'
+ b'\nKos}\x94h\nKps}\x94h\nKqs}\x94h\nKrs}\x94h\nKss}\x94h\nKts}\x94h\nK'
+ b'us}\x94h\nKvs}\x94h\nKws}\x94h\nKxs}\x94h\nKys}\x94h\nKzs}\x94h\nK{s'
+ b'}\x94h\nK|s}\x94h\nK}s}\x94h\nK~s}\x94h\nK\x7fs}\x94h\nK\x80s}\x94h\nK'
+ b'\x81s}\x94h\nK\x82s}\x94h\nK\x83s}\x94h\nK\x84s}\x94h\nK\x85s}\x94h\nK\x86'
+ b's}\x94h\nK\x87s}\x94h\nK\x88s}\x94h\nK\x89s}\x94h\nK\x8ase\x8c\x05star'
+ b't\x94]\x94\x8c\x04rule\x94a\x8c\x0bparser_type\x94\x8c\x04lalr\x94hE\x8c'
+ b'\nParserConf\x94uh\x03}\x94(\x8c\x06tokens\x94}\x94(K\x00\x8c\x04$END\x94K'
+ b'\x01\x8c\x05AFTER\x94K\x02\x8c\x03AND\x94K\x03\x8c\x05APRIL\x94K'
+ b'\x04\x8c\x06AUGUST\x94K\x05\x8c\x06BEFORE\x94K\x06\x8c\x04DAYS\x94K\x07'
+ b'\x8c\x08DECEMBER\x94K\x08\x8c\x05FALSE\x94K\t\x8c\x08FEBRUARY\x94K\n'
+ b'\x8c\x05FIRST\x94K\x0b\x8c\x06FOURTH\x94K\x0c\x8c\x06FRIDAY\x94K\r'
+ b'\x8c\x07JANUARY\x94K\x0e\x8c\x04JULY\x94K\x0f\x8c\x04JUNE\x94K\x10\x8c\x04'
+ b'LEAP\x94K\x11\x8c\x04LPAR\x94K\x12\x8c\x05MARCH\x94K\x13\x8c\x03MAY\x94'
+ b'K\x14\x8c\x06MONDAY\x94K\x15\x8c\x04NAME\x94K\x16\x8c\x05NEVER\x94K\x17'
+ b'\x8c\x03NOT\x94K\x18\x8c\x08NOVEMBER\x94K\x19\x8c\x06NUMBER\x94K\x1a'
+ b'\x8c\x07OCTOBER\x94K\x1b\x8c\x02OR\x94K\x1c\x8c\x04RPAR\x94K\x1d\x8c\x08SA'
+ b'TURDAY\x94K\x1e\x8c\x06SECOND\x94K\x1f\x8c\tSEPTEMBER\x94K \x8c\x06SUND'
+ b'AY\x94K!\x8c\x02TH\x94K"\x8c\x05THIRD\x94K#\x8c\x08THURSDAY\x94K$\x8c'
+ b"\x04TRUE\x94K%\x8c\x07TUESDAY\x94K&\x8c\tWEDNESDAY\x94K'\x8c\x05WEEKS\x94K("
+ b'\x8c\x03_AS\x94K)\x8c\x05_ELSE\x94K*\x8c\x07_EXISTS\x94K+\x8c\x03_IF\x94'
+ b'K,\x8c\x03_IN\x94K-\x8c\x03_IS\x94K.\x8c\x05_LAST\x94K/\x8c\x04_MOD\x94K'
+ b'0\x8c\x03_OF\x94K1\x8c\x05_SAME\x94K2\x8c\x04_THE\x94K3\x8c\x05_YEAR\x94'
+ b'K4\x8c\rand_condition\x94K5\x8c\tcondition\x94K6\x8c\x08division\x94K7\x8c'
+ b'\x07literal\x94K8\x8c\x08lwd_rule\x94K9\x8c\x05month\x94K:\x8c\nmonth_ho'
+ b'ok\x94K;\x8c\x0boffset_rule\x94K<\x8c\x0cor_condition\x94K=\x8c\x07ordi'
+ b'nal\x94K>\x8c\x08owm_rule\x94K?\x8c\x0bpreposition\x94K@\x8c\trecur_r'
+ b'ef\x94KA\x8c\nrecurrence\x94KB\x8c\x14recurrence_condition\x94KCh\xa4K'
+ b'D\x8c\x10simple_condition\x94KE\x8c\x04unit\x94KF\x8c\x07wd_rule\x94KG\x8c'
+ b'\x07weekday\x94KH\x8c\x0cweekday_rule\x94KI\x8c\tycmp_cond\x94KJ\x8c\tydiv'
+ b'_cond\x94KK\x8c\x0eyear_condition\x94KL\x8c\x0eyear_predicate\x94u\x8c\x06s'
+ b'tates\x94}\x94(K\x00}\x94(K\x03K\x00K\x01\x86\x94K\x04K\x00K\x02'
+ b'\x86\x94K\x07K\x00K\x03\x86\x94K\tK\x00K\x04\x86\x94K\nK\x00K\x05'
+ b'\x86\x94K\x0bK\x00K\x06\x86\x94K\x0cK\x00K\x07\x86\x94K\rK\x00K\x08'
+ b'\x86\x94K\x0eK\x00K\t\x86\x94K\x0fK\x00K\n\x86\x94K\x11K\x00K\x0b'
+ b'\x86\x94K\x12K\x00K\x0c\x86\x94K\x13K\x00K\r\x86\x94K\x14K\x00K\x0e'
+ b'\x86\x94K\x15K\x00K\x0f\x86\x94K\x16K\x00K\x10\x86\x94K\x18K\x00K\x11'
+ b'\x86\x94K\x19K\x00K\x12\x86\x94K\x1aK\x00K\x13\x86\x94K\x1dK\x00K\x14'
+ b'\x86\x94K\x1eK\x00K\x15\x86\x94K\x1fK\x00K\x16\x86\x94K K\x00K\x17'
+ b'\x86\x94K!K\x00K\x18\x86\x94K"K\x00K\x19\x86\x94K#K\x00K\x1a\x86\x94K%'
+ b'K\x00K\x1b\x86\x94K&K\x00K\x1c\x86\x94K.K\x00K\x1d\x86\x94K2K\x00K\x1e'
+ b'\x86\x94K7K\x00K\x1f\x86\x94K8K\x00K \x86\x94K9K\x00K!\x86\x94K;K\x00K"'
+ b'\x86\x94K=K\x00K#\x86\x94K>K\x00K$\x86\x94KAK\x00K%\x86\x94KCK\x00K&'
+ b"\x86\x94KFK\x00K'\x86\x94KGK\x00K(\x86\x94KHK\x00K)\x86\x94uK\x01}\x94("
+ b'K\x00K\x01}\x94h\nK\\s\x86\x94K\x02K\x01}\x94h\nK\\s\x86\x94K\x17K\x01}\x94'
+ b'h\nK\\s\x86\x94K\x19K\x01}\x94h\nK\\s\x86\x94K\x1bK\x01}\x94h\nK\\s\x86'
+ b'\x94K\x1cK\x01}\x94h\nK\\s\x86\x94K)K\x01}\x94h\nK\\s\x86\x94K*K\x01}'
+ b'\x94h\nK\\s\x86\x94K+K\x01}\x94h\nK\\s\x86\x94K,K\x01}\x94h\nK\\s\x86\x94K-'
+ b'K\x01}\x94h\nK\\s\x86\x94uK\x02}\x94(K\x00K\x01}\x94h\nK`s\x86\x94K\x02'
+ b'K\x01}\x94h\nK`s\x86\x94K\x17K\x01}\x94h\nK`s\x86\x94K\x19K\x01}\x94h\n'
+ b'K`s\x86\x94K\x1bK\x01}\x94h\nK`s\x86\x94K\x1cK\x01}\x94h\nK`s\x86\x94K'
+ b')K\x01}\x94h\nK`s\x86\x94K*K\x01}\x94h\nK`s\x86\x94K+K\x01}\x94h\nK`s'
+ b'\x86\x94K,K\x01}\x94h\nK`s\x86\x94K-K\x01}\x94h\nK`s\x86\x94uK\x03}'
+ b'\x94(K\x00K\x01}\x94h\nKds\x86\x94K\x02K\x01}\x94h\nKds\x86\x94K\x17K\x01'
+ b'}\x94h\nKds\x86\x94K\x19K\x01}\x94h\nKds\x86\x94K\x1bK\x01}\x94h\nKd'
+ b's\x86\x94K\x1cK\x01}\x94h\nKds\x86\x94K)K\x01}\x94h\nKds\x86\x94K*K'
+ b'\x01}\x94h\nKds\x86\x94K+K\x01}\x94h\nKds\x86\x94K,K\x01}\x94h\nKds\x86\x94'
+ b'K-K\x01}\x94h\nKds\x86\x94uK\x04}\x94(K\x00K\x01}\x94h\nKZs\x86\x94'
+ b'K\x02K\x01}\x94h\nKZs\x86\x94K\x17K\x01}\x94h\nKZs\x86\x94K\x19K\x01}\x94'
+ b'h\nKZs\x86\x94K\x1bK\x01}\x94h\nKZs\x86\x94K\x1cK\x01}\x94h\nKZs\x86\x94K)K'
+ b'\x01}\x94h\nKZs\x86\x94K*K\x01}\x94h\nKZs\x86\x94K+K\x01}\x94h\nKZs\x86\x94'
+ b'K,K\x01}\x94h\nKZs\x86\x94K-K\x01}\x94h\nKZs\x86\x94uK\x05}\x94(K\x0cK\x01'
+ b'}\x94h\nK\x86s\x86\x94K\x14K\x01}\x94h\nK\x86s\x86\x94K\x1dK\x01}\x94'
+ b'h\nK\x86s\x86\x94K K\x01}\x94h\nK\x86s\x86\x94K#K\x01}\x94h\nK\x86s\x86'
+ b'\x94K%K\x01}\x94h\nK\x86s\x86\x94K&K\x01}\x94h\nK\x86s\x86\x94uK\x06}\x94'
+ b'(K\x0cK\x01}\x94h\nK\x89s\x86\x94K\x14K\x01}\x94h\nK\x89s\x86\x94K'
+ b'\x1dK\x01}\x94h\nK\x89s\x86\x94K K\x01}\x94h\nK\x89s\x86\x94K#K\x01}\x94h'
+ b'\nK\x89s\x86\x94K%K\x01}\x94h\nK\x89s\x86\x94K&K\x01}\x94h\nK\x89s\x86\x94'
+ b'uK\x07}\x94(K\x01K\x01}\x94h\nKVs\x86\x94K\x02K\x01}\x94h\nKVs\x86\x94'
+ b'K\x05K\x01}\x94h\nKVs\x86\x94K\x17K\x01}\x94h\nKVs\x86\x94K\x1bK\x01}\x94'
+ b'h\nKVs\x86\x94K)K\x01}\x94h\nKVs\x86\x94K0K\x01}\x94h\nKVs\x86\x94uK\x08'
+ b'}\x94(K\x00K\x01}\x94h\nKYs\x86\x94K\x02K\x01}\x94h\nKYs\x86\x94K\x17K'
+ b'\x01}\x94h\nKYs\x86\x94K\x19K\x01}\x94h\nKYs\x86\x94K\x1bK\x01}\x94h\nK'
+ b'Ys\x86\x94K\x1cK\x01}\x94h\nKYs\x86\x94K)K\x01}\x94h\nKYs\x86\x94K*'
+ b'K\x01}\x94h\nKYs\x86\x94K+K\x01}\x94h\nKYs\x86\x94K,K\x01}\x94h\nKYs\x86'
+ b'\x94K-K\x01}\x94h\nKYs\x86\x94uK\t}\x94(K\x00K\x01}\x94h\nK_s\x86\x94K\x02K'
+ b'\x01}\x94h\nK_s\x86\x94K\x17K\x01}\x94h\nK_s\x86\x94K\x19K\x01}\x94h\nK'
+ b'_s\x86\x94K\x1bK\x01}\x94h\nK_s\x86\x94K\x1cK\x01}\x94h\nK_s\x86\x94K)'
+ b'K\x01}\x94h\nK_s\x86\x94K*K\x01}\x94h\nK_s\x86\x94K+K\x01}\x94h\nK_s\x86'
+ b'\x94K,K\x01}\x94h\nK_s\x86\x94K-K\x01}\x94h\nK_s\x86\x94uK\n}\x94(K\x00K'
+ b'\x01}\x94h\nK^s\x86\x94K\x02K\x01}\x94h\nK^s\x86\x94K\x17K\x01}\x94h\nK'
+ b'^s\x86\x94K\x19K\x01}\x94h\nK^s\x86\x94K\x1bK\x01}\x94h\nK^s\x86\x94K\x1c'
+ b'K\x01}\x94h\nK^s\x86\x94K)K\x01}\x94h\nK^s\x86\x94K*K\x01}\x94h\nK^s\x86'
+ b'\x94K+K\x01}\x94h\nK^s\x86\x94K,K\x01}\x94h\nK^s\x86\x94K-K\x01}\x94h\nK'
+ b'^s\x86\x94uK\x0b}\x94(K\x03K\x00K\x01\x86\x94K\x04K\x00K\x02\x86\x94K\x07'
+ b'K\x00K\x03\x86\x94K\tK\x00K\x04\x86\x94K\nK\x00K\x05\x86\x94K\x0bK\x00K\x06'
+ b'\x86\x94K\x0cK\x00K\x07\x86\x94K\rK\x00K\x08\x86\x94K\x0eK\x00K\t'
+ b'\x86\x94K\x0fK\x00K\n\x86\x94K\x11K\x00K\x0b\x86\x94K\x12K\x00K\x0c'
+ b'\x86\x94K\x13K\x00K\r\x86\x94K\x14K\x00K\x0e\x86\x94K\x15K\x00K\x0f'
+ b'\x86\x94K\x16K\x00K\x10\x86\x94K\x18K\x00K\x11\x86\x94K\x19K\x00K\x12'
+ b'\x86\x94K\x1aK\x00K\x13\x86\x94K\x1dK\x00K\x14\x86\x94K\x1eK\x00K\x15'
+ b'\x86\x94K\x1fK\x00K\x16\x86\x94K K\x00K\x17\x86\x94K!K\x00K\x18\x86\x94K"'
+ b'K\x00K\x19\x86\x94K#K\x00K\x1a\x86\x94K%K\x00K\x1b\x86\x94K&K\x00K\x1c'
+ b'\x86\x94K.K\x00K\x1d\x86\x94K2K\x00K\x1e\x86\x94K7K\x00K\x1f\x86\x94K8'
+ b'K\x00K \x86\x94K9K\x00K!\x86\x94K;K\x00K"\x86\x94K=K\x00K#\x86\x94K>K\x00K$'
+ b"\x86\x94KAK\x00K%\x86\x94KCK\x00K*\x86\x94KFK\x00K'\x86\x94KGK\x00K("
+ b'\x86\x94KHK\x00K)\x86\x94uK\x0c}\x94(K\x00K\x01}\x94h\nK[s\x86\x94K\x02K'
+ b'\x01}\x94h\nK[s\x86\x94K\x17K\x01}\x94h\nK[s\x86\x94K\x19K\x01}\x94h\nK'
+ b'[s\x86\x94K\x1bK\x01}\x94h\nK[s\x86\x94K\x1cK\x01}\x94h\nK[s\x86\x94K)'
+ b'K\x01}\x94h\nK[s\x86\x94K*K\x01}\x94h\nK[s\x86\x94K+K\x01}\x94h\nK[s\x86'
+ b'\x94K,K\x01}\x94h\nK[s\x86\x94K-K\x01}\x94h\nK[s\x86\x94uK\r}\x94(K\x00K'
+ b'\x01}\x94h\nK]s\x86\x94K\x02K\x01}\x94h\nK]s\x86\x94K\x17K\x01}\x94h\nK'
+ b']s\x86\x94K\x19K\x01}\x94h\nK]s\x86\x94K\x1bK\x01}\x94h\nK]s\x86\x94K\x1c'
+ b'K\x01}\x94h\nK]s\x86\x94K)K\x01}\x94h\nK]s\x86\x94K*K\x01}\x94h\nK]s\x86'
+ b'\x94K+K\x01}\x94h\nK]s\x86\x94K,K\x01}\x94h\nK]s\x86\x94K-K\x01}\x94h\nK'
+ b']s\x86\x94uK\x0e}\x94(K\x01K\x01}\x94h\nKRs\x86\x94K\x02K\x01}\x94h\nK'
+ b'Rs\x86\x94K\x05K\x01}\x94h\nKRs\x86\x94K\x17K\x01}\x94h\nKRs\x86\x94K\x1b'
+ b'K\x01}\x94h\nKRs\x86\x94K)K\x01}\x94h\nKRs\x86\x94K0K\x01}\x94h\nKRs\x86'
+ b'\x94uK\x0f}\x94(K\x00K\x01}\x94h\nK;s\x86\x94K\x02K\x01}\x94h\nK;s\x86'
+ b'\x94K\x17K\x01}\x94h\nK;s\x86\x94K\x1bK\x01}\x94h\nK;s\x86\x94K\x1cK\x01}'
+ b'\x94h\nK;s\x86\x94K)K\x01}\x94h\nK;s\x86\x94K*K\x01}\x94h\nK;s\x86\x94K+'
+ b'K\x01}\x94h\nK;s\x86\x94K,K\x01}\x94h\nK;s\x86\x94K-K\x01}\x94h\nK;s\x86'
+ b'\x94uK\x10}\x94(K\x00K\x01}\x94h\nK:s\x86\x94K\x02K\x01}\x94h\nK:s\x86'
+ b'\x94K\x17K\x01}\x94h\nK:s\x86\x94K\x1bK\x01}\x94h\nK:s\x86\x94K\x1cK\x01}'
+ b'\x94h\nK:s\x86\x94K)K\x01}\x94h\nK:s\x86\x94K*K\x01}\x94h\nK:s\x86\x94K+'
+ b'K\x01}\x94h\nK:s\x86\x94K,K\x01}\x94h\nK:s\x86\x94K-K\x01}\x94h\nK:s\x86'
+ b'\x94uK\x11}\x94(K\x00K\x01}\x94h\nKcs\x86\x94K\x02K\x01}\x94h\nKcs\x86'
+ b'\x94K\x17K\x01}\x94h\nKcs\x86\x94K\x19K\x01}\x94h\nKcs\x86\x94K\x1bK\x01}'
+ b'\x94h\nKcs\x86\x94K\x1cK\x01}\x94h\nKcs\x86\x94K)K\x01}\x94h\nKcs\x86\x94K*'
+ b'K\x01}\x94h\nKcs\x86\x94K+K\x01}\x94h\nKcs\x86\x94K,K\x01}\x94h\nKcs\x86'
+ b"\x94K-K\x01}\x94h\nKcs\x86\x94uK\x12}\x94(K\x06K\x00K+\x86\x94K'K\x00"
+ b'K,\x86\x94KEK\x00K-\x86\x94uK\x13}\x94(K\x00K\x01}\x94h\nKbs\x86\x94K'
+ b'\x02K\x01}\x94h\nKbs\x86\x94K\x17K\x01}\x94h\nKbs\x86\x94K\x19K\x01}\x94h'
+ b'\nKbs\x86\x94K\x1bK\x01}\x94h\nKbs\x86\x94K\x1cK\x01}\x94h\nKbs\x86\x94'
+ b'K)K\x01}\x94h\nKbs\x86\x94K*K\x01}\x94h\nKbs\x86\x94K+K\x01}\x94h\nKb'
+ b's\x86\x94K,K\x01}\x94h\nKbs\x86\x94K-K\x01}\x94h\nKbs\x86\x94uK\x14}\x94(K'
+ b'\x01K\x01}\x94h\nKWs\x86\x94K\x02K\x01}\x94h\nKWs\x86\x94K\x05K\x01}\x94h'
+ b'\nKWs\x86\x94K\x17K\x01}\x94h\nKWs\x86\x94K\x1bK\x01}\x94h\nKWs\x86\x94'
+ b'K)K\x01}\x94h\nKWs\x86\x94K0K\x01}\x94h\nKWs\x86\x94uK\x15}\x94(K\x0cK\x01'
+ b'}\x94h\nK\x87s\x86\x94K\x14K\x01}\x94h\nK\x87s\x86\x94K\x1dK\x01}\x94'
+ b'h\nK\x87s\x86\x94K K\x01}\x94h\nK\x87s\x86\x94K#K\x01}\x94h\nK\x87s\x86'
+ b'\x94K%K\x01}\x94h\nK\x87s\x86\x94K&K\x01}\x94h\nK\x87s\x86\x94uK\x16}\x94'
+ b'(K\x00K\x01}\x94h\nKas\x86\x94K\x02K\x01}\x94h\nKas\x86\x94K\x17K\x01}'
+ b'\x94h\nKas\x86\x94K\x19K\x01}\x94h\nKas\x86\x94K\x1bK\x01}\x94h\nKas'
+ b'\x86\x94K\x1cK\x01}\x94h\nKas\x86\x94K)K\x01}\x94h\nKas\x86\x94K*K\x01'
+ b'}\x94h\nKas\x86\x94K+K\x01}\x94h\nKas\x86\x94K,K\x01}\x94h\nKas\x86\x94K'
+ b'-K\x01}\x94h\nKas\x86\x94uK\x17}\x94(K\x01K\x01}\x94h\nKXs\x86\x94K'
+ b'\x02K\x01}\x94h\nKXs\x86\x94K\x05K\x01}\x94h\nKXs\x86\x94K\x17K\x01}\x94h'
+ b'\nKXs\x86\x94K\x1bK\x01}\x94h\nKXs\x86\x94K)K\x01}\x94h\nKXs\x86\x94K0K\x01'
+ b'}\x94h\nKXs\x86\x94uK\x18}\x94(K\x0cK\x01}\x94h\nK\x8as\x86\x94K\x14K\x01'
+ b'}\x94h\nK\x8as\x86\x94K\x1dK\x01}\x94h\nK\x8as\x86\x94K K\x01}\x94h\nK\x8a'
+ b's\x86\x94K#K\x01}\x94h\nK\x8as\x86\x94K%K\x01}\x94h\nK\x8as\x86\x94K&K'
+ b'\x01}\x94h\nK\x8as\x86\x94uK\x19}\x94(K\x0cK\x01}\x94h\nK\x88s\x86'
+ b'\x94K\x14K\x01}\x94h\nK\x88s\x86\x94K\x1dK\x01}\x94h\nK\x88s\x86\x94K'
+ b' K\x01}\x94h\nK\x88s\x86\x94K#K\x01}\x94h\nK\x88s\x86\x94K%K\x01}\x94h'
+ b'\nK\x88s\x86\x94K&K\x01}\x94h\nK\x88s\x86\x94uK\x1a}\x94(K\x01K\x01}\x94h'
+ b'\nKUs\x86\x94K\x02K\x01}\x94h\nKUs\x86\x94K\x05K\x01}\x94h\nKUs\x86\x94'
+ b'K\x17K\x01}\x94h\nKUs\x86\x94K\x1bK\x01}\x94h\nKUs\x86\x94K)K\x01}\x94h\nKU'
+ b's\x86\x94K0K\x01}\x94h\nKUs\x86\x94uK\x1b}\x94(K\x01K\x01}\x94h\nKS'
+ b's\x86\x94K\x02K\x01}\x94h\nKSs\x86\x94K\x05K\x01}\x94h\nKSs\x86\x94K\x17K'
+ b'\x01}\x94h\nKSs\x86\x94K\x1bK\x01}\x94h\nKSs\x86\x94K)K\x01}\x94h\nK'
+ b'Ss\x86\x94K0K\x01}\x94h\nKSs\x86\x94uK\x1c}\x94(K\x01K\x01}\x94h\nK'
+ b'Ts\x86\x94K\x02K\x01}\x94h\nKTs\x86\x94K\x05K\x01}\x94h\nKTs\x86\x94K\x17'
+ b'K\x01}\x94h\nKTs\x86\x94K\x1bK\x01}\x94h\nKTs\x86\x94K)K\x01}\x94h\nKTs\x86'
+ b'\x94K0K\x01}\x94h\nKTs\x86\x94uK\x1d}\x94(K\x0cK\x00K\x07\x86\x94K\x14K\x00'
+ b'K\x0e\x86\x94K\x1dK\x00K\x14\x86\x94K K\x00K\x17\x86\x94K#K\x00'
+ b'K\x1a\x86\x94K%K\x00K\x1b\x86\x94K&K\x00K\x1c\x86\x94KGK\x00K.\x86\x94'
+ b'uK\x1e}\x94(K\nK\x00K\x05\x86\x94K\x0bK\x00K\x06\x86\x94K\x0cK\x00K\x07'
+ b'\x86\x94K\x14K\x00K\x0e\x86\x94K\x1dK\x00K\x14\x86\x94K\x1eK\x00K\x15'
+ b'\x86\x94K K\x00K\x17\x86\x94K!K\x00K\x18\x86\x94K"K\x00K\x19\x86\x94K#'
+ b'K\x00K\x1a\x86\x94K%K\x00K\x1b\x86\x94K&K\x00K\x1c\x86\x94K.K\x00K/'
+ b'\x86\x94K=K\x00K0\x86\x94KGK\x00K1\x86\x94uK\x1f}\x94(K\x00K\x01}\x94h\n'
+ b'K9s\x86\x94K\x02K\x01}\x94h\nK9s\x86\x94K\x17K\x01}\x94h\nK9s\x86\x94K'
+ b'\x1bK\x01}\x94h\nK9s\x86\x94K\x1cK\x01}\x94h\nK9s\x86\x94K)K\x01}\x94h\nK9s'
+ b'\x86\x94K*K\x01}\x94h\nK9s\x86\x94K+K\x01}\x94h\nK9s\x86\x94K,K\x01}\x94h\n'
+ b'K9s\x86\x94K-K\x01}\x94h\nK9s\x86\x94uK }\x94(K\x00K\x01}\x94h\nK?s\x86'
+ b'\x94K\x02K\x01}\x94h\nK?s\x86\x94K\x17K\x01}\x94h\nK?s\x86\x94K\x1bK\x01}'
+ b'\x94h\nK?s\x86\x94K\x1cK\x01}\x94h\nK?s\x86\x94K)K\x01}\x94h\nK?s\x86\x94K*'
+ b'K\x01}\x94h\nK?s\x86\x94K+K\x01}\x94h\nK?s\x86\x94K,K\x01}\x94h\nK?s\x86'
+ b'\x94K-K\x01}\x94h\nK?s\x86\x94uK!}\x94K\x19K\x00K2\x86\x94sK"}\x94(K\x00K'
+ b'\x01}\x94h\nK6s\x86\x94K\x02K\x01}\x94h\nK6s\x86\x94K\x17K\x01}\x94h\nK'
+ b'6s\x86\x94K\x1bK\x01}\x94h\nK6s\x86\x94K\x1cK\x01}\x94h\nK6s\x86\x94K)'
+ b'K\x01}\x94h\nK6s\x86\x94K*K\x01}\x94h\nK6s\x86\x94K+K\x01}\x94h\nK6s\x86'
+ b'\x94K,K\x01}\x94h\nK6s\x86\x94K-K\x01}\x94h\nK6s\x86\x94uK#}\x94(K\x0cK'
+ b'\x00K\x07\x86\x94K\x14K\x00K\x0e\x86\x94K\x1dK\x00K\x14\x86\x94K K'
+ b'\x00K\x17\x86\x94K#K\x00K\x1a\x86\x94K%K\x00K\x1b\x86\x94K&K\x00K\x1c\x86'
+ b'\x94KGK\x00K3\x86\x94uK$}\x94(K\x00K\x01}\x94h\nK=s\x86\x94K\x02K\x01'
+ b'}\x94h\nK=s\x86\x94K\x17K\x01}\x94h\nK=s\x86\x94K\x1bK\x01}\x94h\nK='
+ b's\x86\x94K\x1cK\x01}\x94h\nK=s\x86\x94K)K\x01}\x94h\nK=s\x86\x94K*K'
+ b'\x01}\x94h\nK=s\x86\x94K+K\x01}\x94h\nK=s\x86\x94K,K\x01}\x94h\nK=s\x86\x94'
+ b'K-K\x01}\x94h\nK=s\x86\x94uK%}\x94(K\x00K\x01}\x94h\nK5s\x86\x94K\x1cK\x01'
+ b"}\x94h\nK5s\x86\x94K+K\x00K4\x86\x94uK&}\x94K'}\x94(K\x00K\x01}\x94h\nK"
+ b'>s\x86\x94K\x02K\x01}\x94h\nK>s\x86\x94K\x17K\x01}\x94h\nK>s\x86\x94K\x1b'
+ b'K\x01}\x94h\nK>s\x86\x94K\x1cK\x01}\x94h\nK>s\x86\x94K)K\x01}\x94h\nK>s\x86'
+ b'\x94K*K\x01}\x94h\nK>s\x86\x94K+K\x01}\x94h\nK>s\x86\x94K,K\x01}\x94h\nK'
+ b'>s\x86\x94K-K\x01}\x94h\nK>s\x86\x94uK(}\x94(K\x01K\x00K5\x86\x94K'
+ b'\x05K\x00K6\x86\x94K\x17K\x00K7\x86\x94K?K\x00K8\x86\x94uK)}\x94(K\x00K'
+ b'\x01}\x94h\nK7s\x86\x94K\x02K\x01}\x94h\nK7s\x86\x94K\x17K\x01}\x94h\nK'
+ b'7s\x86\x94K\x1bK\x01}\x94h\nK7s\x86\x94K\x1cK\x01}\x94h\nK7s\x86\x94K)'
+ b'K\x01}\x94h\nK7s\x86\x94K*K\x01}\x94h\nK7s\x86\x94K+K\x01}\x94h\nK7s\x86'
+ b'\x94K,K\x01}\x94h\nK7s\x86\x94K-K\x01}\x94h\nK7s\x86\x94uK*}\x94K\x1cK\x00'
+ b'K9\x86\x94sK+}\x94(K\x01K\x01}\x94h\nKOs\x86\x94K\x05K\x01}\x94h\nK'
+ b'Os\x86\x94uK,}\x94(K\x01K\x01}\x94h\nKPs\x86\x94K\x05K\x01}\x94h\nK'
+ b'Ps\x86\x94uK-}\x94(K\x01K\x00K5\x86\x94K\x05K\x00K6\x86\x94K?K\x00K:'
+ b'\x86\x94uK.}\x94(K0K\x00K;\x86\x94K:K\x00K<\x86\x94uK/}\x94(K\x0cK\x00K\x07'
+ b'\x86\x94K\x14K\x00K\x0e\x86\x94K\x1dK\x00K\x14\x86\x94K K\x00K\x17'
+ b'\x86\x94K#K\x00K\x1a\x86\x94K%K\x00K\x1b\x86\x94K&K\x00K\x1c\x86\x94KG'
+ b'K\x00K=\x86\x94uK0}\x94(K\x0cK\x00K\x07\x86\x94K\x14K\x00K\x0e\x86\x94'
+ b'K\x1dK\x00K\x14\x86\x94K K\x00K\x17\x86\x94K#K\x00K\x1a\x86\x94K%K\x00'
+ b'K\x1b\x86\x94K&K\x00K\x1c\x86\x94KGK\x00K>\x86\x94uK1}\x94(K\x01K\x00K5'
+ b'\x86\x94K\x05K\x00K6\x86\x94K\x17K\x00K?\x86\x94K?K\x00K@\x86\x94uK2}\x94('
+ b'K\x00K\x01}\x94h\nKQs\x86\x94K\x02K\x01}\x94h\nKQs\x86\x94K\x17K\x01}\x94'
+ b'h\nKQs\x86\x94K\x1bK\x01}\x94h\nKQs\x86\x94K\x1cK\x01}\x94h\nKQs\x86\x94K)K'
+ b'\x01}\x94h\nKQs\x86\x94K*K\x01}\x94h\nKQs\x86\x94K+K\x01}\x94h\nKQs\x86\x94'
+ b'K,K\x01}\x94h\nKQs\x86\x94K-K\x01}\x94h\nKQs\x86\x94uK3}\x94(K\x01K\x00'
+ b'K5\x86\x94K\x05K\x00K6\x86\x94K\x17K\x00KA\x86\x94K0K\x00K;\x86\x94K:K\x00'
+ b'KB\x86\x94K?K\x00KC\x86\x94uK4}\x94(K\x03K\x00K\x01\x86\x94K\x04K\x00K\x02'
+ b'\x86\x94K\x07K\x00K\x03\x86\x94K\x08K\x00KD\x86\x94K\tK\x00K\x04\x86\x94K\n'
+ b'K\x00K\x05\x86\x94K\x0bK\x00K\x06\x86\x94K\x0cK\x00K\x07\x86\x94K\r'
+ b'K\x00K\x08\x86\x94K\x0eK\x00K\t\x86\x94K\x0fK\x00K\n\x86\x94K\x11K\x00K\x0b'
+ b'\x86\x94K\x12K\x00K\x0c\x86\x94K\x13K\x00K\r\x86\x94K\x14K\x00K\x0e'
+ b'\x86\x94K\x15K\x00K\x0f\x86\x94K\x16K\x00K\x10\x86\x94K\x18K\x00K\x11'
+ b'\x86\x94K\x19K\x00K\x12\x86\x94K\x1aK\x00K\x13\x86\x94K\x1dK\x00K\x14'
+ b'\x86\x94K\x1eK\x00K\x15\x86\x94K\x1fK\x00K\x16\x86\x94K K\x00K\x17'
+ b'\x86\x94K!K\x00K\x18\x86\x94K"K\x00K\x19\x86\x94K#K\x00K\x1a\x86\x94K$'
+ b'K\x00KE\x86\x94K%K\x00K\x1b\x86\x94K&K\x00K\x1c\x86\x94K.K\x00K\x1d'
+ b'\x86\x94K2K\x00K\x1e\x86\x94K3K\x00KF\x86\x94K4K\x00KG\x86\x94K5K\x00KH'
+ b'\x86\x94K7K\x00K\x1f\x86\x94K8K\x00K \x86\x94K9K\x00K!\x86\x94K;K\x00K"'
+ b'\x86\x94K<K\x00KI\x86\x94K=K\x00K#\x86\x94K>K\x00K$\x86\x94K@K\x00KJ'
+ b"\x86\x94KAK\x00KK\x86\x94KBK\x00KL\x86\x94KDK\x00KM\x86\x94KFK\x00K'"
+ b'\x86\x94KGK\x00K(\x86\x94KHK\x00K)\x86\x94KKK\x00KN\x86\x94uK5}\x94('
+ b'K\x03K\x01}\x94h\nKNs\x86\x94K\x04K\x01}\x94h\nKNs\x86\x94K\x07K\x01}\x94'
+ b'h\nKNs\x86\x94K\tK\x01}\x94h\nKNs\x86\x94K\nK\x01}\x94h\nKNs\x86\x94K\x0bK'
+ b'\x01}\x94h\nKNs\x86\x94K\x0cK\x01}\x94h\nKNs\x86\x94K\rK\x01}\x94h\nK'
+ b'Ns\x86\x94K\x0eK\x01}\x94h\nKNs\x86\x94K\x0fK\x01}\x94h\nKNs\x86\x94K\x11'
+ b'K\x01}\x94h\nKNs\x86\x94K\x12K\x01}\x94h\nKNs\x86\x94K\x13K\x01}\x94h\n'
+ b'KNs\x86\x94K\x14K\x01}\x94h\nKNs\x86\x94K\x15K\x01}\x94h\nKNs\x86\x94K'
+ b'\x16K\x01}\x94h\nKNs\x86\x94K\x18K\x01}\x94h\nKNs\x86\x94K\x19K\x01}\x94h'
+ b'\nKNs\x86\x94K\x1aK\x01}\x94h\nKNs\x86\x94K\x1dK\x01}\x94h\nKNs\x86\x94'
+ b'K\x1eK\x01}\x94h\nKNs\x86\x94K\x1fK\x01}\x94h\nKNs\x86\x94K K\x01}\x94h\nKN'
+ b's\x86\x94K!K\x01}\x94h\nKNs\x86\x94K"K\x01}\x94h\nKNs\x86\x94K#K\x01}\x94h'
+ b'\nKNs\x86\x94K%K\x01}\x94h\nKNs\x86\x94K&K\x01}\x94h\nKNs\x86\x94K.K\x01'
+ b'}\x94h\nKNs\x86\x94K2K\x01}\x94h\nKNs\x86\x94uK6}\x94(K\x03K\x01}\x94h\n'
+ b'KMs\x86\x94K\x04K\x01}\x94h\nKMs\x86\x94K\x07K\x01}\x94h\nKMs\x86\x94K'
+ b'\tK\x01}\x94h\nKMs\x86\x94K\nK\x01}\x94h\nKMs\x86\x94K\x0bK\x01}\x94h\nKMs'
+ b'\x86\x94K\x0cK\x01}\x94h\nKMs\x86\x94K\rK\x01}\x94h\nKMs\x86\x94K\x0eK\x01'
+ b'}\x94h\nKMs\x86\x94K\x0fK\x01}\x94h\nKMs\x86\x94K\x11K\x01}\x94h\nKM'
+ b's\x86\x94K\x12K\x01}\x94h\nKMs\x86\x94K\x13K\x01}\x94h\nKMs\x86\x94K\x14K'
+ b'\x01}\x94h\nKMs\x86\x94K\x15K\x01}\x94h\nKMs\x86\x94K\x16K\x01}\x94h\nK'
+ b'Ms\x86\x94K\x18K\x01}\x94h\nKMs\x86\x94K\x19K\x01}\x94h\nKMs\x86\x94K\x1a'
+ b'K\x01}\x94h\nKMs\x86\x94K\x1dK\x01}\x94h\nKMs\x86\x94K\x1eK\x01}\x94h\n'
+ b'KMs\x86\x94K\x1fK\x01}\x94h\nKMs\x86\x94K K\x01}\x94h\nKMs\x86\x94K!K\x01}'
+ b'\x94h\nKMs\x86\x94K"K\x01}\x94h\nKMs\x86\x94K#K\x01}\x94h\nKMs\x86\x94K%'
+ b'K\x01}\x94h\nKMs\x86\x94K&K\x01}\x94h\nKMs\x86\x94K.K\x01}\x94h\nKMs\x86'
+ b'\x94K2K\x01}\x94h\nKMs\x86\x94uK7}\x94(K\x01K\x00K5\x86\x94K\x05K\x00'
+ b'K6\x86\x94K?K\x00KO\x86\x94uK8}\x94(K\x03K\x00K\x01\x86\x94K\x04K\x00K\x02'
+ b'\x86\x94K\x07K\x00K\x03\x86\x94K\tK\x00K\x04\x86\x94K\nK\x00K\x05'
+ b'\x86\x94K\x0bK\x00K\x06\x86\x94K\x0cK\x00K\x07\x86\x94K\rK\x00K\x08'
+ b'\x86\x94K\x0eK\x00K\t\x86\x94K\x0fK\x00K\n\x86\x94K\x11K\x00K\x0b'
+ b'\x86\x94K\x12K\x00K\x0c\x86\x94K\x13K\x00K\r\x86\x94K\x14K\x00K\x0e'
+ b'\x86\x94K\x15K\x00K\x0f\x86\x94K\x16K\x00K\x10\x86\x94K\x18K\x00K\x11'
+ b'\x86\x94K\x19K\x00K\x12\x86\x94K\x1aK\x00K\x13\x86\x94K\x1dK\x00K\x14'
+ b'\x86\x94K\x1eK\x00K\x15\x86\x94K\x1fK\x00K\x16\x86\x94K K\x00K\x17'
+ b'\x86\x94K!K\x00K\x18\x86\x94K"K\x00K\x19\x86\x94K#K\x00K\x1a\x86\x94K%'
+ b'K\x00K\x1b\x86\x94K&K\x00K\x1c\x86\x94K.K\x00K\x1d\x86\x94K2K\x00K\x1e'
+ b'\x86\x94K7K\x00K\x1f\x86\x94K8K\x00K \x86\x94K9K\x00K!\x86\x94K;K\x00K"'
+ b"\x86\x94K=K\x00K#\x86\x94K>K\x00K$\x86\x94KAK\x00KP\x86\x94KFK\x00K'"
+ b'\x86\x94KGK\x00K(\x86\x94KHK\x00K)\x86\x94uK9}\x94(K\x00K\x01}\x94h\n'
+ b'K8s\x86\x94K\x02K\x01}\x94h\nK8s\x86\x94K\x17K\x01}\x94h\nK8s\x86\x94K'
+ b'\x1bK\x01}\x94h\nK8s\x86\x94K\x1cK\x01}\x94h\nK8s\x86\x94K)K\x01}\x94h\nK8s'
+ b'\x86\x94K*K\x01}\x94h\nK8s\x86\x94K+K\x01}\x94h\nK8s\x86\x94K,K\x01}\x94h\n'
+ b'K8s\x86\x94K-K\x01}\x94h\nK8s\x86\x94uK:}\x94(K\x03K\x00K\x01\x86\x94'
+ b'K\x04K\x00K\x02\x86\x94K\x07K\x00K\x03\x86\x94K\tK\x00K\x04\x86\x94K\nK\x00'
+ b'K\x05\x86\x94K\x0bK\x00K\x06\x86\x94K\x0cK\x00K\x07\x86\x94K\rK\x00'
+ b'K\x08\x86\x94K\x0eK\x00K\t\x86\x94K\x0fK\x00K\n\x86\x94K\x11K\x00'
+ b'K\x0b\x86\x94K\x12K\x00K\x0c\x86\x94K\x13K\x00K\r\x86\x94K\x14K\x00'
+ b'K\x0e\x86\x94K\x15K\x00K\x0f\x86\x94K\x16K\x00K\x10\x86\x94K\x18K\x00'
+ b'K\x11\x86\x94K\x19K\x00K\x12\x86\x94K\x1aK\x00K\x13\x86\x94K\x1dK\x00'
+ b'K\x14\x86\x94K\x1eK\x00K\x15\x86\x94K\x1fK\x00K\x16\x86\x94K K\x00'
+ b'K\x17\x86\x94K!K\x00K\x18\x86\x94K"K\x00K\x19\x86\x94K#K\x00K\x1a\x86\x94'
+ b'K%K\x00K\x1b\x86\x94K&K\x00K\x1c\x86\x94K.K\x00K\x1d\x86\x94K2K\x00'
+ b'K\x1e\x86\x94K7K\x00K\x1f\x86\x94K8K\x00K \x86\x94K9K\x00K!\x86\x94K;K\x00'
+ b'K"\x86\x94K=K\x00K#\x86\x94K>K\x00K$\x86\x94KAK\x00KQ\x86\x94KFK\x00'
+ b"K'\x86\x94KGK\x00K(\x86\x94KHK\x00K)\x86\x94uK;}\x94(K\x03K\x00K\x01"
+ b'\x86\x94K\x04K\x00K\x02\x86\x94K\x07K\x00K\x03\x86\x94K\tK\x00K\x04'
+ b'\x86\x94K\rK\x00K\x08\x86\x94K\x0eK\x00K\t\x86\x94K\x0fK\x00K\n'
+ b'\x86\x94K\x12K\x00K\x0c\x86\x94K\x13K\x00K\r\x86\x94K\x18K\x00K\x11'
+ b'\x86\x94K\x1aK\x00K\x13\x86\x94K\x1fK\x00K\x16\x86\x94K9K\x00KR\x86\x94uK'
+ b'<}\x94(K\x00K\x01}\x94h\nKKs\x86\x94K\x02K\x01}\x94h\nKKs\x86\x94K\x17'
+ b'K\x01}\x94h\nKKs\x86\x94K\x1bK\x01}\x94h\nKKs\x86\x94K\x1cK\x01}\x94h\n'
+ b'KKs\x86\x94K)K\x01}\x94h\nKKs\x86\x94K*K\x01}\x94h\nKKs\x86\x94K+K\x01}'
+ b'\x94h\nKKs\x86\x94K,K\x01}\x94h\nKKs\x86\x94K-K\x01}\x94h\nKKs\x86\x94uK'
+ b'=}\x94(K0K\x00K;\x86\x94K:K\x00KS\x86\x94uK>}\x94(K\x01K\x00K5\x86\x94K\x05'
+ b'K\x00K6\x86\x94K\x17K\x00KT\x86\x94K0K\x00K;\x86\x94K:K\x00KU\x86\x94K?'
+ b'K\x00KV\x86\x94uK?}\x94(K\x01K\x00K5\x86\x94K\x05K\x00K6\x86\x94K?K\x00'
+ b'KW\x86\x94uK@}\x94(K\x03K\x00K\x01\x86\x94K\x04K\x00K\x02\x86\x94K\x07'
+ b'K\x00K\x03\x86\x94K\tK\x00K\x04\x86\x94K\nK\x00K\x05\x86\x94K\x0bK\x00K\x06'
+ b'\x86\x94K\x0cK\x00K\x07\x86\x94K\rK\x00K\x08\x86\x94K\x0eK\x00K\t'
+ b'\x86\x94K\x0fK\x00K\n\x86\x94K\x11K\x00K\x0b\x86\x94K\x12K\x00K\x0c'
+ b'\x86\x94K\x13K\x00K\r\x86\x94K\x14K\x00K\x0e\x86\x94K\x15K\x00K\x0f'
+ b'\x86\x94K\x16K\x00K\x10\x86\x94K\x18K\x00K\x11\x86\x94K\x19K\x00K\x12'
+ b'\x86\x94K\x1aK\x00K\x13\x86\x94K\x1dK\x00K\x14\x86\x94K\x1eK\x00K\x15'
+ b'\x86\x94K\x1fK\x00K\x16\x86\x94K K\x00K\x17\x86\x94K!K\x00K\x18\x86\x94K"'
+ b'K\x00K\x19\x86\x94K#K\x00K\x1a\x86\x94K%K\x00K\x1b\x86\x94K&K\x00K\x1c'
+ b'\x86\x94K.K\x00K\x1d\x86\x94K2K\x00K\x1e\x86\x94K7K\x00K\x1f\x86\x94K8'
+ b'K\x00K \x86\x94K9K\x00K!\x86\x94K;K\x00K"\x86\x94K=K\x00K#\x86\x94K>K\x00K$'
+ b"\x86\x94KAK\x00KX\x86\x94KFK\x00K'\x86\x94KGK\x00K(\x86\x94KHK\x00K)"
+ b'\x86\x94uKA}\x94(K\x01K\x00K5\x86\x94K\x05K\x00K6\x86\x94K?K\x00KY\x86\x94'
+ b'uKB}\x94(K\x00K\x01}\x94h\nKIs\x86\x94K\x02K\x01}\x94h\nKIs\x86\x94'
+ b'K\x17K\x01}\x94h\nKIs\x86\x94K\x1bK\x01}\x94h\nKIs\x86\x94K\x1cK\x01}\x94'
+ b'h\nKIs\x86\x94K)K\x01}\x94h\nKIs\x86\x94K*K\x01}\x94h\nKIs\x86\x94K+K'
+ b'\x01}\x94h\nKIs\x86\x94K,K\x01}\x94h\nKIs\x86\x94K-K\x01}\x94h\nKIs\x86\x94'
+ b'uKC}\x94(K\x03K\x00K\x01\x86\x94K\x04K\x00K\x02\x86\x94K\x07K\x00K\x03'
+ b'\x86\x94K\tK\x00K\x04\x86\x94K\nK\x00K\x05\x86\x94K\x0bK\x00K\x06'
+ b'\x86\x94K\x0cK\x00K\x07\x86\x94K\rK\x00K\x08\x86\x94K\x0eK\x00K\t'
+ b'\x86\x94K\x0fK\x00K\n\x86\x94K\x11K\x00K\x0b\x86\x94K\x12K\x00K\x0c'
+ b'\x86\x94K\x13K\x00K\r\x86\x94K\x14K\x00K\x0e\x86\x94K\x15K\x00K\x0f'
+ b'\x86\x94K\x16K\x00K\x10\x86\x94K\x18K\x00K\x11\x86\x94K\x19K\x00K\x12'
+ b'\x86\x94K\x1aK\x00K\x13\x86\x94K\x1dK\x00K\x14\x86\x94K\x1eK\x00K\x15'
+ b'\x86\x94K\x1fK\x00K\x16\x86\x94K K\x00K\x17\x86\x94K!K\x00K\x18\x86\x94K"'
+ b'K\x00K\x19\x86\x94K#K\x00K\x1a\x86\x94K%K\x00K\x1b\x86\x94K&K\x00K\x1c'
+ b'\x86\x94K.K\x00K\x1d\x86\x94K2K\x00K\x1e\x86\x94K7K\x00K\x1f\x86\x94K8'
+ b'K\x00K \x86\x94K9K\x00K!\x86\x94K;K\x00K"\x86\x94K=K\x00K#\x86\x94K>K\x00K$'
+ b"\x86\x94KAK\x00KZ\x86\x94KFK\x00K'\x86\x94KGK\x00K(\x86\x94KHK\x00K)"
+ b'\x86\x94uKD}\x94(K\x02K\x01}\x94h\nKms\x86\x94K\x1bK\x01}\x94h\nKms'
+ b'\x86\x94K)K\x01}\x94h\nKms\x86\x94uKE}\x94(K\x02K\x01}\x94h\nKls'
+ b'\x86\x94K\x1bK\x01}\x94h\nKls\x86\x94K)K\x01}\x94h\nKls\x86\x94uKF}'
+ b'\x94(K\x01K\x00K5\x86\x94K\x05K\x00K6\x86\x94K\x17K\x00K[\x86\x94K-K\x00K\\'
+ b'\x86\x94K?K\x00K]\x86\x94KIK\x00K^\x86\x94KJK\x00K_\x86\x94KLK\x00K`'
+ b'\x86\x94uKG}\x94(K\x1bK\x00Ka\x86\x94K)K\x01}\x94h\nKgs\x86\x94uKH}\x94K)'
+ b'K\x00Kb\x86\x94sKI}\x94K)K\x01}\x94h\nKes\x86\x94sKJ}\x94(K\x17K\x00Kc'
+ b'\x86\x94K*K\x00Kd\x86\x94K,K\x00Ke\x86\x94K-K\x00Kf\x86\x94uKK}\x94('
+ b'K\x02K\x01}\x94h\nKys\x86\x94K\x17K\x01}\x94h\nKys\x86\x94K\x1bK\x01}\x94'
+ b'h\nKys\x86\x94K)K\x01}\x94h\nKys\x86\x94K*K\x01}\x94h\nKys\x86\x94K,K'
+ b'\x01}\x94h\nKys\x86\x94K-K\x01}\x94h\nKys\x86\x94uKL}\x94(K\x02K\x01}\x94h'
+ b'\nKjs\x86\x94K\x1bK\x01}\x94h\nKjs\x86\x94K)K\x01}\x94h\nKjs\x86\x94uKM}'
+ b'\x94(K\x02K\x00Kg\x86\x94K\x1bK\x01}\x94h\nKis\x86\x94K)K\x01}\x94h\nK'
+ b'is\x86\x94uKN}\x94(K\x02K\x01}\x94h\nKks\x86\x94K\x1bK\x01}\x94h\nK'
+ b'ks\x86\x94K)K\x01}\x94h\nKks\x86\x94uKO}\x94(K\x03K\x00K\x01\x86\x94K'
+ b'\x04K\x00K\x02\x86\x94K\x07K\x00K\x03\x86\x94K\tK\x00K\x04\x86\x94K\nK\x00K'
+ b'\x05\x86\x94K\x0bK\x00K\x06\x86\x94K\x0cK\x00K\x07\x86\x94K\rK\x00K'
+ b'\x08\x86\x94K\x0eK\x00K\t\x86\x94K\x0fK\x00K\n\x86\x94K\x11K\x00K'
+ b'\x0b\x86\x94K\x12K\x00K\x0c\x86\x94K\x13K\x00K\r\x86\x94K\x14K\x00K'
+ b'\x0e\x86\x94K\x15K\x00K\x0f\x86\x94K\x16K\x00K\x10\x86\x94K\x18K\x00K'
+ b'\x11\x86\x94K\x19K\x00K\x12\x86\x94K\x1aK\x00K\x13\x86\x94K\x1dK\x00K'
+ b'\x14\x86\x94K\x1eK\x00K\x15\x86\x94K\x1fK\x00K\x16\x86\x94K K\x00K'
+ b'\x17\x86\x94K!K\x00K\x18\x86\x94K"K\x00K\x19\x86\x94K#K\x00K\x1a\x86\x94K'
+ b'%K\x00K\x1b\x86\x94K&K\x00K\x1c\x86\x94K.K\x00K\x1d\x86\x94K2K\x00K'
+ b'\x1e\x86\x94K7K\x00K\x1f\x86\x94K8K\x00K \x86\x94K9K\x00K!\x86\x94K;K\x00K'
+ b'"\x86\x94K=K\x00K#\x86\x94K>K\x00K$\x86\x94KAK\x00Kh\x86\x94KFK\x00K'
+ b"'\x86\x94KGK\x00K(\x86\x94KHK\x00K)\x86\x94uKP}\x94(K\x00K\x01}\x94h\nKGs"
+ b'\x86\x94K\x02K\x01}\x94h\nKGs\x86\x94K\x17K\x01}\x94h\nKGs\x86\x94'
+ b'K\x1bK\x01}\x94h\nKGs\x86\x94K\x1cK\x01}\x94h\nKGs\x86\x94K)K\x01}\x94h\nKG'
+ b's\x86\x94K*K\x01}\x94h\nKGs\x86\x94K+K\x01}\x94h\nKGs\x86\x94K,K\x01}\x94h'
+ b'\nKGs\x86\x94K-K\x01}\x94h\nKGs\x86\x94uKQ}\x94(K\x00K\x01}\x94h\nK<s'
+ b'\x86\x94K\x02K\x01}\x94h\nK<s\x86\x94K\x17K\x01}\x94h\nK<s\x86\x94'
+ b'K\x1bK\x01}\x94h\nK<s\x86\x94K\x1cK\x01}\x94h\nK<s\x86\x94K)K\x01}\x94h\nK<'
+ b's\x86\x94K*K\x01}\x94h\nK<s\x86\x94K+K\x01}\x94h\nK<s\x86\x94K,K\x01}\x94h'
+ b'\nK<s\x86\x94K-K\x01}\x94h\nK<s\x86\x94uKR}\x94(K\x00K\x01}\x94h\nKLs'
+ b'\x86\x94K\x02K\x01}\x94h\nKLs\x86\x94K\x17K\x01}\x94h\nKLs\x86\x94'
+ b'K\x1bK\x01}\x94h\nKLs\x86\x94K\x1cK\x01}\x94h\nKLs\x86\x94K)K\x01}\x94h\nKL'
+ b's\x86\x94K*K\x01}\x94h\nKLs\x86\x94K+K\x01}\x94h\nKLs\x86\x94K,K\x01}\x94h'
+ b'\nKLs\x86\x94K-K\x01}\x94h\nKLs\x86\x94uKS}\x94(K\x00K\x01}\x94h\nKJs'
+ b'\x86\x94K\x02K\x01}\x94h\nKJs\x86\x94K\x17K\x01}\x94h\nKJs\x86\x94'
+ b'K\x1bK\x01}\x94h\nKJs\x86\x94K\x1cK\x01}\x94h\nKJs\x86\x94K)K\x01}\x94h\nKJ'
+ b's\x86\x94K*K\x01}\x94h\nKJs\x86\x94K+K\x01}\x94h\nKJs\x86\x94K,K\x01}\x94h'
+ b'\nKJs\x86\x94K-K\x01}\x94h\nKJs\x86\x94uKT}\x94(K\x01K\x00K5\x86\x94K\x05K'
+ b'\x00K6\x86\x94K?K\x00Ki\x86\x94uKU}\x94(K\x00K\x01}\x94h\nKHs\x86\x94'
+ b'K\x02K\x01}\x94h\nKHs\x86\x94K\x17K\x01}\x94h\nKHs\x86\x94K\x1bK\x01}\x94'
+ b'h\nKHs\x86\x94K\x1cK\x01}\x94h\nKHs\x86\x94K)K\x01}\x94h\nKHs\x86\x94K*K'
+ b'\x01}\x94h\nKHs\x86\x94K+K\x01}\x94h\nKHs\x86\x94K,K\x01}\x94h\nKHs\x86\x94'
+ b'K-K\x01}\x94h\nKHs\x86\x94uKV}\x94(K\x03K\x00K\x01\x86\x94K\x04K\x00K'
+ b'\x02\x86\x94K\x07K\x00K\x03\x86\x94K\tK\x00K\x04\x86\x94K\nK\x00K'
+ b'\x05\x86\x94K\x0bK\x00K\x06\x86\x94K\x0cK\x00K\x07\x86\x94K\rK\x00K'
+ b'\x08\x86\x94K\x0eK\x00K\t\x86\x94K\x0fK\x00K\n\x86\x94K\x11K\x00K'
+ b'\x0b\x86\x94K\x12K\x00K\x0c\x86\x94K\x13K\x00K\r\x86\x94K\x14K\x00K'
+ b'\x0e\x86\x94K\x15K\x00K\x0f\x86\x94K\x16K\x00K\x10\x86\x94K\x18K\x00K'
+ b'\x11\x86\x94K\x19K\x00K\x12\x86\x94K\x1aK\x00K\x13\x86\x94K\x1dK\x00K'
+ b'\x14\x86\x94K\x1eK\x00K\x15\x86\x94K\x1fK\x00K\x16\x86\x94K K\x00K'
+ b'\x17\x86\x94K!K\x00K\x18\x86\x94K"K\x00K\x19\x86\x94K#K\x00K\x1a\x86\x94K'
+ b'%K\x00K\x1b\x86\x94K&K\x00K\x1c\x86\x94K.K\x00K\x1d\x86\x94K2K\x00K'
+ b'\x1e\x86\x94K7K\x00K\x1f\x86\x94K8K\x00K \x86\x94K9K\x00K!\x86\x94K;K\x00K'
+ b'"\x86\x94K=K\x00K#\x86\x94K>K\x00K$\x86\x94KAK\x00Kj\x86\x94KFK\x00K'
+ b"'\x86\x94KGK\x00K(\x86\x94KHK\x00K)\x86\x94uKW}\x94(K\x03K\x00K\x01\x86"
+ b'\x94K\x04K\x00K\x02\x86\x94K\x07K\x00K\x03\x86\x94K\tK\x00K\x04\x86\x94K\nK'
+ b'\x00K\x05\x86\x94K\x0bK\x00K\x06\x86\x94K\x0cK\x00K\x07\x86\x94K\rK'
+ b'\x00K\x08\x86\x94K\x0eK\x00K\t\x86\x94K\x0fK\x00K\n\x86\x94K\x11K'
+ b'\x00K\x0b\x86\x94K\x12K\x00K\x0c\x86\x94K\x13K\x00K\r\x86\x94K\x14K'
+ b'\x00K\x0e\x86\x94K\x15K\x00K\x0f\x86\x94K\x16K\x00K\x10\x86\x94K\x18K'
+ b'\x00K\x11\x86\x94K\x19K\x00K\x12\x86\x94K\x1aK\x00K\x13\x86\x94K\x1dK'
+ b'\x00K\x14\x86\x94K\x1eK\x00K\x15\x86\x94K\x1fK\x00K\x16\x86\x94K K'
+ b'\x00K\x17\x86\x94K!K\x00K\x18\x86\x94K"K\x00K\x19\x86\x94K#K\x00K\x1a\x86'
+ b'\x94K%K\x00K\x1b\x86\x94K&K\x00K\x1c\x86\x94K.K\x00K\x1d\x86\x94K2K'
+ b'\x00K\x1e\x86\x94K7K\x00K\x1f\x86\x94K8K\x00K \x86\x94K9K\x00K!\x86\x94K;K'
+ b'\x00K"\x86\x94K=K\x00K#\x86\x94K>K\x00K$\x86\x94KAK\x00Kk\x86\x94KFK'
+ b"\x00K'\x86\x94KGK\x00K(\x86\x94KHK\x00K)\x86\x94uKX}\x94(K\x00K\x01}"
+ b'\x94h\nKCs\x86\x94K\x02K\x01}\x94h\nKCs\x86\x94K\x17K\x01}\x94h\nKCs'
+ b'\x86\x94K\x1bK\x01}\x94h\nKCs\x86\x94K\x1cK\x01}\x94h\nKCs\x86\x94K)K\x01'
+ b'}\x94h\nKCs\x86\x94K*K\x01}\x94h\nKCs\x86\x94K+K\x01}\x94h\nKCs\x86\x94K'
+ b',K\x01}\x94h\nKCs\x86\x94K-K\x01}\x94h\nKCs\x86\x94uKY}\x94(K\x03K\x00K'
+ b'\x01\x86\x94K\x04K\x00K\x02\x86\x94K\x07K\x00K\x03\x86\x94K\tK\x00K'
+ b'\x04\x86\x94K\nK\x00K\x05\x86\x94K\x0bK\x00K\x06\x86\x94K\x0cK\x00K'
+ b'\x07\x86\x94K\rK\x00K\x08\x86\x94K\x0eK\x00K\t\x86\x94K\x0fK\x00K'
+ b'\n\x86\x94K\x11K\x00K\x0b\x86\x94K\x12K\x00K\x0c\x86\x94K\x13K\x00K'
+ b'\r\x86\x94K\x14K\x00K\x0e\x86\x94K\x15K\x00K\x0f\x86\x94K\x16K\x00K'
+ b'\x10\x86\x94K\x18K\x00K\x11\x86\x94K\x19K\x00K\x12\x86\x94K\x1aK\x00K'
+ b'\x13\x86\x94K\x1dK\x00K\x14\x86\x94K\x1eK\x00K\x15\x86\x94K\x1fK\x00K'
+ b'\x16\x86\x94K K\x00K\x17\x86\x94K!K\x00K\x18\x86\x94K"K\x00K\x19\x86\x94K'
+ b'#K\x00K\x1a\x86\x94K%K\x00K\x1b\x86\x94K&K\x00K\x1c\x86\x94K.K\x00K'
+ b'\x1d\x86\x94K2K\x00K\x1e\x86\x94K7K\x00K\x1f\x86\x94K8K\x00K \x86\x94K'
+ b'9K\x00K!\x86\x94K;K\x00K"\x86\x94K=K\x00K#\x86\x94K>K\x00K$\x86\x94KAK\x00K'
+ b"l\x86\x94KFK\x00K'\x86\x94KGK\x00K(\x86\x94KHK\x00K)\x86\x94uKZ}\x94(K\x00K"
+ b'\x01}\x94h\nKEs\x86\x94K\x02K\x01}\x94h\nKEs\x86\x94K\x17K\x01}\x94h\nK'
+ b'Es\x86\x94K\x1bK\x01}\x94h\nKEs\x86\x94K\x1cK\x01}\x94h\nKEs\x86\x94K)'
+ b'K\x01}\x94h\nKEs\x86\x94K*K\x01}\x94h\nKEs\x86\x94K+K\x01}\x94h\nKEs\x86'
+ b'\x94K,K\x01}\x94h\nKEs\x86\x94K-K\x01}\x94h\nKEs\x86\x94uK[}\x94(K\x01K'
+ b'\x00K5\x86\x94K\x05K\x00K6\x86\x94K?K\x00Km\x86\x94uK\\}\x94(K\x01K\x00K'
+ b'5\x86\x94K\x05K\x00K6\x86\x94K\x10K\x00Kn\x86\x94K\x17K\x00Ko\x86\x94K'
+ b'\x19K\x00Kp\x86\x94K6K\x00Kq\x86\x94K?K\x00Kr\x86\x94uK]}\x94K\x19K\x00'
+ b'Ks\x86\x94sK^}\x94(K\x02K\x01}\x94h\nK|s\x86\x94K\x1bK\x01}\x94h\nK'
+ b'|s\x86\x94K)K\x01}\x94h\nK|s\x86\x94uK_}\x94(K\x02K\x01}\x94h\nK{s\x86\x94'
+ b'K\x1bK\x01}\x94h\nK{s\x86\x94K)K\x01}\x94h\nK{s\x86\x94uK`}\x94(K\x02K\x01'
+ b'}\x94h\nKzs\x86\x94K\x1bK\x01}\x94h\nKzs\x86\x94K)K\x01}\x94h\nKzs\x86\x94u'
+ b'Ka}\x94(K\x03K\x00K\x01\x86\x94K\x04K\x00K\x02\x86\x94K\x07K\x00K\x03\x86'
+ b'\x94K\x08K\x00KD\x86\x94K\tK\x00K\x04\x86\x94K\nK\x00K\x05\x86\x94K\x0bK'
+ b'\x00K\x06\x86\x94K\x0cK\x00K\x07\x86\x94K\rK\x00K\x08\x86\x94K\x0eK'
+ b'\x00K\t\x86\x94K\x0fK\x00K\n\x86\x94K\x11K\x00K\x0b\x86\x94K\x12K'
+ b'\x00K\x0c\x86\x94K\x13K\x00K\r\x86\x94K\x14K\x00K\x0e\x86\x94K\x15K'
+ b'\x00K\x0f\x86\x94K\x16K\x00K\x10\x86\x94K\x18K\x00K\x11\x86\x94K\x19K'
+ b'\x00K\x12\x86\x94K\x1aK\x00K\x13\x86\x94K\x1dK\x00K\x14\x86\x94K\x1eK'
+ b'\x00K\x15\x86\x94K\x1fK\x00K\x16\x86\x94K K\x00K\x17\x86\x94K!K'
+ b'\x00K\x18\x86\x94K"K\x00K\x19\x86\x94K#K\x00K\x1a\x86\x94K$K\x00KE\x86'
+ b'\x94K%K\x00K\x1b\x86\x94K&K\x00K\x1c\x86\x94K.K\x00K\x1d\x86\x94K2K'
+ b'\x00K\x1e\x86\x94K3K\x00KF\x86\x94K4K\x00KG\x86\x94K7K\x00K\x1f\x86\x94K8K'
+ b'\x00K \x86\x94K9K\x00K!\x86\x94K;K\x00K"\x86\x94K<K\x00Kt\x86\x94K=K'
+ b'\x00K#\x86\x94K>K\x00K$\x86\x94K@K\x00KJ\x86\x94KAK\x00KK\x86\x94KBK'
+ b"\x00KL\x86\x94KDK\x00KM\x86\x94KFK\x00K'\x86\x94KGK\x00K(\x86\x94KHK"
+ b'\x00K)\x86\x94KKK\x00KN\x86\x94uKb}\x94(K\x03K\x00K\x01\x86\x94K\x04K\x00K'
+ b'\x02\x86\x94K\x07K\x00K\x03\x86\x94K\tK\x00K\x04\x86\x94K\nK\x00K'
+ b'\x05\x86\x94K\x0bK\x00K\x06\x86\x94K\x0cK\x00K\x07\x86\x94K\rK\x00K'
+ b'\x08\x86\x94K\x0eK\x00K\t\x86\x94K\x0fK\x00K\n\x86\x94K\x11K\x00K'
+ b'\x0b\x86\x94K\x12K\x00K\x0c\x86\x94K\x13K\x00K\r\x86\x94K\x14K\x00K'
+ b'\x0e\x86\x94K\x15K\x00K\x0f\x86\x94K\x16K\x00K\x10\x86\x94K\x18K\x00K'
+ b'\x11\x86\x94K\x19K\x00K\x12\x86\x94K\x1aK\x00K\x13\x86\x94K\x1dK\x00K'
+ b'\x14\x86\x94K\x1eK\x00K\x15\x86\x94K\x1fK\x00K\x16\x86\x94K K\x00K'
+ b'\x17\x86\x94K!K\x00K\x18\x86\x94K"K\x00K\x19\x86\x94K#K\x00K\x1a\x86\x94K'
+ b'%K\x00K\x1b\x86\x94K&K\x00K\x1c\x86\x94K.K\x00K\x1d\x86\x94K2K\x00K'
+ b'\x1e\x86\x94K7K\x00K\x1f\x86\x94K8K\x00K \x86\x94K9K\x00K!\x86\x94K;K\x00K'
+ b'"\x86\x94K=K\x00K#\x86\x94K>K\x00K$\x86\x94KAK\x00K%\x86\x94KCK\x00K'
+ b"u\x86\x94KFK\x00K'\x86\x94KGK\x00K(\x86\x94KHK\x00K)\x86\x94uKc}\x94K,K\x00"
+ b'Kv\x86\x94sKd}\x94(K\x02K\x01}\x94h\nKns\x86\x94K\x1bK\x01}\x94h\nK'
+ b'ns\x86\x94K)K\x01}\x94h\nKns\x86\x94uKe}\x94(K\x03K\x00K\x01\x86\x94K'
+ b'\x04K\x00K\x02\x86\x94K\x07K\x00K\x03\x86\x94K\tK\x00K\x04\x86\x94K\rK\x00K'
+ b'\x08\x86\x94K\x0eK\x00K\t\x86\x94K\x0fK\x00K\n\x86\x94K\x12K\x00K'
+ b'\x0c\x86\x94K\x13K\x00K\r\x86\x94K\x18K\x00K\x11\x86\x94K\x1aK\x00K'
+ b'\x13\x86\x94K\x1fK\x00K\x16\x86\x94K9K\x00Kw\x86\x94uKf}\x94(K\x01K'
+ b'\x00K5\x86\x94K\x05K\x00K6\x86\x94K\x0cK\x00K\x07\x86\x94K\x14K'
+ b'\x00K\x0e\x86\x94K\x16K\x00Kx\x86\x94K\x17K\x00Ky\x86\x94K\x1dK'
+ b'\x00K\x14\x86\x94K K\x00K\x17\x86\x94K#K\x00K\x1a\x86\x94K%K\x00K\x1b\x86'
+ b'\x94K&K\x00K\x1c\x86\x94K1K\x00Kz\x86\x94K?K\x00K{\x86\x94KGK\x00K|\x86'
+ b'\x94uKg}\x94(K\x03K\x00K\x01\x86\x94K\x04K\x00K\x02\x86\x94K\x07K\x00K'
+ b'\x03\x86\x94K\x08K\x00KD\x86\x94K\tK\x00K\x04\x86\x94K\nK\x00K\x05\x86\x94K'
+ b'\x0bK\x00K\x06\x86\x94K\x0cK\x00K\x07\x86\x94K\rK\x00K\x08\x86\x94K'
+ b'\x0eK\x00K\t\x86\x94K\x0fK\x00K\n\x86\x94K\x11K\x00K\x0b\x86\x94K\x12K\x00K'
+ b'\x0c\x86\x94K\x13K\x00K\r\x86\x94K\x14K\x00K\x0e\x86\x94K\x15K\x00K'
+ b'\x0f\x86\x94K\x16K\x00K\x10\x86\x94K\x18K\x00K\x11\x86\x94K\x19K\x00K'
+ b'\x12\x86\x94K\x1aK\x00K\x13\x86\x94K\x1dK\x00K\x14\x86\x94K\x1eK\x00K'
+ b'\x15\x86\x94K\x1fK\x00K\x16\x86\x94K K\x00K\x17\x86\x94K!K\x00K'
+ b'\x18\x86\x94K"K\x00K\x19\x86\x94K#K\x00K\x1a\x86\x94K$K\x00KE\x86\x94K'
+ b'%K\x00K\x1b\x86\x94K&K\x00K\x1c\x86\x94K.K\x00K\x1d\x86\x94K2K\x00K'
+ b'\x1e\x86\x94K3K\x00KF\x86\x94K4K\x00K}\x86\x94K7K\x00K\x1f\x86\x94K8K\x00K'
+ b' \x86\x94K9K\x00K!\x86\x94K;K\x00K"\x86\x94K=K\x00K#\x86\x94K>K\x00K'
+ b'$\x86\x94K@K\x00KJ\x86\x94KAK\x00KK\x86\x94KBK\x00KL\x86\x94KDK\x00K'
+ b"M\x86\x94KFK\x00K'\x86\x94KGK\x00K(\x86\x94KHK\x00K)\x86\x94KKK\x00K"
+ b'N\x86\x94uKh}\x94(K\x00K\x01}\x94h\nKFs\x86\x94K\x02K\x01}\x94h\nKF'
+ b's\x86\x94K\x17K\x01}\x94h\nKFs\x86\x94K\x1bK\x01}\x94h\nKFs\x86\x94K\x1cK'
+ b'\x01}\x94h\nKFs\x86\x94K)K\x01}\x94h\nKFs\x86\x94K*K\x01}\x94h\nKFs\x86\x94'
+ b'K+K\x01}\x94h\nKFs\x86\x94K,K\x01}\x94h\nKFs\x86\x94K-K\x01}\x94h\nKF'
+ b's\x86\x94uKi}\x94(K\x03K\x00K\x01\x86\x94K\x04K\x00K\x02\x86\x94K\x07K'
+ b'\x00K\x03\x86\x94K\tK\x00K\x04\x86\x94K\nK\x00K\x05\x86\x94K\x0bK'
+ b'\x00K\x06\x86\x94K\x0cK\x00K\x07\x86\x94K\rK\x00K\x08\x86\x94K\x0eK'
+ b'\x00K\t\x86\x94K\x0fK\x00K\n\x86\x94K\x11K\x00K\x0b\x86\x94K\x12K'
+ b'\x00K\x0c\x86\x94K\x13K\x00K\r\x86\x94K\x14K\x00K\x0e\x86\x94K\x15K'
+ b'\x00K\x0f\x86\x94K\x16K\x00K\x10\x86\x94K\x18K\x00K\x11\x86\x94K\x19K'
+ b'\x00K\x12\x86\x94K\x1aK\x00K\x13\x86\x94K\x1dK\x00K\x14\x86\x94K\x1eK'
+ b'\x00K\x15\x86\x94K\x1fK\x00K\x16\x86\x94K K\x00K\x17\x86\x94K!K'
+ b'\x00K\x18\x86\x94K"K\x00K\x19\x86\x94K#K\x00K\x1a\x86\x94K%K\x00K\x1b\x86'
+ b'\x94K&K\x00K\x1c\x86\x94K.K\x00K\x1d\x86\x94K2K\x00K\x1e\x86\x94K7K'
+ b'\x00K\x1f\x86\x94K8K\x00K \x86\x94K9K\x00K!\x86\x94K;K\x00K"\x86\x94K=K'
+ b"\x00K#\x86\x94K>K\x00K$\x86\x94KAK\x00K~\x86\x94KFK\x00K'\x86\x94KGK"
+ b'\x00K(\x86\x94KHK\x00K)\x86\x94uKj}\x94(K\x00K\x01}\x94h\nKAs\x86\x94'
+ b'K\x02K\x01}\x94h\nKAs\x86\x94K\x17K\x01}\x94h\nKAs\x86\x94K\x1bK\x01}\x94'
+ b'h\nKAs\x86\x94K\x1cK\x01}\x94h\nKAs\x86\x94K)K\x01}\x94h\nKAs\x86\x94K*K'
+ b'\x01}\x94h\nKAs\x86\x94K+K\x01}\x94h\nKAs\x86\x94K,K\x01}\x94h\nKAs\x86\x94'
+ b'K-K\x01}\x94h\nKAs\x86\x94uKk}\x94(K\x00K\x01}\x94h\nKBs\x86\x94K\x02K\x01'
+ b'}\x94h\nKBs\x86\x94K\x17K\x01}\x94h\nKBs\x86\x94K\x1bK\x01}\x94h\nKB'
+ b's\x86\x94K\x1cK\x01}\x94h\nKBs\x86\x94K)K\x01}\x94h\nKBs\x86\x94K*K'
+ b'\x01}\x94h\nKBs\x86\x94K+K\x01}\x94h\nKBs\x86\x94K,K\x01}\x94h\nKBs\x86\x94'
+ b'K-K\x01}\x94h\nKBs\x86\x94uKl}\x94(K\x00K\x01}\x94h\nKDs\x86\x94K\x02K\x01'
+ b'}\x94h\nKDs\x86\x94K\x17K\x01}\x94h\nKDs\x86\x94K\x1bK\x01}\x94h\nKD'
+ b's\x86\x94K\x1cK\x01}\x94h\nKDs\x86\x94K)K\x01}\x94h\nKDs\x86\x94K*K'
+ b'\x01}\x94h\nKDs\x86\x94K+K\x01}\x94h\nKDs\x86\x94K,K\x01}\x94h\nKDs\x86\x94'
+ b'K-K\x01}\x94h\nKDs\x86\x94uKm}\x94K\x19K\x00K\x7f\x86\x94sKn}\x94('
+ b'K\x02K\x01}\x94h\nK\x83s\x86\x94K\x1bK\x01}\x94h\nK\x83s\x86\x94K)'
+ b'K\x01}\x94h\nK\x83s\x86\x94uKo}\x94(K\x01K\x00K5\x86\x94K\x05K\x00K6\x86'
+ b'\x94K\x10K\x00Kn\x86\x94K\x19K\x00Kp\x86\x94K6K\x00K\x80\x86\x94K?K'
+ b'\x00K\x81\x86\x94uKp}\x94(K\x02K\x01}\x94h\nK\x85s\x86\x94K\x1bK\x01'
+ b'}\x94h\nK\x85s\x86\x94K)K\x01}\x94h\nK\x85s\x86\x94K/K\x00K\x82\x86\x94uK'
+ b'q}\x94(K\x02K\x01}\x94h\nK~s\x86\x94K\x1bK\x01}\x94h\nK~s\x86\x94K)'
+ b'K\x01}\x94h\nK~s\x86\x94uKr}\x94K\x19K\x00K\x83\x86\x94sKs}\x94(K\x02'
+ b'K\x01}\x94h\nK\x82s\x86\x94K\x1bK\x01}\x94h\nK\x82s\x86\x94K)K\x01}\x94h\n'
+ b'K\x82s\x86\x94uKt}\x94K)K\x01}\x94h\nKfs\x86\x94sKu}\x94(K\x00K\x01}\x94h'
+ b'\nK4s\x86\x94K\x1cK\x01}\x94h\nK4s\x86\x94uKv}\x94(K\x03K\x00K\x01\x86'
+ b'\x94K\x04K\x00K\x02\x86\x94K\x07K\x00K\x03\x86\x94K\tK\x00K\x04\x86\x94K\rK'
+ b'\x00K\x08\x86\x94K\x0eK\x00K\t\x86\x94K\x0fK\x00K\n\x86\x94K\x12K'
+ b'\x00K\x0c\x86\x94K\x13K\x00K\r\x86\x94K\x18K\x00K\x11\x86\x94K\x1aK'
+ b'\x00K\x13\x86\x94K\x1fK\x00K\x16\x86\x94K9K\x00K\x84\x86\x94uKw}\x94(K'
+ b'\x02K\x01}\x94h\nKps\x86\x94K\x1bK\x01}\x94h\nKps\x86\x94K)K\x01}\x94h\nKps'
+ b'\x86\x94uKx}\x94(K\x02K\x01}\x94h\nKts\x86\x94K\x1bK\x01}\x94h\nKts'
+ b'\x86\x94K)K\x01}\x94h\nKts\x86\x94uKy}\x94(K\x01K\x00K5\x86\x94K\x05K'
+ b'\x00K6\x86\x94K\x0cK\x00K\x07\x86\x94K\x14K\x00K\x0e\x86\x94K\x16K'
+ b'\x00K\x85\x86\x94K\x1dK\x00K\x14\x86\x94K K\x00K\x17\x86\x94K#K'
+ b'\x00K\x1a\x86\x94K%K\x00K\x1b\x86\x94K&K\x00K\x1c\x86\x94K1K\x00K\x86\x86'
+ b'\x94K?K\x00K\x87\x86\x94KGK\x00K\x88\x86\x94uKz}\x94K(K\x00K\x89\x86\x94sK'
+ b'{}\x94(K\x03K\x00K\x01\x86\x94K\x04K\x00K\x02\x86\x94K\x07K\x00'
+ b'K\x03\x86\x94K\tK\x00K\x04\x86\x94K\nK\x00K\x05\x86\x94K\x0bK\x00'
+ b'K\x06\x86\x94K\x0cK\x00K\x07\x86\x94K\rK\x00K\x08\x86\x94K\x0eK\x00'
+ b'K\t\x86\x94K\x0fK\x00K\n\x86\x94K\x11K\x00K\x0b\x86\x94K\x12K\x00'
+ b'K\x0c\x86\x94K\x13K\x00K\r\x86\x94K\x14K\x00K\x0e\x86\x94K\x15K\x00'
+ b'K\x0f\x86\x94K\x16K\x00K\x10\x86\x94K\x18K\x00K\x11\x86\x94K\x19K\x00'
+ b'K\x12\x86\x94K\x1aK\x00K\x13\x86\x94K\x1dK\x00K\x14\x86\x94K\x1eK\x00'
+ b'K\x15\x86\x94K\x1fK\x00K\x16\x86\x94K K\x00K\x17\x86\x94K!K\x00'
+ b'K\x18\x86\x94K"K\x00K\x19\x86\x94K#K\x00K\x1a\x86\x94K%K\x00K\x1b\x86\x94'
+ b'K&K\x00K\x1c\x86\x94K.K\x00K\x1d\x86\x94K2K\x00K\x1e\x86\x94K7K\x00'
+ b'K\x1f\x86\x94K8K\x00K \x86\x94K9K\x00K!\x86\x94K;K\x00K"\x86\x94K=K\x00'
+ b'K#\x86\x94K>K\x00K$\x86\x94K@K\x00K\x8a\x86\x94KAK\x00KK\x86\x94KFK\x00'
+ b"K'\x86\x94KGK\x00K(\x86\x94KHK\x00K)\x86\x94uK|}\x94(K\x02K\x01}\x94h\nKs"
+ b's\x86\x94K\x1bK\x01}\x94h\nKss\x86\x94K)K\x01}\x94h\nKss\x86\x94uK}}\x94(K'
+ b'\x1bK\x01}\x94h\nKhs\x86\x94K)K\x01}\x94h\nKhs\x86\x94uK~}\x94(K\x00K\x01}'
+ b'\x94h\nK@s\x86\x94K\x02K\x01}\x94h\nK@s\x86\x94K\x17K\x01}\x94h\nK@s'
+ b'\x86\x94K\x1bK\x01}\x94h\nK@s\x86\x94K\x1cK\x01}\x94h\nK@s\x86\x94K)K\x01'
+ b'}\x94h\nK@s\x86\x94K*K\x01}\x94h\nK@s\x86\x94K+K\x01}\x94h\nK@s\x86\x94K'
+ b',K\x01}\x94h\nK@s\x86\x94K-K\x01}\x94h\nK@s\x86\x94uK\x7f}\x94(K\x02K\x01}'
+ b'\x94h\nK\x81s\x86\x94K\x1bK\x01}\x94h\nK\x81s\x86\x94K)K\x01}\x94h\nK\x81s'
+ b'\x86\x94uK\x80}\x94(K\x02K\x01}\x94h\nK}s\x86\x94K\x1bK\x01}\x94h\nK}s'
+ b'\x86\x94K)K\x01}\x94h\nK}s\x86\x94uK\x81}\x94K\x19K\x00K\x8b\x86\x94sK\x82}'
+ b'\x94K\x19K\x00K\x8c\x86\x94sK\x83}\x94(K\x02K\x01}\x94h\nK\x80s\x86\x94'
+ b'K\x1bK\x01}\x94h\nK\x80s\x86\x94K)K\x01}\x94h\nK\x80s\x86\x94uK\x84}\x94('
+ b'K\x02K\x01}\x94h\nKos\x86\x94K\x1bK\x01}\x94h\nKos\x86\x94K)K\x01}\x94h\nKo'
+ b's\x86\x94uK\x85}\x94(K\x02K\x01}\x94h\nKrs\x86\x94K\x1bK\x01}\x94h\nKr'
+ b's\x86\x94K)K\x01}\x94h\nKrs\x86\x94uK\x86}\x94K(K\x00K\x8d\x86\x94sK\x87'
+ b'}\x94(K\x03K\x00K\x01\x86\x94K\x04K\x00K\x02\x86\x94K\x07K\x00K'
+ b'\x03\x86\x94K\tK\x00K\x04\x86\x94K\nK\x00K\x05\x86\x94K\x0bK\x00K'
+ b'\x06\x86\x94K\x0cK\x00K\x07\x86\x94K\rK\x00K\x08\x86\x94K\x0eK\x00K'
+ b'\t\x86\x94K\x0fK\x00K\n\x86\x94K\x11K\x00K\x0b\x86\x94K\x12K\x00K'
+ b'\x0c\x86\x94K\x13K\x00K\r\x86\x94K\x14K\x00K\x0e\x86\x94K\x15K\x00K'
+ b'\x0f\x86\x94K\x16K\x00K\x10\x86\x94K\x18K\x00K\x11\x86\x94K\x19K\x00K'
+ b'\x12\x86\x94K\x1aK\x00K\x13\x86\x94K\x1dK\x00K\x14\x86\x94K\x1eK\x00K'
+ b'\x15\x86\x94K\x1fK\x00K\x16\x86\x94K K\x00K\x17\x86\x94K!K\x00K'
+ b'\x18\x86\x94K"K\x00K\x19\x86\x94K#K\x00K\x1a\x86\x94K%K\x00K\x1b\x86\x94K'
+ b'&K\x00K\x1c\x86\x94K.K\x00K\x1d\x86\x94K2K\x00K\x1e\x86\x94K7K\x00K'
+ b'\x1f\x86\x94K8K\x00K \x86\x94K9K\x00K!\x86\x94K;K\x00K"\x86\x94K=K\x00K'
+ b'#\x86\x94K>K\x00K$\x86\x94K@K\x00K\x8e\x86\x94KAK\x00KK\x86\x94KFK\x00K'
+ b"'\x86\x94KGK\x00K(\x86\x94KHK\x00K)\x86\x94uK\x88}\x94(K\x02K\x01}\x94h"
+ b'\nKqs\x86\x94K\x1bK\x01}\x94h\nKqs\x86\x94K)K\x01}\x94h\nKqs\x86\x94uK\x89}'
+ b'\x94(K\x03K\x00K\x01\x86\x94K\x04K\x00K\x02\x86\x94K\x07K\x00K\x03'
+ b'\x86\x94K\tK\x00K\x04\x86\x94K\nK\x00K\x05\x86\x94K\x0bK\x00K\x06'
+ b'\x86\x94K\x0cK\x00K\x07\x86\x94K\rK\x00K\x08\x86\x94K\x0eK\x00K\t'
+ b'\x86\x94K\x0fK\x00K\n\x86\x94K\x11K\x00K\x0b\x86\x94K\x12K\x00K\x0c'
+ b'\x86\x94K\x13K\x00K\r\x86\x94K\x14K\x00K\x0e\x86\x94K\x15K\x00K\x0f'
+ b'\x86\x94K\x16K\x00K\x10\x86\x94K\x18K\x00K\x11\x86\x94K\x19K\x00K\x12'
+ b'\x86\x94K\x1aK\x00K\x13\x86\x94K\x1dK\x00K\x14\x86\x94K\x1eK\x00K\x15'
+ b'\x86\x94K\x1fK\x00K\x16\x86\x94K K\x00K\x17\x86\x94K!K\x00K\x18\x86\x94K"'
+ b'K\x00K\x19\x86\x94K#K\x00K\x1a\x86\x94K%K\x00K\x1b\x86\x94K&K\x00K\x1c'
+ b'\x86\x94K.K\x00K\x1d\x86\x94K2K\x00K\x1e\x86\x94K7K\x00K\x1f\x86\x94K8'
+ b'K\x00K \x86\x94K9K\x00K!\x86\x94K;K\x00K"\x86\x94K=K\x00K#\x86\x94K>K\x00K$'
+ b"\x86\x94K@K\x00K\x8f\x86\x94KAK\x00KK\x86\x94KFK\x00K'\x86\x94KGK\x00K("
+ b'\x86\x94KHK\x00K)\x86\x94uK\x8a}\x94(K\x02K\x01}\x94h\nKxs\x86\x94K\x1bK'
+ b'\x01}\x94h\nKxs\x86\x94K)K\x01}\x94h\nKxs\x86\x94uK\x8b}\x94(K\x02K'
+ b'\x01}\x94h\nK\x7fs\x86\x94K\x1bK\x01}\x94h\nK\x7fs\x86\x94K)K\x01}\x94h\nK'
+ b'\x7fs\x86\x94uK\x8c}\x94(K\x02K\x01}\x94h\nK\x84s\x86\x94K\x1bK\x01}'
+ b'\x94h\nK\x84s\x86\x94K)K\x01}\x94h\nK\x84s\x86\x94uK\x8d}\x94(K\x03K\x00K'
+ b'\x01\x86\x94K\x04K\x00K\x02\x86\x94K\x07K\x00K\x03\x86\x94K\tK\x00K'
+ b'\x04\x86\x94K\nK\x00K\x05\x86\x94K\x0bK\x00K\x06\x86\x94K\x0cK\x00K'
+ b'\x07\x86\x94K\rK\x00K\x08\x86\x94K\x0eK\x00K\t\x86\x94K\x0fK\x00K'
+ b'\n\x86\x94K\x11K\x00K\x0b\x86\x94K\x12K\x00K\x0c\x86\x94K\x13K\x00K'
+ b'\r\x86\x94K\x14K\x00K\x0e\x86\x94K\x15K\x00K\x0f\x86\x94K\x16K\x00K'
+ b'\x10\x86\x94K\x18K\x00K\x11\x86\x94K\x19K\x00K\x12\x86\x94K\x1aK\x00K'
+ b'\x13\x86\x94K\x1dK\x00K\x14\x86\x94K\x1eK\x00K\x15\x86\x94K\x1fK\x00K'
+ b'\x16\x86\x94K K\x00K\x17\x86\x94K!K\x00K\x18\x86\x94K"K\x00K\x19\x86\x94K'
+ b'#K\x00K\x1a\x86\x94K%K\x00K\x1b\x86\x94K&K\x00K\x1c\x86\x94K.K\x00K'
+ b'\x1d\x86\x94K2K\x00K\x1e\x86\x94K7K\x00K\x1f\x86\x94K8K\x00K \x86\x94K'
+ b'9K\x00K!\x86\x94K;K\x00K"\x86\x94K=K\x00K#\x86\x94K>K\x00K$\x86\x94K@K\x00K'
+ b"\x90\x86\x94KAK\x00KK\x86\x94KFK\x00K'\x86\x94KGK\x00K(\x86\x94KHK\x00K"
+ b')\x86\x94uK\x8e}\x94(K\x02K\x01}\x94h\nKws\x86\x94K\x1bK\x01}\x94h\nKw'
+ b's\x86\x94K)K\x01}\x94h\nKws\x86\x94uK\x8f}\x94(K\x02K\x01}\x94h\nKv'
+ b's\x86\x94K\x1bK\x01}\x94h\nKvs\x86\x94K)K\x01}\x94h\nKvs\x86\x94uK\x90'
+ b'}\x94(K\x02K\x01}\x94h\nKus\x86\x94K\x1bK\x01}\x94h\nKus\x86\x94K)K'
+ b'\x01}\x94h\nKus\x86\x94uu\x8c\x0cstart_states\x94}\x94h\xa4K\x00s\x8c\nend_'
+ b'states\x94}\x94h\xa4K&suhE\x8c\x0fParsingFrontend\x94uhI]\x94(}\x94h\nK4s'
+ b'}\x94h\nK5s}\x94h\nK6s}\x94h\nK7s}\x94h\nK8s}\x94h\nK9s}\x94h\nK:s}\x94'
+ b'h\nK;s}\x94h\nK<s}\x94h\nK=s}\x94h\nK>s}\x94h\nK?s}\x94h\nK@s}\x94h\nKAs}'
+ b'\x94h\nKBs}\x94h\nKCs}\x94h\nKDs}\x94h\nKEs}\x94h\nKFs}\x94h\nKGs}\x94h'
+ b'\nKHs}\x94h\nKIs}\x94h\nKJs}\x94h\nKKs}\x94h\nKLs}\x94h\nKMs}\x94h\nK'
+ b'Ns}\x94h\nKOs}\x94h\nKPs}\x94h\nKQs}\x94h\nKRs}\x94h\nKSs}\x94h\nKTs'
+ b'}\x94h\nKUs}\x94h\nKVs}\x94h\nKWs}\x94h\nKXs}\x94h\nKYs}\x94h\nKZs}\x94'
+ b'h\nK[s}\x94h\nK\\s}\x94h\nK]s}\x94h\nK^s}\x94h\nK_s}\x94h\nK`s}\x94h\nKas}'
+ b'\x94h\nKbs}\x94h\nKcs}\x94h\nKds}\x94h\nKes}\x94h\nKfs}\x94h\nKgs}\x94h'
+ b'\nKhs}\x94h\nKis}\x94h\nKjs}\x94h\nKks}\x94h\nKls}\x94h\nKms}\x94h\nK'
+ b'ns}\x94h\nKos}\x94h\nKps}\x94h\nKqs}\x94h\nKrs}\x94h\nKss}\x94h\nKts'
+ b'}\x94h\nKus}\x94h\nKvs}\x94h\nKws}\x94h\nKxs}\x94h\nKys}\x94h\nKzs}\x94'
+ b'h\nK{s}\x94h\nK|s}\x94h\nK}s}\x94h\nK~s}\x94h\nK\x7fs}\x94h\nK\x80s}\x94h\n'
+ b'K\x81s}\x94h\nK\x82s}\x94h\nK\x83s}\x94h\nK\x84s}\x94h\nK\x85s}\x94h\nK'
+ b'\x86s}\x94h\nK\x87s}\x94h\nK\x88s}\x94h\nK\x89s}\x94h\nK\x8ase\x8c\x07opt'
+ b'ions\x94}\x94(\x8c\x05debug\x94\x89\x8c\x06strict\x94\x89\x8c\x0fkeep_al'
+ b'l_tokens\x94\x89\x8c\ntree_class\x94N\x8c\x05cache\x94\x89\x8c\rcache_gra'
+ b'mmar\x94\x89\x8c\x07postlex\x94Nh\x03h\xa6\x8c\x05lexer\x94hD\x8c\x0btra'
+ b'nsformer\x94Nh\xa2]\x94h\xa4a\x8c\x08priority\x94\x8c\x06normal\x94\x8c\ta'
+ b'mbiguity\x94\x8c\x04auto\x94\x8c\x05regex\x94\x89\x8c\x13propagate_positio'
+ b'ns\x94\x89\x8c\x0flexer_callbacks\x94}\x94\x8c\x12maybe_placeholders'
+ b'\x94\x88\x8c\x0eedit_terminals\x94NhAK\x00hB\x89\x8c\x0cordered_set'
+ b's\x94\x88\x8c\x0cimport_paths\x94]\x94\x8c\x0bsource_path\x94N\x8c\x08_pl'
+ b'ugins\x94}\x94uhE\x8c\x04Lark\x94u\x8c\x04memo\x94}\x94(K\x00}\x94(\x8c\x04'
+ b'name\x94h\xbf\x8c\x07pattern\x94}\x94(\x8c\x05value\x94\x8c\x0cmo(n(day)?'
+ b')?\x94\x8c\x05flags\x94]\x94\x8c\x01i\x94a\x8c\x03raw\x94\x8c\x0f/mo(n(day)'
+ b'?)?/i\x94\x8c\x06_width\x94]\x94(K\x02K\x06ehE\x8c\tPatternRE\x94uj\xa9'
+ b'\n\x00\x00K\x07hE\x8c\x0bTerminalDef\x94uK\x01}\x94(j\xbd\n\x00\x00'
+ b'h\xd0j\xbe\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\rtu(e(sday)?)?\x94j'
+ b'\xc2\n\x00\x00]\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c\x10/tu(e(sday)?)'
+ b'?/i\x94j\xc7\n\x00\x00]\x94(K\x02K\x07ehEj\xc9\n\x00\x00uj\xa9\n'
+ b'\x00\x00K\x07hEj\xca\n\x00\x00uK\x02}\x94(j\xbd\n\x00\x00h\xd1j\xbe\n\x00'
+ b'\x00}\x94(j\xc0\n\x00\x00\x8c\x0fwe(d(nesday)?)?\x94j\xc2\n\x00\x00'
+ b']\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c\x12/we(d(nesday)?)?/i\x94j\xc7'
+ b'\n\x00\x00]\x94(K\x02K\tehEj\xc9\n\x00\x00uj\xa9\n\x00\x00K\x07hE'
+ b'j\xca\n\x00\x00uK\x03}\x94(j\xbd\n\x00\x00h\xcej\xbe\n\x00\x00}\x94(j\xc0'
+ b'\n\x00\x00\x8c\rth(u(rsday))?\x94j\xc2\n\x00\x00]\x94j\xc4\n\x00\x00a'
+ b'j\xc5\n\x00\x00\x8c\x10/th(u(rsday))?/i\x94j\xc7\n\x00\x00]\x94(K\x02K\x08'
+ b'ehEj\xc9\n\x00\x00uj\xa9\n\x00\x00K\x07hEj\xca\n\x00\x00uK\x04}\x94(j\xbd\n'
+ b'\x00\x00h\xb7j\xbe\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x0cfr(i(day)?)?\x94'
+ b'j\xc2\n\x00\x00]\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c\x0f/fr(i(day)?)'
+ b'?/i\x94j\xc7\n\x00\x00]\x94(K\x02K\x06ehEj\xc9\n\x00\x00uj\xa9\n'
+ b'\x00\x00K\x07hEj\xca\n\x00\x00uK\x05}\x94(j\xbd\n\x00\x00h\xc8j\xbe\n\x00'
+ b'\x00}\x94(j\xc0\n\x00\x00\x8c\x0esa(t(urday)?)?\x94j\xc2\n\x00\x00]'
+ b'\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c\x11/sa(t(urday)?)?/i\x94j\xc7\n\x00'
+ b'\x00]\x94(K\x02K\x08ehEj\xc9\n\x00\x00uj\xa9\n\x00\x00K\x07hEj\xca'
+ b'\n\x00\x00uK\x06}\x94(j\xbd\n\x00\x00h\xcbj\xbe\n\x00\x00}\x94(j\xc0\n\x00'
+ b'\x00\x8c\x0csu(n(day)?)?\x94j\xc2\n\x00\x00]\x94j\xc4\n\x00\x00aj\xc5\n'
+ b'\x00\x00\x8c\x0f/su(n(day)?)?/i\x94j\xc7\n\x00\x00]\x94(K\x02K\x06ehEj'
+ b'\xc9\n\x00\x00uj\xa9\n\x00\x00K\x07hEj\xca\n\x00\x00uK\x07}\x94(j\xbd\n'
+ b'\x00\x00h\xb8j\xbe\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\njan(uary)?\x94j\xc2'
+ b'\n\x00\x00]\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c\r/jan(uary)?/i\x94'
+ b'j\xc7\n\x00\x00]\x94(K\x03K\x07ehEj\xc9\n\x00\x00uj\xa9\n\x00\x00K\thEj\xca'
+ b'\n\x00\x00uK\x08}\x94(j\xbd\n\x00\x00h\xb4j\xbe\n\x00\x00}\x94(j\xc0\n\x00'
+ b'\x00\x8c\x0bfeb(ruary)?\x94j\xc2\n\x00\x00]\x94j\xc4\n\x00\x00aj\xc5\n\x00'
+ b'\x00\x8c\x0e/feb(ruary)?/i\x94j\xc7\n\x00\x00]\x94(K\x03K\x08ehEj\xc9\n'
+ b'\x00\x00uj\xa9\n\x00\x00K\thEj\xca\n\x00\x00uK\t}\x94(j\xbd\n\x00\x00'
+ b'h\xbdj\xbe\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x08mar(ch)?\x94j\xc2'
+ b'\n\x00\x00]\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c\x0b/mar(ch)?/i\x94j\xc7'
+ b'\n\x00\x00]\x94(K\x03K\x05ehEj\xc9\n\x00\x00uj\xa9\n\x00\x00K\thE'
+ b'j\xca\n\x00\x00uK\n}\x94(j\xbd\n\x00\x00h\xaej\xbe\n\x00\x00}\x94(j\xc0'
+ b'\n\x00\x00\x8c\x08apr(il)?\x94j\xc2\n\x00\x00]\x94j\xc4\n\x00\x00aj'
+ b'\xc5\n\x00\x00\x8c\x0b/apr(il)?/i\x94j\xc7\n\x00\x00]\x94(K\x03K\x05eh'
+ b'Ej\xc9\n\x00\x00uj\xa9\n\x00\x00K\thEj\xca\n\x00\x00uK\x0b}\x94(j'
+ b'\xbd\n\x00\x00h\xbej\xbe\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x03may'
+ b'\x94j\xc2\n\x00\x00]\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c\x06/may/i\x94'
+ b'j\xc7\n\x00\x00]\x94(K\x03K\x03ehEj\xc9\n\x00\x00uj\xa9\n\x00\x00K\thEj\xca'
+ b'\n\x00\x00uK\x0c}\x94(j\xbd\n\x00\x00h\xbaj\xbe\n\x00\x00}\x94(j\xc0\n\x00'
+ b'\x00\x8c\x05june?\x94j\xc2\n\x00\x00]\x94j\xc4\n\x00\x00aj\xc5'
+ b'\n\x00\x00\x8c\x08/june?/i\x94j\xc7\n\x00\x00]\x94(K\x03K\x04ehEj\xc9\n'
+ b'\x00\x00uj\xa9\n\x00\x00K\thEj\xca\n\x00\x00uK\r}\x94(j\xbd\n\x00\x00'
+ b'h\xb9j\xbe\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x05july?\x94j\xc2\n\x00\x00'
+ b']\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c\x08/july?/i\x94j\xc7\n\x00'
+ b'\x00]\x94(K\x03K\x04ehEj\xc9\n\x00\x00uj\xa9\n\x00\x00K\thEj\xca\n\x00\x00u'
+ b'K\x0e}\x94(j\xbd\n\x00\x00h\xafj\xbe\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\ta'
+ b'ug(ust)?\x94j\xc2\n\x00\x00]\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c\x0c/au'
+ b'g(ust)?/i\x94j\xc7\n\x00\x00]\x94(K\x03K\x06ehEj\xc9\n\x00\x00uj'
+ b'\xa9\n\x00\x00K\thEj\xca\n\x00\x00uK\x0f}\x94(j\xbd\n\x00\x00h\xcaj\xbe'
+ b'\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x11sep(temb(er|re))?\x94j\xc2\n\x00\x00'
+ b']\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c\x14/sep(temb(er|re))?/i\x94'
+ b'j\xc7\n\x00\x00]\x94(K\x03K\tehEj\xc9\n\x00\x00uj\xa9\n\x00\x00K\thEj\xca'
+ b'\n\x00\x00uK\x10}\x94(j\xbd\n\x00\x00h\xc5j\xbe\n\x00\x00}\x94(j\xc0\n\x00'
+ b'\x00\x8c\x0foct(ob(er|re))?\x94j\xc2\n\x00\x00]\x94j\xc4\n\x00\x00a'
+ b'j\xc5\n\x00\x00\x8c\x12/oct(ob(er|re))?/i\x94j\xc7\n\x00\x00]\x94(K\x03'
+ b'K\x07ehEj\xc9\n\x00\x00uj\xa9\n\x00\x00K\thEj\xca\n\x00\x00uK\x11}\x94(j'
+ b'\xbd\n\x00\x00h\xc3j\xbe\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x10nov(emb(er|'
+ b're))?\x94j\xc2\n\x00\x00]\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c\x13/nov(e'
+ b'mb(er|re))?/i\x94j\xc7\n\x00\x00]\x94(K\x03K\x08ehEj\xc9\n\x00\x00uj'
+ b'\xa9\n\x00\x00K\thEj\xca\n\x00\x00uK\x12}\x94(j\xbd\n\x00\x00h\xb2j\xbe'
+ b'\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x10dec(emb(er|re))?\x94j\xc2\n\x00\x00]'
+ b'\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c\x13/dec(emb(er|re))?/i\x94j\xc7'
+ b'\n\x00\x00]\x94(K\x03K\x08ehEj\xc9\n\x00\x00uj\xa9\n\x00\x00K\thE'
+ b'j\xca\n\x00\x00uK\x13}\x94(j\xbd\n\x00\x00h\xcfj\xbe\n\x00\x00}\x94(j\xc0'
+ b'\n\x00\x00\x8c\x04true\x94j\xc2\n\x00\x00]\x94j\xc4\n\x00\x00aj'
+ b'\xc5\n\x00\x00\x8c\x07/true/i\x94j\xc7\n\x00\x00]\x94(K\x04K\x04ehEj\xc9\n'
+ b'\x00\x00uj\xa9\n\x00\x00K\thEj\xca\n\x00\x00uK\x14}\x94(j\xbd\n\x00\x00'
+ b'h\xb3j\xbe\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x05false\x94j\xc2\n\x00\x00'
+ b']\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c\x08/false/i\x94j\xc7\n\x00'
+ b'\x00]\x94(K\x05K\x05ehEj\xc9\n\x00\x00uj\xa9\n\x00\x00K\thEj\xca\n\x00\x00u'
+ b'K\x15}\x94(j\xbd\n\x00\x00h\xb5j\xbe\n\x00\x00}\x94(j\xc0\n\x00'
+ b'\x00\x8c\x05first\x94j\xc2\n\x00\x00]\x94j\xc4\n\x00\x00aj\xc5'
+ b'\n\x00\x00\x8c\x08"first"i\x94hE\x8c\nPatternStr\x94uj\xa9\n\x00\x00K\thEj'
+ b'\xca\n\x00\x00uK\x16}\x94(j\xbd\n\x00\x00h\xc9j\xbe\n\x00\x00}\x94(j\xc0\n'
+ b'\x00\x00\x8c\x06second\x94j\xc2\n\x00\x00]\x94j\xc4\n\x00\x00aj\xc5\n\x00'
+ b'\x00\x8c\t"second"i\x94hEjH\x0b\x00\x00uj\xa9\n\x00\x00K\thEj\xca'
+ b'\n\x00\x00uK\x17}\x94(j\xbd\n\x00\x00h\xcdj\xbe\n\x00\x00}\x94(j\xc0\n\x00'
+ b'\x00\x8c\x05third\x94j\xc2\n\x00\x00]\x94j\xc4\n\x00\x00aj\xc5'
+ b'\n\x00\x00\x8c\x08"third"i\x94hEjH\x0b\x00\x00uj\xa9\n\x00\x00K\thEj'
+ b'\xca\n\x00\x00uK\x18}\x94(j\xbd\n\x00\x00h\xb6j\xbe\n\x00\x00}\x94(j\xc0\n'
+ b'\x00\x00\x8c\x06fourth\x94j\xc2\n\x00\x00]\x94j\xc4\n\x00\x00aj\xc5\n\x00'
+ b'\x00\x8c\t"fourth"i\x94hEjH\x0b\x00\x00uj\xa9\n\x00\x00K\thEj\xca'
+ b'\n\x00\x00uK\x19}\x94(j\xbd\n\x00\x00h\xd9j\xbe\n\x00\x00}\x94(j\xc0\n\x00'
+ b'\x00\x8c\x04last\x94j\xc2\n\x00\x00]\x94j\xc4\n\x00\x00aj\xc5\n'
+ b'\x00\x00\x8c\x07"last"i\x94hEjH\x0b\x00\x00uj\xa9\n\x00\x00K\thEj\xca\n'
+ b'\x00\x00uK\x1a}\x94(j\xbd\n\x00\x00h\xd5j\xbe\n\x00\x00}\x94(j'
+ b'\xc0\n\x00\x00\x8c\x06exists\x94j\xc2\n\x00\x00]\x94j\xc4\n\x00\x00aj\xc5'
+ b'\n\x00\x00\x8c\t"exists"i\x94hEjH\x0b\x00\x00uj\xa9\n\x00\x00K\thE'
+ b'j\xca\n\x00\x00uK\x1b}\x94(j\xbd\n\x00\x00h\xdbj\xbe\n\x00\x00}\x94(j\xc0'
+ b'\n\x00\x00\x8c\x02of\x94j\xc2\n\x00\x00]\x94j\xc4\n\x00\x00aj\xc5\n'
+ b'\x00\x00\x8c\x05/of/i\x94j\xc7\n\x00\x00]\x94(K\x02K\x02ehEj\xc9\n'
+ b'\x00\x00uj\xa9\n\x00\x00K\thEj\xca\n\x00\x00uK\x1c}\x94(j\xbd\n\x00\x00'
+ b'h\xd6j\xbe\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x02if\x94j\xc2\n\x00'
+ b'\x00]\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c\x05"if"i\x94hEjH\x0b\x00'
+ b'\x00uj\xa9\n\x00\x00K\thEj\xca\n\x00\x00uK\x1d}\x94(j\xbd\n\x00\x00h'
+ b'\xd4j\xbe\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x04else\x94j\xc2\n'
+ b'\x00\x00]\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c\x07"else"i\x94hEj'
+ b'H\x0b\x00\x00uj\xa9\n\x00\x00K\thEj\xca\n\x00\x00uK\x1e}\x94(j\xbd\n'
+ b'\x00\x00h\xc1j\xbe\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x05never\x94j\xc2\n'
+ b'\x00\x00]\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c\x08"never"i\x94hE'
+ b'jH\x0b\x00\x00uj\xa9\n\x00\x00K\thEj\xca\n\x00\x00uK\x1f}\x94(j\xbd'
+ b'\n\x00\x00h\xd8j\xbe\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x02is\x94j'
+ b'\xc2\n\x00\x00]\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c\x05"is"i\x94hEj'
+ b'H\x0b\x00\x00uj\xa9\n\x00\x00K\thEj\xca\n\x00\x00uK }\x94(j\xbd\n'
+ b'\x00\x00h\xd7j\xbe\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x02in\x94j\xc2'
+ b'\n\x00\x00]\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c\x05"in"i\x94hEjH'
+ b'\x0b\x00\x00uj\xa9\n\x00\x00K\thEj\xca\n\x00\x00uK!}\x94(j\xbd\n\x00'
+ b'\x00h\xbbj\xbe\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x04leap\x94j'
+ b'\xc2\n\x00\x00]\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c\x07"leap"i\x94h'
+ b'EjH\x0b\x00\x00uj\xa9\n\x00\x00K\thEj\xca\n\x00\x00uK"}\x94(j\xbd\n\x00\x00'
+ b'h\xdaj\xbe\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x03mod\x94j\xc2\n'
+ b'\x00\x00]\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c\x06"mod"i\x94hEjH'
+ b'\x0b\x00\x00uj\xa9\n\x00\x00K\thEj\xca\n\x00\x00uK#}\x94(j\xbd\n\x00'
+ b'\x00h\xdcj\xbe\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x04same\x94j'
+ b'\xc2\n\x00\x00]\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c\x07"same"i\x94h'
+ b'EjH\x0b\x00\x00uj\xa9\n\x00\x00K\thEj\xca\n\x00\x00uK$}\x94(j\xbd\n\x00\x00'
+ b'h\xd3j\xbe\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x02as\x94j\xc2\n\x00'
+ b'\x00]\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c\x05"as"i\x94hEjH\x0b\x00'
+ b'\x00uj\xa9\n\x00\x00K\thEj\xca\n\x00\x00uK%}\x94(j\xbd\n\x00\x00h'
+ b'\xddj\xbe\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x03the\x94j\xc2\n\x00'
+ b'\x00]\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c\x06"the"i\x94hEjH\x0b'
+ b'\x00\x00uj\xa9\n\x00\x00K\thEj\xca\n\x00\x00uK&}\x94(j\xbd\n\x00\x00'
+ b'h\xb0j\xbe\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x06before\x94j\xc2\n\x00'
+ b'\x00]\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c\t"before"i\x94hEjH\x0b\x00'
+ b"\x00uj\xa9\n\x00\x00K\thEj\xca\n\x00\x00uK'}\x94(j\xbd\n\x00\x00h"
+ b'\xacj\xbe\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x05after\x94j\xc2\n\x00\x00]'
+ b'\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c\x08"after"i\x94hEjH\x0b\x00\x00uj'
+ b'\xa9\n\x00\x00K\thEj\xca\n\x00\x00uK(}\x94(j\xbd\n\x00\x00h\xdej\xbe'
+ b'\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x04year\x94j\xc2\n\x00\x00]\x94j\xc4\n'
+ b'\x00\x00aj\xc5\n\x00\x00\x8c\x07"year"i\x94hEjH\x0b\x00\x00uj\xa9'
+ b'\n\x00\x00K\thEj\xca\n\x00\x00uK)}\x94(j\xbd\n\x00\x00h\xb1j\xbe\n'
+ b'\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x05days?\x94j\xc2\n\x00\x00]\x94j\xc4\n'
+ b'\x00\x00aj\xc5\n\x00\x00\x8c\x08/days?/i\x94j\xc7\n\x00\x00]\x94(K'
+ b'\x03K\x04ehEj\xc9\n\x00\x00uj\xa9\n\x00\x00K\thEj\xca\n\x00\x00uK*}\x94('
+ b'j\xbd\n\x00\x00h\xd2j\xbe\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x06weeks?'
+ b'\x94j\xc2\n\x00\x00]\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c\t/weeks?/i\x94j'
+ b'\xc7\n\x00\x00]\x94(K\x04K\x05ehEj\xc9\n\x00\x00uj\xa9\n\x00\x00K\th'
+ b'Ej\xca\n\x00\x00uK+}\x94(j\xbd\n\x00\x00h\xc2j\xbe\n\x00\x00}\x94(j'
+ b'\xc0\n\x00\x00\x8c\x03not\x94j\xc2\n\x00\x00]\x94j\xc4\n\x00\x00aj'
+ b'\xc5\n\x00\x00\x8c\x06"not"i\x94hEjH\x0b\x00\x00uj\xa9\n\x00\x00K\thEj\xca'
+ b'\n\x00\x00uK,}\x94(j\xbd\n\x00\x00h\xccj\xbe\n\x00\x00}\x94(j\xc0\n\x00'
+ b"\x00\x8c'[2-9]?(1st|2nd|3rd|([4-90]th))|1[0-9]th\x94j\xc2\n\x00\x00"
+ b']\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c*/[2-9]?(1st|2nd|3rd|([4-90]th))|1'
+ b'[0-9]th/i\x94j\xc7\n\x00\x00]\x94(K\x03K\x04ehEj\xc9\n\x00\x00uj'
+ b'\xa9\n\x00\x00K\thEj\xca\n\x00\x00uK-}\x94(j\xbd\n\x00\x00h\xc0j\xbe'
+ b'\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x1c[a-zA-Z]([-_.]?[a-zA-Z0-9])'
+ b'*\x94j\xc2\n\x00\x00]\x94j\xc5\n\x00\x00\x8c\x1e/[a-zA-Z]([-_.]?[a-zA-Z0'
+ b'-9])*/\x94j\xc7\n\x00\x00]\x94(K\x01\x8a\t\x00\x00\x00\x00\x00'
+ b'\x00\x00\x00\x01ehEj\xc9\n\x00\x00uj\xa9\n\x00\x00K\x00hEj\xca\n\x00\x00u'
+ b'K.}\x94(j\xbd\n\x00\x00h\xc4j\xbe\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x06['
+ b'0-9]+\x94j\xc2\n\x00\x00]\x94j\xc5\n\x00\x00\x8c\x08/[0-9]+/\x94j\xc7\n'
+ b'\x00\x00]\x94(K\x01\x8a\t\x00\x00\x00\x00\x00\x00\x00\x00\x01ehEj\xc9\n'
+ b'\x00\x00uj\xa9\n\x00\x00K\x00hEj\xca\n\x00\x00uK/}\x94(j\xbd\n\x00\x00'
+ b'h@j\xbe\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x07[ \t\n\r]+\x94j\xc2\n'
+ b'\x00\x00]\x94j\xc5\n\x00\x00\x8c\x0c/[ \\t\\n\\r]+/\x94j\xc7\n\x00'
+ b'\x00]\x94(K\x01\x8a\t\x00\x00\x00\x00\x00\x00\x00\x00\x01ehEj\xc9\n\x00'
+ b'\x00uj\xa9\n\x00\x00K\x00hEj\xca\n\x00\x00uK0}\x94(j\xbd\n\x00\x00h'
+ b'\xbcj\xbe\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x01(\x94j\xc2\n\x00\x00]'
+ b'\x94j\xc5\n\x00\x00\x8c\x03"("\x94hEjH\x0b\x00\x00uj\xa9\n\x00\x00K\x00h'
+ b'Ej\xca\n\x00\x00uK1}\x94(j\xbd\n\x00\x00h\xc7j\xbe\n\x00\x00}\x94(j'
+ b'\xc0\n\x00\x00\x8c\x01)\x94j\xc2\n\x00\x00]\x94j\xc5\n\x00\x00\x8c\x03")'
+ b'"\x94hEjH\x0b\x00\x00uj\xa9\n\x00\x00K\x00hEj\xca\n\x00\x00uK2}\x94(j\xbd'
+ b'\n\x00\x00h\xc6j\xbe\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x02or\x94j'
+ b'\xc2\n\x00\x00]\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c\x05"or"i\x94hEj'
+ b'H\x0b\x00\x00uj\xa9\n\x00\x00K\x00hEj\xca\n\x00\x00uK3}\x94(j\xbd\n'
+ b'\x00\x00h\xadj\xbe\n\x00\x00}\x94(j\xc0\n\x00\x00\x8c\x03and\x94j'
+ b'\xc2\n\x00\x00]\x94j\xc4\n\x00\x00aj\xc5\n\x00\x00\x8c\x06"and"i\x94hE'
+ b'jH\x0b\x00\x00uj\xa9\n\x00\x00K\x00hEj\xca\n\x00\x00uK4}\x94(\x8c\x06orig'
+ b'in\x94}\x94(j\xbd\n\x00\x00h\xa4hE\x8c\x0bNonTerminal\x94u\x8c\texpansio'
+ b'n\x94]\x94(}\x94(j\xbd\n\x00\x00h\xechEj\xe9\x0b\x00\x00u}\x94(j\xbd'
+ b'\n\x00\x00h\xd6\x8c\nfilter_out\x94\x88hE\x8c\x08Terminal\x94u}\x94('
+ b'j\xbd\n\x00\x00h\xe0hEj\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xd4j\xee\x0b'
+ b'\x00\x00\x88hEj\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xa4hEj'
+ b'\xe9\x0b\x00\x00ue\x8c\x05order\x94K\x00\x8c\x05alias\x94Nj\x9d\n'
+ b'\x00\x00}\x94(j\xa1\n\x00\x00\x89\x8c\x07expand1\x94\x89j\xa9\n\x00\x00N'
+ b'\x8c\x0ftemplate_source\x94N\x8c\rempty_indices\x94)hE\x8c\x0bRuleOpti'
+ b'ons\x94uhE\x8c\x04Rule\x94uK5}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00'
+ b'\x00h\xa4hEj\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n'
+ b'\x00\x00h\xechEj\xe9\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x01j\xf4\x0b\x00'
+ b'\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9'
+ b'\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00\x89\x88\x88\x87\x94hEj\xf9'
+ b'\x0b\x00\x00uhEj\xfa\x0b\x00\x00uK6}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n'
+ b'\x00\x00h\xechEj\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd'
+ b'\n\x00\x00h\xe6hEj\xe9\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x00j\xf4\x0b'
+ b'\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j'
+ b'\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj'
+ b'\xfa\x0b\x00\x00uK7}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xechEj'
+ b'\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xf2hE'
+ b'j\xe9\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x01j\xf4\x0b\x00\x00Nj\x9d\n\x00'
+ b'\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00Nj\xf7'
+ b'\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00uK8'
+ b'}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xechEj\xe9\x0b\x00\x00uj\xea'
+ b'\x0b\x00\x00]\x94(}\x94(j\xbd\n\x00\x00h\xbcj\xee\x0b\x00\x00\x88hE'
+ b'j\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xa4hEj\xe9\x0b\x00\x00u}\x94(j'
+ b'\xbd\n\x00\x00h\xc7j\xee\x0b\x00\x00\x88hEj\xef\x0b\x00\x00uej\xf3\x0b'
+ b'\x00\x00K\x02j\xf4\x0b\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89'
+ b'j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)'
+ b'hEj\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00uK9}\x94(j\xe7\x0b\x00\x00}\x94'
+ b'(j\xbd\n\x00\x00h\xechEj\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd'
+ b'\n\x00\x00h\xe2hEj\xe9\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x03j\xf4\x0b'
+ b'\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j'
+ b'\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj'
+ b'\xfa\x0b\x00\x00uK:}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xechEj'
+ b'\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xc1j\xee'
+ b'\x0b\x00\x00\x89hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x04j\xf4\x0b\x00'
+ b'\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9'
+ b'\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa'
+ b'\x0b\x00\x00uK;}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xechEj\xe9'
+ b'\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xc0j\xee\x0b'
+ b'\x00\x00\x89hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x05j\xf4\x0b\x00\x00'
+ b'Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9\n'
+ b'\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uh'
+ b'Ej\xfa\x0b\x00\x00uK<}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe6h'
+ b'Ej\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94(}\x94(j\xbd\n\x00\x00h'
+ b'\xc4j\xee\x0b\x00\x00\x89hEj\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xefhEj'
+ b'\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xeahEj\xe9\x0b\x00\x00u}\x94(j\xbd'
+ b'\n\x00\x00h\xechEj\xe9\x0b\x00\x00uej\xf3\x0b\x00\x00K\x00j\xf4\x0b'
+ b'\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j'
+ b'\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj'
+ b'\xfa\x0b\x00\x00uK=}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xf2hEj'
+ b'\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xe9hE'
+ b'j\xe9\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x00j\xf4\x0b\x00\x00Nj\x9d\n\x00'
+ b'\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00Nj\xf7'
+ b'\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00uK>'
+ b'}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xf2hEj\xe9\x0b\x00\x00uj\xea'
+ b'\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xf0hEj\xe9\x0b\x00\x00ua'
+ b'j\xf3\x0b\x00\x00K\x01j\xf4\x0b\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n'
+ b'\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00'
+ b'Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00uK?}\x94('
+ b'j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xf2hEj\xe9\x0b\x00\x00uj'
+ b'\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xe3hEj\xe9\x0b\x00\x00u'
+ b'aj\xf3\x0b\x00\x00K\x02j\xf4\x0b\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1'
+ b'\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8'
+ b'\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00uK@}\x94(j\xe7\x0b'
+ b'\x00\x00}\x94(j\xbd\n\x00\x00h\xf0hEj\xe9\x0b\x00\x00uj\xea\x0b\x00'
+ b'\x00]\x94(}\x94(j\xbd\n\x00\x00h\xddj\xee\x0b\x00\x00\x88hEj\xef'
+ b'\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xe8hEj\xe9\x0b\x00\x00u}\x94(j\xbd\n'
+ b'\x00\x00h\xf1hEj\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xc2j\xee'
+ b'\x0b\x00\x00\x89hEj\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xeahE'
+ b'j\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xechEj\xe9\x0b\x00\x00uej\xf3\x0b'
+ b'\x00\x00K\x00j\xf4\x0b\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89'
+ b'j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)'
+ b'hEj\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00uKA}\x94(j\xe7\x0b\x00\x00}\x94'
+ b'(j\xbd\n\x00\x00h\xf0hEj\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94(}\x94(j'
+ b'\xbd\n\x00\x00h\xddj\xee\x0b\x00\x00\x88hEj\xef\x0b\x00\x00u}\x94(j'
+ b'\xbd\n\x00\x00h\xe8hEj\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xf1hEj\xe9'
+ b'\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xeahEj\xe9\x0b\x00\x00u}\x94(j\xbd\n'
+ b'\x00\x00h\xechEj\xe9\x0b\x00\x00uej\xf3\x0b\x00\x00K\x01j\xf4\x0b\x00'
+ b'\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9'
+ b'\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00(\x89\x89\x89\x88'
+ b'\x89\x89t\x94hEj\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00uKB}\x94(j\xe7\x0b'
+ b'\x00\x00}\x94(j\xbd\n\x00\x00h\xf0hEj\xe9\x0b\x00\x00uj\xea\x0b\x00'
+ b'\x00]\x94(}\x94(j\xbd\n\x00\x00h\xddj\xee\x0b\x00\x00\x88hEj\xef'
+ b'\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xf1hEj\xe9\x0b\x00\x00u}\x94(j\xbd\n'
+ b'\x00\x00h\xc2j\xee\x0b\x00\x00\x89hEj\xef\x0b\x00\x00u}\x94(j\xbd\n'
+ b'\x00\x00h\xeahEj\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xechEj\xe9\x0b\x00'
+ b'\x00uej\xf3\x0b\x00\x00K\x02j\xf4\x0b\x00\x00Nj\x9d\n\x00\x00}\x94('
+ b'j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00N'
+ b'j\xf8\x0b\x00\x00(\x89\x88\x89\x89\x89\x89t\x94hEj\xf9\x0b\x00\x00uhE'
+ b'j\xfa\x0b\x00\x00uKC}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xf0hE'
+ b'j\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94(}\x94(j\xbd\n\x00\x00h\xdd'
+ b'j\xee\x0b\x00\x00\x88hEj\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xf1hEj\xe9'
+ b'\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xeahEj\xe9\x0b\x00\x00u}\x94(j\xbd\n'
+ b'\x00\x00h\xechEj\xe9\x0b\x00\x00uej\xf3\x0b\x00\x00K\x03j\xf4\x0b\x00'
+ b'\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9'
+ b'\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00(\x89\x88\x89\x88'
+ b'\x89\x89t\x94hEj\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00uKD}\x94(j\xe7\x0b'
+ b'\x00\x00}\x94(j\xbd\n\x00\x00h\xf0hEj\xe9\x0b\x00\x00uj\xea\x0b\x00'
+ b'\x00]\x94(}\x94(j\xbd\n\x00\x00h\xe8hEj\xe9\x0b\x00\x00u}\x94(j\xbd\n'
+ b'\x00\x00h\xf1hEj\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xc2j\xee'
+ b'\x0b\x00\x00\x89hEj\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xeahE'
+ b'j\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xechEj\xe9\x0b\x00\x00uej\xf3\x0b'
+ b'\x00\x00K\x04j\xf4\x0b\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89'
+ b'j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)'
+ b'hEj\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00uKE}\x94(j\xe7\x0b\x00\x00}\x94'
+ b'(j\xbd\n\x00\x00h\xf0hEj\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94(}\x94(j'
+ b'\xbd\n\x00\x00h\xe8hEj\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xf1hEj\xe9'
+ b'\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xeahEj\xe9\x0b\x00\x00u}\x94(j\xbd\n'
+ b'\x00\x00h\xechEj\xe9\x0b\x00\x00uej\xf3\x0b\x00\x00K\x05j\xf4\x0b\x00'
+ b'\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9'
+ b'\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00(\x89\x89\x88\x89\x89t\x94h'
+ b'Ej\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00uKF}\x94(j\xe7\x0b\x00\x00}\x94('
+ b'j\xbd\n\x00\x00h\xf0hEj\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94(}\x94(j\xbd'
+ b'\n\x00\x00h\xf1hEj\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xc2j'
+ b'\xee\x0b\x00\x00\x89hEj\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xeah'
+ b'Ej\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xechEj\xe9\x0b\x00\x00uej\xf3'
+ b'\x0b\x00\x00K\x06j\xf4\x0b\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00'
+ b'\x89j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj'
+ b'\xf8\x0b\x00\x00(\x88\x89\x89\x89\x89t\x94hEj\xf9\x0b\x00\x00uhEj\xfa'
+ b'\x0b\x00\x00uKG}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xf0hEj\xe9'
+ b'\x0b\x00\x00uj\xea\x0b\x00\x00]\x94(}\x94(j\xbd\n\x00\x00h\xf1hE'
+ b'j\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xeahEj\xe9\x0b\x00\x00u}\x94(j'
+ b'\xbd\n\x00\x00h\xechEj\xe9\x0b\x00\x00uej\xf3\x0b\x00\x00K\x07j\xf4'
+ b'\x0b\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89'
+ b'j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00(\x88\x89\x88\x89\x89t'
+ b'\x94hEj\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00uKH}\x94(j\xe7\x0b\x00\x00}'
+ b'\x94(j\xbd\n\x00\x00h\xe9hEj\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94(}\x94('
+ b'j\xbd\n\x00\x00h\xddj\xee\x0b\x00\x00\x88hEj\xef\x0b\x00\x00u}\x94('
+ b'j\xbd\n\x00\x00h\xe8hEj\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xf1hEj'
+ b'\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xe5hEj\xe9\x0b\x00\x00ue'
+ b'j\xf3\x0b\x00\x00K\x00j\xf4\x0b\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n'
+ b'\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00'
+ b'Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00uKI}\x94('
+ b'j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe9hEj\xe9\x0b\x00\x00uj'
+ b'\xea\x0b\x00\x00]\x94(}\x94(j\xbd\n\x00\x00h\xe8hEj\xe9\x0b\x00\x00u}\x94('
+ b'j\xbd\n\x00\x00h\xf1hEj\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xe5hEj'
+ b'\xe9\x0b\x00\x00uej\xf3\x0b\x00\x00K\x01j\xf4\x0b\x00\x00Nj\x9d\n\x00\x00'
+ b'}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00Nj\xf7\x0b'
+ b'\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00uKJ}'
+ b'\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe3hEj\xe9\x0b\x00\x00'
+ b'uj\xea\x0b\x00\x00]\x94(}\x94(j\xbd\n\x00\x00h\xddj\xee\x0b\x00\x00\x88hEj'
+ b'\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xd9j\xee\x0b\x00\x00\x88hEj'
+ b'\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xf1hEj\xe9\x0b\x00\x00u}\x94(j\xbd'
+ b'\n\x00\x00h\xe5hEj\xe9\x0b\x00\x00uej\xf3\x0b\x00\x00K\x00j\xf4\x0b'
+ b'\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j'
+ b'\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj'
+ b'\xfa\x0b\x00\x00uKK}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe3hEj'
+ b'\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94(}\x94(j\xbd\n\x00\x00h\xd9j'
+ b'\xee\x0b\x00\x00\x88hEj\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xf1h'
+ b'Ej\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xe5hEj\xe9\x0b\x00\x00uej\xf3'
+ b'\x0b\x00\x00K\x01j\xf4\x0b\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00'
+ b'\x89j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj'
+ b'\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00uKL}\x94(j\xe7'
+ b'\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe5hEj\xe9\x0b\x00\x00uj\xea\x0b'
+ b'\x00\x00]\x94(}\x94(j\xbd\n\x00\x00h\xdbj\xee\x0b\x00\x00\x88hEj'
+ b'\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xe4hEj\xe9\x0b\x00\x00ue'
+ b'j\xf3\x0b\x00\x00K\x00j\xf4\x0b\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n'
+ b'\x00\x00\x89j\xf6\x0b\x00\x00\x88j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00'
+ b'Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00uKM}\x94('
+ b'j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xeahEj\xe9\x0b\x00\x00uj'
+ b'\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xb0j\xee\x0b\x00\x00\x89hE'
+ b'j\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x00j\xf4\x0b\x00\x00Nj\x9d\n\x00'
+ b'\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00Nj\xf7'
+ b'\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00uKN'
+ b'}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xeahEj\xe9\x0b\x00\x00uj\xea'
+ b'\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xacj\xee\x0b\x00\x00\x89hEj'
+ b'\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x01j\xf4\x0b\x00\x00Nj\x9d\n\x00\x00'
+ b'}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00Nj\xf7\x0b'
+ b'\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00uKO}'
+ b'\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xefhEj\xe9\x0b\x00\x00'
+ b'uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xb1j\xee\x0b\x00\x00\x89'
+ b'hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x00j\xf4\x0b\x00\x00Nj\x9d'
+ b'\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x88j\xa9\n\x00\x00N'
+ b'j\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa'
+ b'\x0b\x00\x00uKP}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xefhEj\xe9'
+ b'\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xd2j\xee\x0b'
+ b'\x00\x00\x89hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x01j\xf4\x0b\x00\x00'
+ b'Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x88j\xa9\n'
+ b'\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uh'
+ b'Ej\xfa\x0b\x00\x00uKQ}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe2h'
+ b'Ej\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94(}\x94(j\xbd\n\x00\x00h\xe4hEj'
+ b'\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xc4j\xee\x0b\x00\x00\x89hEj'
+ b'\xef\x0b\x00\x00uej\xf3\x0b\x00\x00K\x00j\xf4\x0b\x00\x00Nj\x9d\n\x00\x00'
+ b'}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00Nj\xf7\x0b'
+ b'\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00uKR}'
+ b'\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xf1hEj\xe9\x0b\x00\x00'
+ b'uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xbfj\xee\x0b\x00\x00\x89'
+ b'hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x00j\xf4\x0b\x00\x00Nj\x9d'
+ b'\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00N'
+ b'j\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa'
+ b'\x0b\x00\x00uKS}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xf1hEj\xe9'
+ b'\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xd0j\xee\x0b'
+ b'\x00\x00\x89hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x01j\xf4\x0b\x00\x00'
+ b'Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9\n'
+ b'\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uh'
+ b'Ej\xfa\x0b\x00\x00uKT}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xf1h'
+ b'Ej\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xd1'
+ b'j\xee\x0b\x00\x00\x89hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x02j\xf4'
+ b'\x0b\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89'
+ b'j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhE'
+ b'j\xfa\x0b\x00\x00uKU}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xf1hE'
+ b'j\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xcej'
+ b'\xee\x0b\x00\x00\x89hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x03j\xf4\x0b'
+ b'\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j'
+ b'\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj'
+ b'\xfa\x0b\x00\x00uKV}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xf1hEj'
+ b'\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xb7j\xee'
+ b'\x0b\x00\x00\x89hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x04j\xf4\x0b\x00'
+ b'\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9'
+ b'\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa'
+ b'\x0b\x00\x00uKW}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xf1hEj\xe9'
+ b'\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xc8j\xee\x0b'
+ b'\x00\x00\x89hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x05j\xf4\x0b\x00\x00'
+ b'Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9\n'
+ b'\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uh'
+ b'Ej\xfa\x0b\x00\x00uKX}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xf1h'
+ b'Ej\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xcb'
+ b'j\xee\x0b\x00\x00\x89hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x06j\xf4'
+ b'\x0b\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89'
+ b'j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhE'
+ b'j\xfa\x0b\x00\x00uKY}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe4hE'
+ b'j\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xb8j'
+ b'\xee\x0b\x00\x00\x89hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x00j\xf4\x0b'
+ b'\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j'
+ b'\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj'
+ b'\xfa\x0b\x00\x00uKZ}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe4hEj'
+ b'\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xb4j\xee'
+ b'\x0b\x00\x00\x89hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x01j\xf4\x0b\x00'
+ b'\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9'
+ b'\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa'
+ b'\x0b\x00\x00uK[}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe4hEj\xe9'
+ b'\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xbdj\xee\x0b'
+ b'\x00\x00\x89hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x02j\xf4\x0b\x00\x00'
+ b'Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9\n'
+ b'\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uh'
+ b'Ej\xfa\x0b\x00\x00uK\\}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe4h'
+ b'Ej\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xae'
+ b'j\xee\x0b\x00\x00\x89hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x03j\xf4'
+ b'\x0b\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89'
+ b'j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhE'
+ b'j\xfa\x0b\x00\x00uK]}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe4hE'
+ b'j\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xbej'
+ b'\xee\x0b\x00\x00\x89hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x04j\xf4\x0b'
+ b'\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j'
+ b'\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj'
+ b'\xfa\x0b\x00\x00uK^}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe4hEj'
+ b'\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xbaj\xee'
+ b'\x0b\x00\x00\x89hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x05j\xf4\x0b\x00'
+ b'\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9'
+ b'\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa'
+ b'\x0b\x00\x00uK_}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe4hEj\xe9'
+ b'\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xb9j\xee\x0b'
+ b'\x00\x00\x89hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x06j\xf4\x0b\x00\x00'
+ b'Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9\n'
+ b'\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uh'
+ b'Ej\xfa\x0b\x00\x00uK`}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe4h'
+ b'Ej\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xaf'
+ b'j\xee\x0b\x00\x00\x89hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x07j\xf4'
+ b'\x0b\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89'
+ b'j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhE'
+ b'j\xfa\x0b\x00\x00uKa}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe4hE'
+ b'j\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xcaj'
+ b'\xee\x0b\x00\x00\x89hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x08j\xf4\x0b'
+ b'\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j'
+ b'\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj'
+ b'\xfa\x0b\x00\x00uKb}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe4hEj'
+ b'\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xc5j\xee'
+ b'\x0b\x00\x00\x89hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\tj\xf4\x0b\x00'
+ b'\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9'
+ b'\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa'
+ b'\x0b\x00\x00uKc}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe4hEj\xe9'
+ b'\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xc3j\xee\x0b'
+ b'\x00\x00\x89hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\nj\xf4\x0b\x00\x00'
+ b'Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9\n'
+ b'\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uh'
+ b'Ej\xfa\x0b\x00\x00uKd}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe4h'
+ b'Ej\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xb2'
+ b'j\xee\x0b\x00\x00\x89hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x0bj\xf4'
+ b'\x0b\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89'
+ b'j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhE'
+ b'j\xfa\x0b\x00\x00uKe}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe0hE'
+ b'j\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xe7h'
+ b'Ej\xe9\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x00j\xf4\x0b\x00\x00Nj\x9d\n'
+ b'\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00Nj'
+ b'\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa\x0b'
+ b'\x00\x00uKf}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe7hEj\xe9\x0b'
+ b'\x00\x00uj\xea\x0b\x00\x00]\x94(}\x94(j\xbd\n\x00\x00h\xdfhEj'
+ b'\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xc6j\xee\x0b\x00\x00\x88hEj'
+ b'\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xe7hEj\xe9\x0b\x00\x00ue'
+ b'j\xf3\x0b\x00\x00K\x00j\xf4\x0b\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n'
+ b'\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00'
+ b'Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00uKg}\x94('
+ b'j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe7hEj\xe9\x0b\x00\x00uj'
+ b'\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xdfhEj\xe9\x0b\x00\x00u'
+ b'aj\xf3\x0b\x00\x00K\x01j\xf4\x0b\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1'
+ b'\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8'
+ b'\x0b\x00\x00\x89\x88\x86\x94hEj\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00uK'
+ b'h}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xdfhEj\xe9\x0b\x00\x00uj'
+ b'\xea\x0b\x00\x00]\x94(}\x94(j\xbd\n\x00\x00h\xeehEj\xe9\x0b\x00\x00u}\x94('
+ b'j\xbd\n\x00\x00h\xadj\xee\x0b\x00\x00\x88hEj\xef\x0b\x00\x00u}\x94('
+ b'j\xbd\n\x00\x00h\xdfhEj\xe9\x0b\x00\x00uej\xf3\x0b\x00\x00K\x00j'
+ b'\xf4\x0b\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00'
+ b'\x89j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b'
+ b'\x00\x00uhEj\xfa\x0b\x00\x00uKi}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00'
+ b'\x00h\xdfhEj\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n'
+ b'\x00\x00h\xeehEj\xe9\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x01j\xf4\x0b\x00'
+ b'\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9'
+ b'\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00\x89\x88\x86\x94hEj\xf9\x0b'
+ b'\x00\x00uhEj\xfa\x0b\x00\x00uKj}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00'
+ b'\x00h\xeehEj\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n'
+ b'\x00\x00h\xedhEj\xe9\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x00j\xf4\x0b\x00'
+ b'\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9'
+ b'\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa'
+ b'\x0b\x00\x00uKk}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xeehEj\xe9'
+ b'\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xf5hEj'
+ b'\xe9\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x01j\xf4\x0b\x00\x00Nj\x9d\n\x00\x00'
+ b'}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00Nj\xf7\x0b'
+ b'\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00uKl}'
+ b'\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xeehEj\xe9\x0b\x00\x00'
+ b'uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xcfj\xee\x0b\x00\x00\x89'
+ b'hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x02j\xf4\x0b\x00\x00Nj\x9d'
+ b'\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00N'
+ b'j\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa'
+ b'\x0b\x00\x00uKm}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xeehEj\xe9'
+ b'\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xb3j\xee\x0b'
+ b'\x00\x00\x89hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x03j\xf4\x0b\x00\x00'
+ b'Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9\n'
+ b'\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uh'
+ b'Ej\xfa\x0b\x00\x00uKn}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xedh'
+ b'Ej\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94(}\x94(j\xbd\n\x00\x00h\xebhEj'
+ b'\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xd5j\xee\x0b\x00\x00\x88hEj'
+ b'\xef\x0b\x00\x00uej\xf3\x0b\x00\x00K\x00j\xf4\x0b\x00\x00\x8c\x0fexist_co'
+ b'ndition\x94j\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x88'
+ b'j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhE'
+ b'j\xfa\x0b\x00\x00uKo}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xedhE'
+ b'j\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94(}\x94(j\xbd\n\x00\x00h\xebhEj\xe9'
+ b'\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xc2j\xee\x0b\x00\x00\x89hEj\xef'
+ b'\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xd7j\xee\x0b\x00\x00\x88hEj\xef'
+ b'\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xe4hEj\xe9\x0b\x00\x00uej'
+ b'\xf3\x0b\x00\x00K\x01j\xf4\x0b\x00\x00\x8c\x0fmonth_condition\x94j\x9d\n'
+ b'\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x88j\xa9\n\x00\x00Nj'
+ b'\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa\x0b'
+ b'\x00\x00uKp}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xedhEj\xe9\x0b'
+ b'\x00\x00uj\xea\x0b\x00\x00]\x94(}\x94(j\xbd\n\x00\x00h\xebhEj'
+ b'\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xd7j\xee\x0b\x00\x00\x88hEj'
+ b'\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xe4hEj\xe9\x0b\x00\x00ue'
+ b'j\xf3\x0b\x00\x00K\x02j\xf4\x0b\x00\x00j`\r\x00\x00j\x9d\n\x00\x00}\x94'
+ b'(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x88j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00'
+ b'Nj\xf8\x0b\x00\x00(\x89\x88\x89\x89t\x94hEj\xf9\x0b\x00\x00uhEj'
+ b'\xfa\x0b\x00\x00uKq}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xedhEj'
+ b'\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94(}\x94(j\xbd\n\x00\x00h\xebh'
+ b'Ej\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xd8j\xee\x0b\x00\x00\x88h'
+ b'Ej\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xc2j\xee\x0b\x00\x00\x89h'
+ b'Ej\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xf1hEj\xe9\x0b\x00\x00uej\xf3'
+ b'\x0b\x00\x00K\x03j\xf4\x0b\x00\x00\x8c\x0cwd_condition\x94j\x9d\n'
+ b'\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x88j\xa9\n\x00\x00Nj'
+ b'\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa\x0b'
+ b'\x00\x00uKr}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xedhEj\xe9\x0b'
+ b'\x00\x00uj\xea\x0b\x00\x00]\x94(}\x94(j\xbd\n\x00\x00h\xebhEj'
+ b'\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xd8j\xee\x0b\x00\x00\x88hEj'
+ b'\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xc2j\xee\x0b\x00\x00\x89hEj'
+ b'\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xc1j\xee\x0b\x00\x00\x89hEj'
+ b'\xef\x0b\x00\x00uej\xf3\x0b\x00\x00K\x04j\xf4\x0b\x00\x00jq\r\x00\x00j'
+ b'\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x88j\xa9\n\x00\x00'
+ b'Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj'
+ b'\xfa\x0b\x00\x00uKs}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xedhEj'
+ b'\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94(}\x94(j\xbd\n\x00\x00h\xebh'
+ b'Ej\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xd8j\xee\x0b\x00\x00\x88h'
+ b'Ej\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xf1hEj\xe9\x0b\x00\x00uej\xf3'
+ b'\x0b\x00\x00K\x05j\xf4\x0b\x00\x00jq\r\x00\x00j\x9d\n\x00\x00}\x94(j'
+ b'\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x88j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj'
+ b'\xf8\x0b\x00\x00(\x89\x89\x88\x89t\x94hEj\xf9\x0b\x00\x00uhEj\xfa\x0b'
+ b'\x00\x00uKt}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xedhEj\xe9\x0b'
+ b'\x00\x00uj\xea\x0b\x00\x00]\x94(}\x94(j\xbd\n\x00\x00h\xebhEj'
+ b'\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xd8j\xee\x0b\x00\x00\x88hEj'
+ b'\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xc1j\xee\x0b\x00\x00\x89hEj'
+ b'\xef\x0b\x00\x00uej\xf3\x0b\x00\x00K\x06j\xf4\x0b\x00\x00jq\r\x00\x00j'
+ b'\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x88j\xa9\n\x00\x00'
+ b'Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00(\x89\x89\x88\x89t\x94hEj\xf9\x0b'
+ b'\x00\x00uhEj\xfa\x0b\x00\x00uKu}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00'
+ b'\x00h\xedhEj\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94(}\x94(j\xbd\n\x00\x00h'
+ b'\xebhEj\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xd8j\xee\x0b\x00\x00\x88hEj'
+ b'\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xc2j\xee\x0b\x00\x00\x89hEj'
+ b'\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xdcj\xee\x0b\x00\x00\x88hEj'
+ b'\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xd3j\xee\x0b\x00\x00\x88hEj'
+ b'\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xebhEj\xe9\x0b\x00\x00ue'
+ b'j\xf3\x0b\x00\x00K\x07j\xf4\x0b\x00\x00\x8c\x10day_eq_condition\x94j'
+ b'\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x88j\xa9\n\x00\x00'
+ b'Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj'
+ b'\xfa\x0b\x00\x00uKv}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xedhEj'
+ b'\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94(}\x94(j\xbd\n\x00\x00h\xebh'
+ b'Ej\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xd8j\xee\x0b\x00\x00\x88h'
+ b'Ej\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xdcj\xee\x0b\x00\x00\x88h'
+ b'Ej\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xd3j\xee\x0b\x00\x00\x88h'
+ b'Ej\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xebhEj\xe9\x0b\x00\x00uej\xf3'
+ b'\x0b\x00\x00K\x08j\xf4\x0b\x00\x00j\x94\r\x00\x00j\x9d\n\x00\x00}\x94(j'
+ b'\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x88j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj'
+ b'\xf8\x0b\x00\x00(\x89\x89\x88\x89\x89\x89t\x94hEj\xf9\x0b\x00\x00uhEj'
+ b'\xfa\x0b\x00\x00uKw}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xedhEj'
+ b'\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94(}\x94(j\xbd\n\x00\x00h\xebh'
+ b'Ej\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xd8j\xee\x0b\x00\x00\x88h'
+ b'Ej\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xc2j\xee\x0b\x00\x00\x89h'
+ b'Ej\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xeahEj\xe9\x0b\x00\x00u}\x94('
+ b'j\xbd\n\x00\x00h\xebhEj\xe9\x0b\x00\x00uej\xf3\x0b\x00\x00K\tj'
+ b'\xf4\x0b\x00\x00\x8c\x12day_prep_condition\x94j\x9d\n\x00\x00}\x94(j\xa1\n'
+ b'\x00\x00\x89j\xf6\x0b\x00\x00\x88j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00'
+ b'Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00uKx}\x94('
+ b'j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xedhEj\xe9\x0b\x00\x00uj'
+ b'\xea\x0b\x00\x00]\x94(}\x94(j\xbd\n\x00\x00h\xebhEj\xe9\x0b\x00\x00u}\x94('
+ b'j\xbd\n\x00\x00h\xd8j\xee\x0b\x00\x00\x88hEj\xef\x0b\x00\x00u}\x94('
+ b'j\xbd\n\x00\x00h\xeahEj\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xebhEj'
+ b'\xe9\x0b\x00\x00uej\xf3\x0b\x00\x00K\nj\xf4\x0b\x00\x00j\xa8\r\x00\x00j'
+ b'\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x88j\xa9\n\x00\x00'
+ b'Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00(\x89\x89\x88\x89\x89t\x94hEj\xf9'
+ b'\x0b\x00\x00uhEj\xfa\x0b\x00\x00uKy}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n'
+ b'\x00\x00h\xebhEj\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd'
+ b'\n\x00\x00h\xechEj\xe9\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x00j\xf4\x0b'
+ b'\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x88j'
+ b'\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj'
+ b'\xfa\x0b\x00\x00uKz}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xf5hEj'
+ b'\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94(}\x94(j\xbd\n\x00\x00h\xdej'
+ b'\xee\x0b\x00\x00\x88hEj\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xf6h'
+ b'Ej\xe9\x0b\x00\x00uej\xf3\x0b\x00\x00K\x00j\xf4\x0b\x00\x00Nj\x9d\n'
+ b'\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00Nj'
+ b'\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa\x0b'
+ b'\x00\x00uK{}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xf6hEj\xe9\x0b'
+ b'\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xf4hEj\xe9'
+ b'\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x00j\xf4\x0b\x00\x00Nj\x9d\n\x00\x00}'
+ b'\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00Nj\xf7\x0b\x00'
+ b'\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00uK|}\x94'
+ b'(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xf6hEj\xe9\x0b\x00\x00u'
+ b'j\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xf3hEj\xe9\x0b\x00\x00uaj\xf3'
+ b'\x0b\x00\x00K\x01j\xf4\x0b\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00'
+ b'\x89j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj'
+ b'\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00uK}}\x94(j\xe7'
+ b'\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xf4hEj\xe9\x0b\x00\x00uj\xea\x0b'
+ b'\x00\x00]\x94(}\x94(j\xbd\n\x00\x00h\xd8j\xee\x0b\x00\x00\x88hEj'
+ b'\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xc2j\xee\x0b\x00\x00\x89hEj'
+ b'\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xe1hEj\xe9\x0b\x00\x00ue'
+ b'j\xf3\x0b\x00\x00K\x00j\xf4\x0b\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n'
+ b'\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00'
+ b'Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00uK~}\x94('
+ b'j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xf4hEj\xe9\x0b\x00\x00uj'
+ b'\xea\x0b\x00\x00]\x94(}\x94(j\xbd\n\x00\x00h\xd8j\xee\x0b\x00\x00\x88h'
+ b'Ej\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xe1hEj\xe9\x0b\x00\x00uej\xf3'
+ b'\x0b\x00\x00K\x01j\xf4\x0b\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00'
+ b'\x89j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj'
+ b'\xf8\x0b\x00\x00\x89\x88\x89\x87\x94hEj\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00'
+ b'uK\x7f}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xf3hEj\xe9\x0b\x00\x00'
+ b'uj\xea\x0b\x00\x00]\x94(}\x94(j\xbd\n\x00\x00h\xd8j\xee\x0b\x00\x00\x88hEj'
+ b'\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xc2j\xee\x0b\x00\x00\x89hEj'
+ b'\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xeahEj\xe9\x0b\x00\x00u}\x94(j\xbd'
+ b'\n\x00\x00h\xc4j\xee\x0b\x00\x00\x89hEj\xef\x0b\x00\x00uej\xf3\x0b\x00'
+ b'\x00K\x00j\xf4\x0b\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j'
+ b'\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)h'
+ b'Ej\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00uK\x80}\x94(j\xe7\x0b\x00\x00}\x94('
+ b'j\xbd\n\x00\x00h\xf3hEj\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94(}\x94(j\xbd'
+ b'\n\x00\x00h\xd8j\xee\x0b\x00\x00\x88hEj\xef\x0b\x00\x00u}\x94(j\xbd'
+ b'\n\x00\x00h\xeahEj\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xc4j'
+ b'\xee\x0b\x00\x00\x89hEj\xef\x0b\x00\x00uej\xf3\x0b\x00\x00K\x01j\xf4\x0b'
+ b'\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j'
+ b'\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00(\x89\x88\x89\x89t\x94h'
+ b'Ej\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00uK\x81}\x94(j\xe7\x0b\x00\x00}\x94('
+ b'j\xbd\n\x00\x00h\xf3hEj\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94(}\x94(j\xbd'
+ b'\n\x00\x00h\xc2j\xee\x0b\x00\x00\x89hEj\xef\x0b\x00\x00u}\x94(j\xbd'
+ b'\n\x00\x00h\xeahEj\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xc4j'
+ b'\xee\x0b\x00\x00\x89hEj\xef\x0b\x00\x00uej\xf3\x0b\x00\x00K\x02j\xf4\x0b'
+ b'\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j'
+ b'\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj'
+ b'\xfa\x0b\x00\x00uK\x82}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xf3hEj'
+ b'\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94(}\x94(j\xbd\n\x00\x00h\xeah'
+ b'Ej\xe9\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xc4j\xee\x0b\x00\x00\x89h'
+ b'Ej\xef\x0b\x00\x00uej\xf3\x0b\x00\x00K\x03j\xf4\x0b\x00\x00Nj\x9d\n'
+ b'\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00Nj'
+ b'\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00\x88\x89\x89\x87\x94hEj\xf9\x0b\x00\x00uh'
+ b'Ej\xfa\x0b\x00\x00uK\x83}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe1h'
+ b'Ej\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xbb'
+ b'j\xee\x0b\x00\x00\x89hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x00j\xf4'
+ b'\x0b\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89'
+ b'j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhE'
+ b'j\xfa\x0b\x00\x00uK\x84}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe1hE'
+ b'j\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94(}\x94(j\xbd\n\x00\x00h\xc4'
+ b'j\xee\x0b\x00\x00\x89hEj\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xda'
+ b'j\xee\x0b\x00\x00\x88hEj\xef\x0b\x00\x00u}\x94(j\xbd\n\x00\x00h\xc4'
+ b'j\xee\x0b\x00\x00\x89hEj\xef\x0b\x00\x00uej\xf3\x0b\x00\x00K\x01j\xf4'
+ b'\x0b\x00\x00\x8c\tymod_cond\x94j\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00'
+ b'\x89j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj'
+ b'\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa\x0b\x00\x00uK\x85}\x94(j\xe7'
+ b'\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe1hEj\xe9\x0b\x00\x00uj\xea\x0b'
+ b'\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xc4j\xee\x0b\x00\x00\x89hEj\xef'
+ b'\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x02j\xf4\x0b\x00\x00j\xff\r\x00\x00j\x9d'
+ b'\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x89j\xa9\n\x00\x00N'
+ b'j\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00\x89\x88\x86\x94hEj\xf9\x0b\x00\x00uh'
+ b'Ej\xfa\x0b\x00\x00uK\x86}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe8h'
+ b'Ej\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xb5'
+ b'j\xee\x0b\x00\x00\x89hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x00j\xf4'
+ b'\x0b\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x88'
+ b'j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhE'
+ b'j\xfa\x0b\x00\x00uK\x87}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe8hE'
+ b'j\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xc9j'
+ b'\xee\x0b\x00\x00\x89hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x01j\xf4\x0b'
+ b'\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x88j'
+ b'\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj'
+ b'\xfa\x0b\x00\x00uK\x88}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe8hEj'
+ b'\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xcdj\xee'
+ b'\x0b\x00\x00\x89hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x02j\xf4\x0b\x00'
+ b'\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x88j\xa9'
+ b'\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhEj\xfa'
+ b'\x0b\x00\x00uK\x89}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe8hEj\xe9'
+ b'\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xb6j\xee\x0b'
+ b'\x00\x00\x89hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x03j\xf4\x0b\x00\x00'
+ b'Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x88j\xa9\n'
+ b'\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uh'
+ b'Ej\xfa\x0b\x00\x00uK\x8a}\x94(j\xe7\x0b\x00\x00}\x94(j\xbd\n\x00\x00h\xe8h'
+ b'Ej\xe9\x0b\x00\x00uj\xea\x0b\x00\x00]\x94}\x94(j\xbd\n\x00\x00h\xcc'
+ b'j\xee\x0b\x00\x00\x89hEj\xef\x0b\x00\x00uaj\xf3\x0b\x00\x00K\x04j\xf4'
+ b'\x0b\x00\x00Nj\x9d\n\x00\x00}\x94(j\xa1\n\x00\x00\x89j\xf6\x0b\x00\x00\x88'
+ b'j\xa9\n\x00\x00Nj\xf7\x0b\x00\x00Nj\xf8\x0b\x00\x00)hEj\xf9\x0b\x00\x00uhE'
+ b'j\xfa\x0b\x00\x00uuu.')
@@ -0,0 +1,318 @@
+"""Evaluate rules from asyncio applications.
+
+Evaluating a rule involves parsing its expression and computing
+dates, which would block the event loop. An :class:`AsyncEvaluator`
+hands this work to an executor instead:
+
+* concurrent requests for the same rule and year are coalesced,
+  such that the rule is evaluated once for all of them;
+* the requests waiting at the same time are grouped by rule, and
+  each rule is evaluated for all its requested years in a single
+  task of the executor;
+* the requests are queued in a bounded queue and only a limited
+  number of tasks is submitted to the executor at a time. Under load,
+  requests wait for a free place in the queue, hence latency grows
+  while the event loop stays responsive.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import datetime
+import functools
+from collections.abc import Mapping, Sequence
+from concurrent.futures import Executor
+from types import TracebackType
+
+from .decorators import DateFunction
+from .registry import LazyDates
+from .ruleparser import CompiledRule, evaluate_rule
+
+__all__ = ['AsyncEvaluator']
+
+_Request = tuple[str | CompiledRule, int]
+_Key = tuple[str | int, int]
+
+
+class AsyncEvaluator:
+    """Evaluate rules without blocking the event loop.
+
+    The evaluator starts working when it is first awaited, and
+    belongs to the event loop running at that time. It should be
+    closed by :meth:`aclose`, or used as an asynchronous context
+    manager.
+
+    Parameters
+    ----------
+    date_functions : Mapping[str, DateFunction] | None
+        the date functions which may be referenced by the rules,
+        e.g. a :py:class:`annual.registry.FunctionRegistry`
+        (optional, default = no functions)
+    executor : Executor | None
+        the executor evaluating the rules; a process pool requires
+        picklable date functions, such as a dictionary of module level
+        functions, whereas a
+        :py:class:`annual.registry.FunctionRegistry` cannot be pickled
+        (optional, default = the default executor of the event loop)
+    max_pending : int
+        the maximum number of distinct requests waiting to be
+        evaluated (optional, default = ``1024``)
+    max_batch : int
+        the maximum number of requests taken from the queue at once
+        (optional, default = ``256``)
+    max_tasks : int
+        the maximum number of tasks submitted to the executor at a
+        time (optional, default = ``4``)
+    batch_delay : float
+        the number of seconds to wait for further requests before
+        a batch is submitted (optional, default = ``0.0``)
+
+    Example
+    -------
+    >>> import asyncio
+    >>> from annual.aio import AsyncEvaluator
+    >>> async def main():
+    ...     async with AsyncEvaluator() as evaluator:
+    ...         return await asyncio.gather(
+    ...             evaluator.evaluate('last mon of may', 2024),
+    ...             evaluator.evaluate('last mon of may', 2025),
+    ...         )
+    >>> asyncio.run(main())
+    [datetime.date(2024, 5, 27), datetime.date(2025, 5, 26)]
+    """
+
+    def __init__(
+        self,
+        date_functions: Mapping[str, DateFunction] | None = None,
+        executor: Executor | None = None,
+        max_pending: int = 1024,
+        max_batch: int = 256,
+        max_tasks: int = 4,
+        batch_delay: float = 0.0,
+    ) -> None:
+        self._date_functions: Mapping[str, DateFunction] = (
+            date_functions if date_functions is not None else {}
+        )
+        self._executor = executor
+        self._max_batch = max_batch
+        self._max_tasks = max_tasks
+        self._batch_delay = batch_delay
+        self._queue: asyncio.Queue[_Request] = asyncio.Queue(max_pending)
+        self._futures: dict[_Key, asyncio.Future[datetime.date | None]] = {}
+        self._waiters: dict[asyncio.Future[datetime.date | None], int] = {}
+        self._puts: dict[
+            asyncio.Future[datetime.date | None],
+            asyncio.Task[None],
+        ] = {}
+        self._dispatcher: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> AsyncEvaluator:
+        """Enter the context."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the evaluator when leaving the context."""
+        await self.aclose()
+
+    async def evaluate(
+        self,
+        rule: str | CompiledRule,
+        year: int,
+    ) -> datetime.date | None:
+        """Evaluate a rule for a given year.
+
+        Errors of the evaluation propagate to all callers waiting for
+        the same rule and year, e.g.
+        :py:exc:`lark.exceptions.UnexpectedInput` if the rule
+        expression is syntactically wrong.
+
+        Parameters
+        ----------
+        rule : str | CompiledRule
+            the rule, either as expression or compiled
+        year : int
+            the year for which the rule is evaluated
+
+        Return
+        ------
+        datetime.date | None
+            the date the rule evaluates to, if any
+
+        Raises
+        ------
+        RuntimeError
+            if the evaluator has stopped dispatching requests
+            due to an error
+        """
+        if self._dispatcher is not None and self._dispatcher.done():
+            raise RuntimeError('The evaluator has stopped due to an error')
+        key = (_rule_key(rule), year)
+        future = self._futures.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._futures[key] = future
+            if self._dispatcher is None:
+                self._dispatcher = asyncio.create_task(self._dispatch())
+                self._dispatcher.add_done_callback(self._stopped)
+            # The request is queued on behalf of all its callers, such
+            # that cancelling the first caller does not affect the others.
+            put = asyncio.create_task(self._queue.put((rule, year)))
+            put.add_done_callback(functools.partial(self._queued, future))
+            self._puts[future] = put
+        self._waiters[future] = self._waiters.get(future, 0) + 1
+        try:
+            return await asyncio.shield(future)
+        finally:
+            self._leave(key, future)
+
+    async def aclose(self) -> None:
+        """Stop evaluating and cancel all pending requests."""
+        dispatcher, self._dispatcher = self._dispatcher, None
+        if dispatcher is not None and not dispatcher.done():
+            dispatcher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await dispatcher
+        for put in self._puts.values():
+            put.cancel()
+        self._puts.clear()
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+
+    async def _dispatch(self) -> None:
+        """Submit batches of queued requests to the executor."""
+        loop = asyncio.get_running_loop()
+        tasks = asyncio.Semaphore(self._max_tasks)
+        while True:
+            requests = [await self._queue.get()]
+            if self._batch_delay > 0:
+                await asyncio.sleep(self._batch_delay)
+            while len(requests) < self._max_batch and not self._queue.empty():
+                requests.append(self._queue.get_nowait())
+            batches: dict[str | int, tuple[str | CompiledRule, list[int]]] = {}
+            for rule, year in requests:
+                batches.setdefault(_rule_key(rule), (rule, []))[1].append(year)
+            for rule_key, (rule, years) in batches.items():
+                await tasks.acquire()
+                try:
+                    task = loop.run_in_executor(
+                        self._executor,
+                        _evaluate_batch,
+                        rule,
+                        years,
+                        self._date_functions,
+                    )
+                except Exception as error:
+                    tasks.release()
+                    self._reject(rule_key, years, error)
+                    continue
+                task.add_done_callback(
+                    functools.partial(self._resolve, rule_key, years, tasks),
+                )
+
+    def _queued(
+        self,
+        future: asyncio.Future[datetime.date | None],
+        put: asyncio.Task[None],
+    ) -> None:
+        """Forget the queueing of a request once it is finished."""
+        if self._puts.get(future) is put:
+            del self._puts[future]
+
+    def _leave(
+        self,
+        key: _Key,
+        future: asyncio.Future[datetime.date | None],
+    ) -> None:
+        """Withdraw a request which is no longer awaited by anybody."""
+        self._waiters[future] -= 1
+        if self._waiters[future]:
+            return
+        del self._waiters[future]
+        put = self._puts.pop(future, None)
+        if put is None or put.done():
+            return
+        put.cancel()
+        if self._futures.get(key) is future:
+            del self._futures[key]
+        future.cancel()
+
+    def _stopped(self, dispatcher: asyncio.Task[None]) -> None:
+        """Fail all pending requests if the dispatcher has crashed."""
+        if dispatcher.cancelled() or dispatcher.exception() is None:
+            return
+        error = RuntimeError('The evaluator has stopped due to an error')
+        error.__cause__ = dispatcher.exception()
+        for future in self._futures.values():
+            if not future.done():
+                future.set_exception(error)
+        self._futures.clear()
+
+    def _reject(
+        self,
+        rule_key: str | int,
+        years: list[int],
+        error: Exception,
+    ) -> None:
+        """Fail the requests of a batch which could not be submitted."""
+        for year in years:
+            future = self._futures.pop((rule_key, year), None)
+            if future is not None and not future.done():
+                future.set_exception(error)
+
+    def _resolve(
+        self,
+        rule_key: str | int,
+        years: list[int],
+        tasks: asyncio.Semaphore,
+        task: asyncio.Future[list[datetime.date | None]],
+    ) -> None:
+        """Pass the results of a batch to the waiting requests."""
+        tasks.release()
+        futures = [
+            self._futures.pop((rule_key, year), None) for year in years
+        ]
+        error = None if task.cancelled() else task.exception()
+        for index, future in enumerate(futures):
+            if future is None or future.done():
+                continue
+            if task.cancelled():
+                future.cancel()
+            elif error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(task.result()[index])
+
+
+def _rule_key(rule: str | CompiledRule) -> str | int:
+    """Identify the requests of a rule.
+
+    Compiled rules are distinguished by identity, since rules with
+    the same expression may differ, e.g. if one of them has been
+    specialized by :func:`annual.ruleoptimizer.simplify_rule`.
+    """
+    return rule if isinstance(rule, str) else id(rule)
+
+
+def _evaluate_batch(
+    rule: str | CompiledRule,
+    years: Sequence[int],
+    date_functions: Mapping[str, DateFunction],
+) -> list[datetime.date | None]:
+    """Evaluate a rule for several years, in the executor."""
+    if isinstance(rule, str):
+        return [
+            evaluate_rule(rule, year, LazyDates(date_functions, year))
+            for year in years
+        ]
+    return [
+        rule.evaluate(year, LazyDates(date_functions, year)) for year in years
+    ]
@@ -0,0 +1,231 @@
+"""Calendars of named rules materialized over a range of years.
+
+A :class:`Calendar` evaluates a set of named rules once for every
+year of a range and keeps the resulting dates in a compact sorted
+index. Queries such as "is this date a holiday?" or "which is the
+next holiday?" are answered by binary search, without evaluating
+any rule again.
+"""
+
+from __future__ import annotations
+
+import datetime
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator, Mapping
+
+from .datecalc import NEVER
+from .decorators import DateFunction
+from .ruleoptimizer import simplify_rule
+from .ruleparser import CompiledRule, compile_rule
+from .ruleset import RuleSet
+
+__all__ = ['Calendar']
+
+
+class Calendar:
+    """Named rules evaluated over a range of years.
+
+    Parameters
+    ----------
+    rules : Mapping[str, str | CompiledRule]
+        the rules by name, either as expressions or compiled;
+        rules may refer to each other as in a
+        :py:class:`annual.ruleset.RuleSet`
+    years : range
+        the years for which the rules are evaluated
+    date_functions : Mapping[str, DateFunction] | None
+        the date functions which may be referenced by the rules,
+        e.g. a :py:class:`annual.registry.FunctionRegistry`
+        (optional, default = no functions)
+
+    Example
+    -------
+    >>> from annual.calendars import Calendar
+    >>> cal = Calendar(
+    ...     {'May Day': 'may 1', 'Spring Bank Holiday': 'last mon of may'},
+    ...     range(2024, 2026),
+    ... )
+    >>> cal.next(datetime.date(2024, 5, 2))
+    ('Spring Bank Holiday', datetime.date(2024, 5, 27))
+    >>> datetime.date(2025, 5, 1) in cal
+    True
+    """
+
+    def __init__(
+        self,
+        rules: Mapping[str, str | CompiledRule],
+        years: range,
+        date_functions: Mapping[str, DateFunction] | None = None,
+    ) -> None:
+        self._years = years
+        self._names: tuple[str, ...] = tuple(rules)
+        specialized = {
+            name: simplify_rule(
+                rule if isinstance(rule, CompiledRule) else compile_rule(rule),
+                years,
+            )
+            for name, rule in rules.items()
+        }
+        results = RuleSet(specialized, date_functions).evaluate_range(
+            years.start,
+            years.stop,
+        )
+        entries: list[tuple[int, int]] = []
+        for name_id, name in enumerate(self._names):
+            entries.extend(
+                (ordinal, name_id)
+                for ordinal in results[name]
+                if ordinal != NEVER
+            )
+        entries.sort()
+        self._ordinals = array('i', (ordinal for ordinal, _ in entries))
+        self._name_ids = array('I', (name_id for _, name_id in entries))
+
+    def __contains__(self, day: object) -> bool:
+        """Check whether any rule falls on the given date."""
+        if not isinstance(day, datetime.date):
+            return False
+        ordinal = day.toordinal()
+        index = bisect_left(self._ordinals, ordinal)
+        return index < len(self._ordinals) and (
+            self._ordinals[index] == ordinal
+        )
+
+    def __iter__(self) -> Iterator[tuple[str, datetime.date]]:
+        """Iterate over all occurrences in chronological order."""
+        return self._slice(0, len(self._ordinals))
+
+    def __len__(self) -> int:
+        """Return the number of occurrences."""
+        return len(self._ordinals)
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Return the names of the rules."""
+        return self._names
+
+    @property
+    def years(self) -> range:
+        """Return the years for which the rules have been evaluated."""
+        return self._years
+
+    def names_on(self, day: datetime.date) -> list[str]:
+        """List the names of the rules falling on the given date.
+
+        Parameters
+        ----------
+        day : datetime.date
+            the date to be looked up
+
+        Return
+        ------
+        list[str]
+            the names, in the order in which the rules were given
+        """
+        ordinal = day.toordinal()
+        return [
+            name
+            for name, _ in self._slice(
+                bisect_left(self._ordinals, ordinal),
+                bisect_right(self._ordinals, ordinal),
+            )
+        ]
+
+    def next(
+        self,
+        day: datetime.date,
+        inclusive: bool = False,
+    ) -> tuple[str, datetime.date] | None:
+        """Find the first occurrence after the given date.
+
+        Parameters
+        ----------
+        day : datetime.date
+            the date after which to search
+        inclusive : bool
+            determines whether an occurrence on ``day`` itself is found
+            (optional, default = ``False``)
+
+        Return
+        ------
+        tuple[str, datetime.date] | None
+            the name and date of the occurrence, or ``None`` if
+            there is none within the years of the calendar
+        """
+        ordinal = day.toordinal()
+        search = bisect_left if inclusive else bisect_right
+        index = search(self._ordinals, ordinal)
+        if index >= len(self._ordinals):
+            return None
+        return self._entry(index)
+
+    def previous(
+        self,
+        day: datetime.date,
+        inclusive: bool = False,
+    ) -> tuple[str, datetime.date] | None:
+        """Find the last occurrence before the given date.
+
+        Parameters
+        ----------
+        day : datetime.date
+            the date before which to search
+        inclusive : bool
+            determines whether an occurrence on ``day`` itself is found
+            (optional, default = ``False``)
+
+        Return
+        ------
+        tuple[str, datetime.date] | None
+            the name and date of the occurrence, or ``None`` if
+            there is none within the years of the calendar
+        """
+        ordinal = day.toordinal()
+        search = bisect_right if inclusive else bisect_left
+        index = search(self._ordinals, ordinal) - 1
+        if index < 0:
+            return None
+        return self._entry(index)
+
+    def between(
+        self,
+        start: datetime.date,
+        end: datetime.date,
+    ) -> list[tuple[str, datetime.date]]:
+        """List the occurrences from ``start`` up to, excluding, ``end``.
+
+        Parameters
+        ----------
+        start : datetime.date
+            the first date of the period
+        end : datetime.date
+            the date after the last date of the period
+
+        Return
+        ------
+        list[tuple[str, datetime.date]]
+            the names and dates of the occurrences in chronological order
+        """
+        return list(
+            self._slice(
+                bisect_left(self._ordinals, start.toordinal()),
+                bisect_left(self._ordinals, end.toordinal()),
+            ),
+        )
+
+    def _entry(self, index: int) -> tuple[str, datetime.date]:
+        """Return name and date of the entry at the given index."""
+        return (
+            self._names[self._name_ids[index]],
+            datetime.date.fromordinal(self._ordinals[index]),
+        )
+
+    def _slice(
+        self,
+        start: int,
+        stop: int,
+    ) -> Iterator[tuple[str, datetime.date]]:
+        """Iterate over the entries in an index range."""
+        for index in range(start, stop):
+            yield self._entry(index)
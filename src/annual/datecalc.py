@@ -1,18 +1,260 @@
-"""Date calculations for the parser."""
+"""Date calculations for the parser.
+
+The calculations are implemented on day ordinals, i.e. proleptic
+Gregorian day numbers as returned by :py:meth:`datetime.date.toordinal`,
+which are plain integers. Since day 1 (January 1st of year 1) is
+a Monday, the weekday of a day ordinal is ``(day + 6) % 7``.
+Months and weekdays are passed as the numbers of
+:py:class:`annual.model.Month` and :py:class:`annual.model.WeekDay`.
+
+The functions taking and returning :py:class:`datetime.date` objects
+are thin wrappers around this ordinal core.
+
+Since the Gregorian calendar repeats every 400 years, which is exactly
+146097 days or 20871 weeks, the first days, weekdays and lengths of
+all months are precomputed for one cycle. Hence, the functions on
+months are answered by a single table lookup.
+"""
 
 from __future__ import annotations
 
+import calendar
 import datetime
+from array import array
+from typing import Final
 
 from .model import Month, WeekDay
 
 __all__ = [
+    'DAYS_BEFORE_MONTH',
+    'DAYS_IN_MONTH',
+    'NEVER',
     'days_relative_to',
     'last_wd_of_month',
+    'month_length',
+    'month_start',
+    'month_start_weekday',
+    'ordinal_last_wd_of_month',
+    'ordinal_wd_of_month',
+    'ordinal_wd_relative_to',
+    'ordinal_weekday',
     'wd_of_month',
     'wd_relative_to',
+    'year_start',
 ]
 
+NEVER: Final = 0
+"""Day ordinal representing a date which does not occur.
+
+Valid day ordinals as returned by :py:meth:`datetime.date.toordinal`
+start at 1, hence 0 is never a valid date.
+"""
+
+DAYS_IN_MONTH: Final = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+"""Number of days of the months of a common year, January first."""
+
+DAYS_BEFORE_MONTH: Final = tuple(
+    sum(DAYS_IN_MONTH[:month]) for month in range(12)
+)
+"""Number of days before the months of a common year, January first."""
+
+
+_CYCLE_YEARS: Final = 400
+"""Number of years after which the Gregorian calendar repeats."""
+
+_CYCLE_DAYS: Final = 146097
+"""Number of days of a Gregorian cycle."""
+
+
+def _month_tables() -> tuple[array[int], bytes, bytes]:
+    """Compute first days, weekdays and lengths of the months of a cycle.
+
+    The entry for a month of year ``year`` of the first cycle is found
+    at index ``(year - 1) * 12 + month - 1``.
+    """
+    starts: array[int] = array('i')
+    week_days = bytearray()
+    lengths = bytearray()
+    for year in range(1, _CYCLE_YEARS + 1):
+        leap = calendar.isleap(year)
+        for month in range(1, 13):
+            start = year_start(year) + DAYS_BEFORE_MONTH[month - 1]
+            start += leap and month > 2
+            starts.append(start)
+            week_days.append(ordinal_weekday(start))
+            lengths.append(DAYS_IN_MONTH[month - 1] + (leap and month == 2))
+    return starts, bytes(week_days), bytes(lengths)
+
+
+def year_start(year: int) -> int:
+    """Compute the day ordinal of January 1st of a year.
+
+    Parameters
+    ----------
+    year : int
+        the year
+
+    Returns
+    -------
+    int
+        the day ordinal
+
+    Example
+    -------
+    >>> from annual.datecalc import year_start
+    >>> year_start(2024) == datetime.date(2024, 1, 1).toordinal()
+    True
+    """
+    before = year - 1
+    return before * 365 + before // 4 - before // 100 + before // 400 + 1
+
+
+def month_start(year: int, month: int) -> int:
+    """Compute the day ordinal of the first day of a month.
+
+    Parameters
+    ----------
+    year : int
+        the year
+    month : int
+        the number of the month, 1 for January
+
+    Returns
+    -------
+    int
+        the day ordinal
+    """
+    cycle, index = divmod(year - 1, _CYCLE_YEARS)
+    return cycle * _CYCLE_DAYS + _MONTH_STARTS[index * 12 + month - 1]
+
+
+def month_start_weekday(year: int, month: int) -> int:
+    """Compute the weekday of the first day of a month, 0 for Monday.
+
+    Parameters
+    ----------
+    year : int
+        the year
+    month : int
+        the number of the month, 1 for January
+
+    Returns
+    -------
+    int
+        the number of the weekday
+    """
+    return _MONTH_WEEKDAYS[(year - 1) % _CYCLE_YEARS * 12 + month - 1]
+
+
+def month_length(year: int, month: int) -> int:
+    """Compute the number of days of a month.
+
+    Parameters
+    ----------
+    year : int
+        the year
+    month : int
+        the number of the month, 1 for January
+
+    Returns
+    -------
+    int
+        the number of days
+    """
+    return _MONTH_LENGTHS[(year - 1) % _CYCLE_YEARS * 12 + month - 1]
+
+
+def ordinal_weekday(day: int) -> int:
+    """Compute the weekday of a day ordinal, 0 for Monday."""
+    return (day + 6) % 7
+
+
+def ordinal_wd_of_month(
+    year: int,
+    month: int,
+    ordinal: int,
+    week_day: int,
+) -> int:
+    """Compute the n-th occurrence of a weekday in a month.
+
+    This is the day ordinal version of :func:`wd_of_month`.
+
+    Parameters
+    ----------
+    year : int
+        the year
+    month : int
+        the number of the month, 1 for January
+    ordinal : int
+        if set to 1 (resp. 2, 3, ...) the first (second, third, ...)
+        occurrence of the given weekday is computed,
+    week_day : int
+        the number of the weekday, 0 for Monday
+
+    Returns
+    -------
+    int
+        the day ordinal of the requested date, or :data:`NEVER`
+        if no such date exists
+    """
+    cycle, index = divmod(year - 1, _CYCLE_YEARS)
+    index = index * 12 + month - 1
+    offset = (week_day - _MONTH_WEEKDAYS[index]) % 7 + (ordinal - 1) * 7
+    if 0 <= offset < _MONTH_LENGTHS[index]:
+        return cycle * _CYCLE_DAYS + _MONTH_STARTS[index] + offset
+    return NEVER
+
+
+def ordinal_last_wd_of_month(year: int, month: int, week_day: int) -> int:
+    """Compute the last occurrence of a weekday in a month.
+
+    This is the day ordinal version of :func:`last_wd_of_month`.
+    """
+    cycle, index = divmod(year - 1, _CYCLE_YEARS)
+    index = index * 12 + month - 1
+    length = _MONTH_LENGTHS[index]
+    last_week_day = (_MONTH_WEEKDAYS[index] + length - 1) % 7
+    offset = length - 1 - (last_week_day - week_day) % 7
+    return cycle * _CYCLE_DAYS + _MONTH_STARTS[index] + offset
+
+
+def ordinal_wd_relative_to(
+    day: int,
+    week_day: int,
+    direction: int,
+    include_start: bool,
+) -> int:
+    """Compute when a weekday occurs relative to a given day ordinal.
+
+    This is the day ordinal version of :func:`wd_relative_to`.
+
+    Parameters
+    ----------
+    day : int
+        the day ordinal relative to which the result is computed
+    week_day : int
+        the number of the weekday of the target date, 0 for Monday
+    direction : int
+        must be 1 to compute a date after the start date or -1
+        to compute a date before
+    include_start : bool
+        skip one week if the week day of the start date matches
+
+    Returns
+    -------
+    int
+        the day ordinal of the first occurrence of the given weekday
+        before or after the given day
+    """
+    delta = (week_day - day + 1) % 7
+    if delta == 0:
+        if include_start:
+            return day
+        delta = 7 if direction > 0 else -7
+    elif direction < 0:
+        delta -= 7
+    return day + delta
+
 
 def wd_of_month(
     year: int,
@@ -42,12 +284,10 @@ def wd_of_month(
     datetime.date | None
         The requested date, or ``None`` if no such date exists
     """
-    first = datetime.date(year, month.value, 1)
-    offs = (week_day.value - first.weekday() + 7) % 7
-    result = days_relative_to(first, offs + (ordinal - 1) * 7)
-    if result.year == year and result.month == month.value:
-        return result
-    return None
+    day = ordinal_wd_of_month(year, month.value, ordinal, week_day.value)
+    if day == NEVER:
+        return None
+    return datetime.date.fromordinal(day)
 
 
 def last_wd_of_month(
@@ -56,10 +296,9 @@ def last_wd_of_month(
     week_day: WeekDay,
 ) -> datetime.date:
     """Compute the last occurrence of a weekday in a month."""
-    target_year = year + 1 if month == Month.DECEMBER else year
-    target_month = (month.value % 12) + 1
-    first = datetime.date(target_year, target_month, 1)
-    return wd_relative_to(first, week_day, -1, False)
+    return datetime.date.fromordinal(
+        ordinal_last_wd_of_month(year, month.value, week_day.value),
+    )
 
 
 def wd_relative_to(
@@ -88,14 +327,14 @@ def wd_relative_to(
         the first occurrence of the given weekday before or after
         the given date
     """
-    delta = (week_day.value - recurrence.weekday()) % 7
-    if delta == 0:
-        if include_start:
-            return recurrence
-        delta = 7 if direction > 0 else -7
-    elif direction < 0:
-        delta -= 7
-    return days_relative_to(recurrence, delta)
+    return datetime.date.fromordinal(
+        ordinal_wd_relative_to(
+            recurrence.toordinal(),
+            week_day.value,
+            direction,
+            include_start,
+        ),
+    )
 
 
 def days_relative_to(
@@ -116,4 +355,7 @@ def days_relative_to(
     datetime.date
         the `recurrence` date plus the given number of days
     """
-    return recurrence + datetime.timedelta(days=num_days)
+    return datetime.date.fromordinal(recurrence.toordinal() + num_days)
+
+
+_MONTH_STARTS, _MONTH_WEEKDAYS, _MONTH_LENGTHS = _month_tables()
@@ -7,15 +7,16 @@ of generators computing a list of events for a given year.
 """
 
 import datetime
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator, Sequence
 from functools import wraps
 from typing import Callable, TypeAlias, no_type_check
 
 __all__ = [
     'DateFunction',
     'DateIterator',
+    'VectorizedDateFunction',
     'date_function',
-    # 'date_generator',
+    'date_generator',
 ]
 
 MaybeDate: TypeAlias = datetime.date | None
@@ -24,20 +25,37 @@ DateIterator: TypeAlias = Callable[
     [int],
     Iterator[tuple[str, MaybeDate]],
 ]
+VectorizedDateFunction: TypeAlias = Callable[
+    [Sequence[int]],
+    tuple[Iterable[int], Iterable[bool]],
+]
 
 
 def date_function(
     name: str | None = None,
+    vectorized: VectorizedDateFunction | None = None,
 ) -> Callable[[DateFunction], DateFunction]:
     """Mark a date function to be made available in the parser.
 
     The function name is used in the registry if no name is
     passed explicitly.
 
+    A companion implementation computing the dates for many years
+    at once may be passed as ``vectorized``. It takes a sequence
+    of years and returns a pair of the day ordinals (see
+    :py:meth:`datetime.date.toordinal`) and the flags of missing
+    dates, e.g. two lists or two NumPy arrays. Bulk evaluations,
+    such as :py:meth:`annual.registry.FunctionRegistry.evaluate_many`
+    or :py:meth:`annual.ruleset.RuleSet.evaluate_range`, use it
+    instead of calling the function for every year. It is available
+    as the ``vectorized`` attribute of the decorated function.
+
     Parameters
     ----------
     name : str | None
         the name to be used in the registry (optional)
+    vectorized : VectorizedDateFunction | None
+        the batch implementation of the function (optional)
 
     Return
     ------
@@ -55,22 +73,75 @@ def date_function(
 
         if name:
             wrapper.__name__ = name
+        if vectorized is not None:
+            wrapper.vectorized = vectorized  # type: ignore[attr-defined]
         mark_decorator(wrapper, date_function.__name__)
         return wrapper
 
     return decorator_func
 
 
+def date_generator(
+    names: Iterable[str],
+) -> Callable[[DateIterator], DateIterator]:
+    """Mark a generator of several dates per year.
+
+    The generator yields pairs of an event name and its date for
+    a given year. All event names it may yield must be declared,
+    such that the events can be registered as date functions
+    without running the generator. Events which are not yielded
+    for a year have no date in that year.
+
+    Parameters
+    ----------
+    names : Iterable[str]
+        the names of the events, which are available as
+        the ``names`` attribute of the decorated generator
+
+    Return
+    ------
+    Callable[[DateIterator], DateIterator]
+        the actual decorator
+
+    Example
+    -------
+    >>> import datetime
+    >>> from annual.decorators import date_generator
+    >>> @date_generator(['Midsummer Eve', 'Midsummer Day'])
+    ... def midsummer(year):
+    ...     day = datetime.date(year, 6, 24)
+    ...     yield 'Midsummer Eve', day - datetime.timedelta(days=1)
+    ...     yield 'Midsummer Day', day
+    >>> midsummer.names
+    ('Midsummer Eve', 'Midsummer Day')
+    """
+    event_names = tuple(names)
+
+    def decorator_func(date_iter: DateIterator) -> DateIterator:
+        """Add the wrapper."""
+
+        @wraps(date_iter)
+        def wrapper(year: int) -> Iterator[tuple[str, MaybeDate]]:
+            """Wrap the generator."""
+            return date_iter(year)
+
+        wrapper.names = event_names  # type: ignore[attr-defined]
+        mark_decorator(wrapper, date_generator.__name__)
+        return wrapper
+
+    return decorator_func
+
+
 @no_type_check
 def mark_decorator(
-    wrapper: Callable[[int], MaybeDate],
+    wrapper: Callable[[int], object],
     decorator: str,
 ) -> None:
     """Add a ``__decorator__`` attribute to a given ``wrapper`` function.
 
     Parameters
     ----------
-    wrapper : Callable[[int], MaybeDate]
+    wrapper : Callable[[int], object]
         the wrapper function
 
     decorator : str
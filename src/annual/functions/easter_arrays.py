@@ -0,0 +1,216 @@
+"""Easter date calculation for arrays of years.
+
+This module provides NumPy counterparts of the functions in
+:py:mod:`annual.functions.easter_funcs`. They compute the easter
+dates for a whole array of years at once and return masked arrays
+of day ordinals (see :py:meth:`datetime.date.toordinal`), where the
+years to which a method does not apply are masked.
+
+This module requires the optional ``numpy`` dependency,
+which is installed with ``pip install annual[numpy]``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+__all__ = [
+    'easter_array',
+    'easter_julian_array',
+    'easter_orthodox_array',
+    'ordinals_to_datetime64',
+]
+
+YearsLike = Sequence[int] | npt.NDArray[np.integer]
+
+_UNIX_EPOCH_ORDINAL = 719163
+"""Day ordinal of 1970-01-01, the epoch of ``datetime64``."""
+
+
+def easter_array(years: YearsLike) -> np.ma.MaskedArray:
+    """Calculate the easter dates for Western churches.
+
+    This is the array version of
+    :py:func:`annual.functions.easter_funcs.easter`.
+
+    Parameters
+    ----------
+    years : YearsLike
+        the years for which the easter dates are computed
+
+    Return
+    ------
+    np.ma.MaskedArray
+        the day ordinals of the easter dates,
+        years outside the range from 1583 to 4099 are masked
+
+    Example
+    -------
+    >>> from annual.functions.easter_arrays import easter_array
+    >>> ordinals_to_datetime64(easter_array([1582, 2024])).tolist()
+    [None, datetime.date(2024, 3, 31)]
+    """
+    year = np.asarray(years, dtype=np.int64)
+    pfm = paschal_full_moon(year)
+    day = find_next_sunday(year, pfm, True)
+    return _mask_days(year, day, (year < 1583) | (year > 4099))
+
+
+def easter_orthodox_array(years: YearsLike) -> np.ma.MaskedArray:
+    """Calculate the easter dates for Eastern churches.
+
+    This is the array version of
+    :py:func:`annual.functions.easter_funcs.easter_orthodox`.
+
+    Parameters
+    ----------
+    years : YearsLike
+        the years for which the easter dates are computed
+
+    Return
+    ------
+    np.ma.MaskedArray
+        the day ordinals of the easter dates,
+        years outside the range from 1583 to 4099 are masked
+    """
+    year = np.asarray(years, dtype=np.int64)
+    day = find_next_sunday(year, _julian_full_moon(year), False)
+    day += julian_easter_to_gregorian_offset(year)
+    return _mask_days(year, day, (year < 1583) | (year > 4099))
+
+
+def easter_julian_array(years: YearsLike) -> np.ma.MaskedArray:
+    """Calculate the Julian easter dates.
+
+    This is the array version of
+    :py:func:`annual.functions.easter_funcs.easter_julian`.
+
+    Parameters
+    ----------
+    years : YearsLike
+        the years for which the easter dates are computed
+
+    Return
+    ------
+    np.ma.MaskedArray
+        the day ordinals of the easter dates,
+        years before 326 or after 9999 are masked
+    """
+    year = np.asarray(years, dtype=np.int64)
+    day = find_next_sunday(year, _julian_full_moon(year), False)
+    return _mask_days(year, day, (year < 326) | (year > 9999))
+
+
+def ordinals_to_datetime64(ordinals: np.ma.MaskedArray) -> np.ma.MaskedArray:
+    """Convert day ordinals to ``datetime64[D]`` values.
+
+    Parameters
+    ----------
+    ordinals : np.ma.MaskedArray
+        the day ordinals
+
+    Return
+    ------
+    np.ma.MaskedArray
+        the corresponding dates, with the same mask
+    """
+    days = np.ma.asarray(ordinals) - _UNIX_EPOCH_ORDINAL
+    return np.ma.asarray(days.astype('datetime64[D]'))
+
+
+def paschal_full_moon(year: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+    """Calculate Paschal Full Moon (PFM) dates.
+
+    Parameters
+    ----------
+    year : npt.NDArray[np.int64]
+        the years
+
+    Return
+    ------
+    npt.NDArray[np.int64]
+        numbers indicating the PFM dates counting from 20 March
+    """
+    century = year // 100
+    golden = year % 19
+
+    temp = (century - 15) // 2 + 202 - 11 * golden
+    temp -= np.isin(century, (21, 24, 25, 27, 28, 29, 30, 31, 32, 34, 35, 38))
+    temp -= 2 * np.isin(century, (33, 36, 37, 39, 40))
+    temp %= 30
+
+    late = (temp == 29) | ((temp == 28) & (golden > 10))
+    return temp + 21 - late
+
+
+def find_next_sunday(
+    year: npt.NDArray[np.int64],
+    pfm: npt.NDArray[np.int64],
+    is_western: bool,
+) -> npt.NDArray[np.int64]:
+    """Compute the next Sundays after paschal full moon.
+
+    Parameters
+    ----------
+    year : npt.NDArray[np.int64]
+        the years of the resulting dates
+    pfm : npt.NDArray[np.int64]
+        the paschal full moons
+    is_western : bool
+        indicate whether the Western (revised) method is used
+
+    Return
+    ------
+    npt.NDArray[np.int64]
+        the days in March of the Sundays after PFM,
+        where 32 March = 1 April
+    """
+    term_b = (pfm - 19) % 7
+    term_c = (40 - year // 100) % (4 if is_western else 7)
+    if is_western:
+        term_c += term_c == 3
+        term_c += term_c > 1
+    temp = year % 100
+    term_d = (temp + temp // 4) % 7
+    return pfm + ((20 - term_b - term_c - term_d) % 7) + 1
+
+
+def julian_easter_to_gregorian_offset(
+    year: npt.NDArray[np.int64],
+) -> npt.NDArray[np.int64]:
+    """Compute the offsets of Julian easter dates to Gregorian.
+
+    Parameters
+    ----------
+    year : npt.NDArray[np.int64]
+        the years
+
+    Return
+    ------
+    npt.NDArray[np.int64]
+        the numbers of days to add to the Julian dates
+    """
+    century = np.maximum(year // 100 - 16, 0)
+    return 10 + century - century // 4
+
+
+def _julian_full_moon(year: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+    """Compute the paschal full moon of the Julian method."""
+    return ((225 - 11 * (year % 19)) % 30) + 21
+
+
+def _mask_days(
+    year: npt.NDArray[np.int64],
+    day: npt.NDArray[np.int64],
+    invalid: npt.NDArray[np.bool_],
+) -> np.ma.MaskedArray:
+    """Convert days counting from March 1st to masked day ordinals."""
+    before = year - 1
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    march_first = (
+        before * 365 + before // 4 - before // 100 + before // 400 + 60 + leap
+    )
+    return np.ma.masked_array(march_first + day - 1, mask=invalid)
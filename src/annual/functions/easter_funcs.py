@@ -6,16 +6,49 @@ For implementation details see the `GM Arts`_ site on
 easter algorithms.
 
 .. _GM Arts: http://dates.gmarts.org/eastalg.htm
+
+The results for the years up to 4099 are looked up in tables of
+offsets from March 21st, which are computed on first use. Later
+years are computed arithmetically.
 """
 
 import datetime
+import functools
+from collections.abc import Callable, Sequence
+from typing import Final
 
+from ..datecalc import NEVER, month_start
 from ..decorators import date_function
 
 __all__ = ['easter', 'easter_orthodox', 'easter_julian']
 
+_TABLE_LAST_YEAR: Final = 4099
+"""The last year of the easter lookup tables."""
+
+_MARCH_21: Final = 21
+"""The day of March 21st counting from March 1st."""
+
+
+def _easter_ordinals(years: Sequence[int]) -> tuple[list[int], list[bool]]:
+    """Compute the Western easter dates of many years as day ordinals."""
+    return _ordinals(years, _easter_day, 1583, 4099)
+
+
+def _easter_orthodox_ordinals(
+    years: Sequence[int],
+) -> tuple[list[int], list[bool]]:
+    """Compute the Eastern easter dates of many years as day ordinals."""
+    return _ordinals(years, _easter_orthodox_day, 1583, 4099)
 
-@date_function()
+
+def _easter_julian_ordinals(
+    years: Sequence[int],
+) -> tuple[list[int], list[bool]]:
+    """Compute the Julian easter dates of many years as day ordinals."""
+    return _ordinals(years, _easter_julian_day, 326, None)
+
+
+@date_function(vectorized=_easter_ordinals)
 def easter(year: int) -> datetime.date | None:
     """Calculate the easter date for Western churches.
 
@@ -36,13 +69,10 @@ def easter(year: int) -> datetime.date | None:
     """
     if year < 1583 or year > 4099:
         return None
-
-    pfm = paschal_full_moon(year)
-    day = find_next_sunday(year, pfm, True)
-    return easter_day_to_date(year, day)
+    return easter_day_to_date(year, _lookup_day(_easter_day, 1583, year))
 
 
-@date_function()
+@date_function(vectorized=_easter_orthodox_ordinals)
 def easter_orthodox(year: int) -> datetime.date | None:
     """Calculate the easter date for Eastern churches.
 
@@ -63,14 +93,11 @@ def easter_orthodox(year: int) -> datetime.date | None:
     """
     if year < 1583 or year > 4099:
         return None
-    golden = year % 19
-    pfm = ((225 - 11 * golden) % 30) + 21
-    day = find_next_sunday(year, pfm, False)
-    day += julian_easter_to_gregorian_offset(year)
+    day = _lookup_day(_easter_orthodox_day, 1583, year)
     return easter_day_to_date(year, day)
 
 
-@date_function()
+@date_function(vectorized=_easter_julian_ordinals)
 def easter_julian(year: int) -> datetime.date | None:
     """Calculate the Julian easter date.
 
@@ -92,10 +119,75 @@ def easter_julian(year: int) -> datetime.date | None:
     """
     if year < 326:
         return None
+    day = _lookup_day(_easter_julian_day, 326, year)
+    return easter_day_to_date(year, day)
+
+
+def _easter_day(year: int) -> int:
+    """Compute the Western easter day counting from March 1st."""
+    return find_next_sunday(year, paschal_full_moon(year), True)
+
+
+def _easter_orthodox_day(year: int) -> int:
+    """Compute the Eastern easter day counting from March 1st."""
+    day = _easter_julian_day(year)
+    return day + julian_easter_to_gregorian_offset(year)
+
+
+def _easter_julian_day(year: int) -> int:
+    """Compute the Julian easter day counting from March 1st."""
     golden = year % 19
     pfm = ((225 - 11 * golden) % 30) + 21
-    day = find_next_sunday(year, pfm, False)
-    return easter_day_to_date(year, day)
+    return find_next_sunday(year, pfm, False)
+
+
+def _lookup_day(
+    day_func: Callable[[int], int],
+    first_year: int,
+    year: int,
+) -> int:
+    """Look up an easter day, computing it if beyond the table."""
+    if first_year <= year <= _TABLE_LAST_YEAR:
+        table = _easter_table(day_func, first_year)
+        return table[year - first_year] + _MARCH_21
+    return day_func(year)
+
+
+def _ordinals(
+    years: Sequence[int],
+    day_func: Callable[[int], int],
+    first_year: int,
+    last_year: int | None,
+) -> tuple[list[int], list[bool]]:
+    """Compute easter dates as day ordinals without creating dates."""
+    table = _easter_table(day_func, first_year)
+    ordinals: list[int] = []
+    missing: list[bool] = []
+    for year in years:
+        if year < first_year or (last_year is not None and year > last_year):
+            ordinals.append(NEVER)
+            missing.append(True)
+            continue
+        if year <= _TABLE_LAST_YEAR:
+            day = table[year - first_year] + _MARCH_21
+        else:
+            day = day_func(year)
+        ordinals.append(month_start(year, 3) + day - 1)
+        missing.append(False)
+    return ordinals, missing
+
+
+@functools.cache
+def _easter_table(day_func: Callable[[int], int], first_year: int) -> bytes:
+    """Tabulate easter days as offsets from March 21st.
+
+    The table holds one byte per year from ``first_year``
+    up to and including :data:`_TABLE_LAST_YEAR`.
+    """
+    return bytes(
+        day_func(year) - _MARCH_21
+        for year in range(first_year, _TABLE_LAST_YEAR + 1)
+    )
 
 
 def paschal_full_moon(year: int) -> int:
@@ -0,0 +1,275 @@
+"""Evaluate many rules over many years in parallel processes.
+
+The function :func:`evaluate_grid` shards the grid of rules and years
+into tiles, which are evaluated by the worker processes of
+a :py:class:`concurrent.futures.ProcessPoolExecutor`. The compiled
+rules and the results of the date functions over all years are sent
+to every worker once, when the worker is started. The tasks only
+describe the tiles, and the results are returned as compact arrays
+of day ordinals, one :class:`GridChunk` per tile.
+"""
+
+from __future__ import annotations
+
+import datetime
+import math
+import os
+from array import array
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from .datecalc import NEVER
+from .decorators import DateFunction
+from .registry import evaluate_column
+from .ruleoptimizer import simplify_rule
+from .ruleparser import CompiledRule, compile_rule
+from .ruleset import RuleSet
+
+__all__ = ['GridChunk', 'evaluate_grid']
+
+_TILES_PER_WORKER = 4
+"""Number of tiles per worker, such that the load is balanced."""
+
+
+@dataclass(frozen=True)
+class GridChunk:
+    """Results of some rules for a range of years.
+
+    Properties:
+    -----------
+    - names
+        the names of the rules
+    - years
+        the years for which the rules have been evaluated
+    - ordinals
+        the day ordinals of the results, rule by rule, holding
+        one ordinal per year for each rule, where missing results
+        are :data:`annual.datecalc.NEVER`
+    """
+
+    names: tuple[str, ...]
+    years: range
+    ordinals: array[int]
+
+    def column(self, name: str) -> array[int]:
+        """Return the day ordinals of a rule, one per year.
+
+        A :py:exc:`ValueError` propagates if the chunk has
+        no results for the rule.
+
+        Parameters
+        ----------
+        name : str
+            the name of the rule
+
+        Return
+        ------
+        array[int]
+            the day ordinals of the results of the rule
+        """
+        start = self.names.index(name) * len(self.years)
+        return self.ordinals[start:start + len(self.years)]
+
+    def dates(self, name: str) -> list[datetime.date | None]:
+        """Return the dates of a rule, one per year."""
+        return [
+            datetime.date.fromordinal(day) if day != NEVER else None
+            for day in self.column(name)
+        ]
+
+
+def evaluate_grid(
+    rules: Mapping[str, str | CompiledRule],
+    years: range,
+    date_functions: Mapping[str, DateFunction] | None = None,
+    max_workers: int | None = None,
+    rules_per_chunk: int | None = None,
+    years_per_chunk: int | None = None,
+) -> Iterator[GridChunk]:
+    """Evaluate rules over a range of years in parallel processes.
+
+    The rules are compiled and the arguments are checked when this
+    function is called. The worker processes are started when
+    the first chunk is requested. The chunks are returned as soon
+    as they are available, in a fixed order: by the rules in the
+    order given, then by the years.
+    Rules may refer to each other as in
+    a :py:class:`annual.ruleset.RuleSet`, whose
+    :py:exc:`graphlib.CycleError` propagates if rules refer to each
+    other in a cycle.
+
+    Parameters
+    ----------
+    rules : Mapping[str, str | CompiledRule]
+        the rules by name, either as expressions or compiled
+    years : range
+        the years for which the rules are evaluated, with step 1
+    date_functions : Mapping[str, DateFunction] | None
+        the date functions which may be referenced by the rules,
+        e.g. a :py:class:`annual.registry.FunctionRegistry`;
+        they are evaluated in the calling process
+        (optional, default = no functions)
+    max_workers : int | None
+        the number of worker processes
+        (optional, default = the number of processors)
+    rules_per_chunk : int | None
+        the number of rules per chunk (optional, default = as many as
+        needed to give every worker several chunks)
+    years_per_chunk : int | None
+        the number of years per chunk (optional, default = all years,
+        unless there are too few rules to keep all workers busy)
+
+    Return
+    ------
+    Iterator[GridChunk]
+        the results, chunk by chunk
+
+    Raises
+    ------
+    ValueError
+        if the step of ``years`` is not 1
+
+    Example
+    -------
+    >>> from annual.parallel import evaluate_grid
+    >>> chunks = evaluate_grid(
+    ...     {'May Day': 'may 1', 'Spring Bank Holiday': 'last mon of may'},
+    ...     range(2024, 2026),
+    ...     max_workers=2,
+    ...     years_per_chunk=2,
+    ... )
+    >>> for chunk in chunks:
+    ...     print(chunk.names, [day.day for day in chunk.dates(*chunk.names)])
+    ('May Day',) [1, 1]
+    ('Spring Bank Holiday',) [27, 26]
+    """
+    if years.step != 1:
+        raise ValueError(f'Years must be consecutive, not {years!r}')
+    names = tuple(rules)
+    rule_set = RuleSet(
+        {
+            name: simplify_rule(
+                rule if isinstance(rule, CompiledRule) else compile_rule(rule),
+                years,
+            )
+            for name, rule in rules.items()
+        },
+    )
+    date_functions = date_functions if date_functions is not None else {}
+    columns = {
+        name: evaluate_column(date_functions[name], years).ordinals
+        for name in rule_set.function_names
+        if name in date_functions
+    }
+    workers = max_workers or os.cpu_count() or 1
+    tiles = _tiles(
+        len(names),
+        years,
+        rules_per_chunk,
+        years_per_chunk,
+        workers * _TILES_PER_WORKER,
+    )
+    tasks = [
+        (names[rule_slice], tile_years) for rule_slice, tile_years in tiles
+    ]
+    return _evaluate_tiles(rule_set, columns, years, tasks, workers)
+
+
+def _evaluate_tiles(
+    rule_set: RuleSet,
+    columns: Mapping[str, array[int]],
+    years: range,
+    tasks: list[tuple[tuple[str, ...], range]],
+    workers: int,
+) -> Iterator[GridChunk]:
+    """Evaluate the tiles of the grid in worker processes."""
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_start_worker,
+        initargs=(rule_set, columns, years.start),
+    ) as executor:
+        for (tile_names, tile_years), ordinals in zip(
+            tasks,
+            executor.map(_evaluate_tile, tasks),
+        ):
+            yield GridChunk(tile_names, tile_years, ordinals)
+
+
+def _tiles(
+    rule_count: int,
+    years: range,
+    rules_per_chunk: int | None,
+    years_per_chunk: int | None,
+    target: int,
+) -> list[tuple[slice, range]]:
+    """Divide the grid of rules and years into about ``target`` tiles."""
+    if not rule_count or not years:
+        return []
+    if rules_per_chunk is None:
+        rules_per_chunk = math.ceil(rule_count / min(rule_count, target))
+    if years_per_chunk is None:
+        rule_blocks = math.ceil(rule_count / rules_per_chunk)
+        year_blocks = min(len(years), math.ceil(target / rule_blocks))
+        years_per_chunk = math.ceil(len(years) / year_blocks)
+    return [
+        (
+            slice(first_rule, first_rule + rules_per_chunk),
+            years[first_year:first_year + years_per_chunk],
+        )
+        for first_rule in range(0, rule_count, rules_per_chunk)
+        for first_year in range(0, len(years), years_per_chunk)
+    ]
+
+
+class _Worker:
+    """State shared by all tasks of a worker process."""
+
+    def __init__(
+        self,
+        rule_set: RuleSet,
+        columns: Mapping[str, array[int]],
+        first_year: int,
+    ) -> None:
+        self.rule_set = rule_set
+        self.columns = columns
+        self.first_year = first_year
+
+    def evaluate(self, names: tuple[str, ...], years: range) -> array[int]:
+        """Evaluate a tile of the grid."""
+        offset = years.start - self.first_year
+        funcs = {
+            name: column[offset:offset + len(years)]
+            for name, column in self.columns.items()
+        }
+        results = self.rule_set.evaluate_range(
+            years.start,
+            years.stop,
+            funcs,
+            names,
+        )
+        ordinals = array('i')
+        for name in names:
+            ordinals.extend(results[name])
+        return ordinals
+
+
+_worker: _Worker | None = None
+"""State of the current worker process."""
+
+
+def _start_worker(
+    rule_set: RuleSet,
+    columns: Mapping[str, array[int]],
+    first_year: int,
+) -> None:
+    """Receive the rules and date function results in a worker."""
+    global _worker
+    _worker = _Worker(rule_set, columns, first_year)
+
+
+def _evaluate_tile(task: tuple[tuple[str, ...], range]) -> array[int]:
+    """Evaluate a tile of the grid in a worker."""
+    if _worker is None:
+        raise RuntimeError('Worker has not been started')
+    return _worker.evaluate(*task)
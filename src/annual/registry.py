@@ -1,52 +1,139 @@
 """Implementation of a registry for date functions and iterators."""
 
+from __future__ import annotations
+
 import datetime
+import functools
 import importlib
-from collections.abc import Sequence
-from importlib.metadata import entry_points
+import threading
+from array import array
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from dataclasses import dataclass
+from importlib.metadata import EntryPoint, entry_points
 from typing import cast
 
-from .decorators import DateFunction
+from .datecalc import NEVER
+from .decorators import DateFunction, DateIterator
+
+__all__ = ['DateColumn', 'FunctionRegistry', 'LazyDates', 'evaluate_column']
 
-__all__ = ['FunctionRegistry']
+_GENERATOR_CACHE_SIZE = 512
+"""Minimum number of years for which the results of generators are kept."""
 
 
-class FunctionRegistry:
+class FunctionRegistry(Mapping[str, DateFunction]):
     """Registry for date functions and iterators.
 
+    The registry is a read-only mapping between names and
+    date functions.
+
+    Looking up and evaluating date functions is safe from several
+    threads, including the import of lazy plugins. Functions should
+    be added before the registry is shared, though.
+
     Parameters
     ----------
     auto_plugins : bool
         determines whether plugins should be loaded upon initialization
         (optional, default = ``True``)
+    cache_size : int
+        the number of years for which the results of each date function
+        are memoized, where the least recently used years are evicted
+        first; ``0`` disables memoization (optional, default = ``0``)
+    lazy : bool
+        determines whether plugins loaded upon initialization
+        are imported on demand, see :meth:`add_from_plugins`
+        (optional, default = ``False``)
     """
 
-    def __init__(self, auto_plugins: bool = True) -> None:
+    def __init__(
+        self,
+        auto_plugins: bool = True,
+        cache_size: int = 0,
+        lazy: bool = False,
+    ) -> None:
         self._date_functions: dict[str, DateFunction] = {}
+        self._declared_functions: dict[str, EntryPoint] = {}
+        self._pending_modules: list[str] = []
+        self._cache_size = cache_size
+        self._lock = threading.RLock()
         if auto_plugins:
-            self.add_from_plugins()
+            self.add_from_plugins(lazy=lazy)
+
+    def __getitem__(self, name: str) -> DateFunction:
+        """Look up a date function, importing its plugin if necessary."""
+        date_function = self._date_functions.get(name)
+        if date_function is None:
+            date_function = self._resolve(name)
+        if date_function is None:
+            raise KeyError(name)
+        return date_function
+
+    def __contains__(self, name: object) -> bool:
+        """Check for a date function.
+
+        Declared functions of lazy plugins are not imported.
+        """
+        if name in self._date_functions or name in self._declared_functions:
+            return True
+        return isinstance(name, str) and self._resolve(name) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the names of all date functions."""
+        self._resolve_all()
+        return iter(list(self._date_functions))
+
+    def __len__(self) -> int:
+        """Return the number of date functions."""
+        self._resolve_all()
+        return len(self._date_functions)
 
     def add_from_plugins(
         self,
         exclude: Sequence[str] = (),
         only: Sequence[str] = (),
+        lazy: bool = False,
     ) -> None:
         """Add date functions and iterators from plugins.
 
+        Plugins are advertised by entry points in the group ``annual``
+        which name a module. In lazy mode, a plugin module is imported
+        only when one of its functions is requested for the first time.
+
+        A plugin may additionally declare its functions as entry points
+        in the group ``annual.functions``, named after the function and
+        referring to it by ``module:attribute``. The events of a date
+        generator are declared by one entry point per event name,
+        all referring to the generator. In lazy mode, this
+        manifest allows to look up function names without importing
+        any plugin module.
+
         Parameters
         ----------
         exclude : Sequence[str], optional
             list of plugins not to be added
         only : Sequence[str], optional
             list of plugins to be added exclusively
+        lazy : bool, optional
+            determines whether plugin modules are imported on demand
         """
         discovered_plugins = entry_points(group='annual')
+        manifest = entry_points(group='annual.functions') if lazy else ()
         for entry_point in discovered_plugins:
             if entry_point.name in exclude:
                 continue
             if only and entry_point.name not in only:
                 continue
-            self.add_from_module(entry_point.value)
+            if lazy:
+                self._add_lazy_plugin(entry_point.value, manifest)
+            else:
+                self.add_from_module(entry_point.value)
 
     def add_from_module(self, module_name: str) -> None:
         """Add date functions and iterators from a given module.
@@ -63,6 +150,8 @@ class FunctionRegistry:
                 match obj.__decorator__:
                     case 'date_function':
                         self.add_date_function(cast(DateFunction, obj))
+                    case 'date_generator':
+                        self.add_date_generator(cast(DateIterator, obj))
 
     def add_date_function(self, date_function: DateFunction) -> None:
         """Add the given date function.
@@ -72,15 +161,94 @@ class FunctionRegistry:
         date_function: DateFunction
             the date function to be added
         """
-        self._date_functions[date_function.__name__] = date_function
+        self._register(date_function.__name__, date_function)
+
+    def add_date_generator(self, date_generator: DateIterator) -> None:
+        """Add a date function for each event of the given generator.
 
-    def evaluate(self, year: int) -> dict[str, datetime.date | None]:
-        """Evaluate all registered functions for the given year.
+        The generator runs once per year for all its events. Its
+        results are kept for the ``cache_size`` most recently used
+        years, but at least for 512 years.
+
+        Parameters
+        ----------
+        date_generator: DateIterator
+            the date generator to be added, decorated by
+            :py:func:`annual.decorators.date_generator`
+
+        Example
+        -------
+        >>> import datetime
+        >>> from annual.decorators import date_generator
+        >>> from annual.registry import FunctionRegistry
+        >>> @date_generator(['Midsummer Eve', 'Midsummer Day'])
+        ... def midsummer(year):
+        ...     day = datetime.date(year, 6, 24)
+        ...     yield 'Midsummer Eve', day - datetime.timedelta(days=1)
+        ...     yield 'Midsummer Day', day
+        >>> registry = FunctionRegistry(auto_plugins=False)
+        >>> registry.add_date_generator(midsummer)
+        >>> registry['Midsummer Eve'](2024)
+        datetime.date(2024, 6, 23)
+        """
+        names: tuple[str, ...] = (
+            date_generator.names  # type: ignore[attr-defined]
+        )
+
+        @functools.lru_cache(
+            maxsize=max(self._cache_size, _GENERATOR_CACHE_SIZE),
+        )
+        def events(year: int) -> dict[str, datetime.date | None]:
+            """Run the generator for a year."""
+            result: dict[str, datetime.date | None] = dict.fromkeys(names)
+            for name, day in date_generator(year):
+                if name not in result:
+                    raise ValueError(
+                        f'Date generator {date_generator.__name__!r}'
+                        f' yielded undeclared event {name!r}',
+                    )
+                result[name] = day
+            return result
+
+        for name in names:
+            self._register(name, _event_function(events, name))
+
+    def cache_info(self) -> dict[str, functools._CacheInfo]:
+        """Report the memoization statistics per date function.
+
+        Return
+        ------
+        dict[str, functools._CacheInfo]
+            a mapping between function names and their hit and miss
+            counts, which is empty if memoization is disabled
+        """
+        return {
+            name: date_function.cache_info()
+            for name, date_function in self._date_functions.items()
+            if hasattr(date_function, 'cache_info')
+        }
+
+    def cache_clear(self) -> None:
+        """Clear the memoized results of all date functions."""
+        for date_function in self._date_functions.values():
+            if hasattr(date_function, 'cache_clear'):
+                date_function.cache_clear()
+
+    def evaluate(
+        self,
+        year: int,
+        names: Iterable[str] | None = None,
+    ) -> dict[str, datetime.date | None]:
+        """Evaluate the registered functions for the given year.
 
         Parameters
         ----------
         year : int
             the year for which the functions are evaluated
+        names : Iterable[str] | None
+            the names of the functions to be evaluated, such as the
+            :py:attr:`annual.ruleparser.CompiledRule.names` of a rule;
+            unknown names are skipped (optional, default: all functions)
 
         Return
         ------
@@ -88,6 +256,254 @@ class FunctionRegistry:
             a mapping between function names and their results
         """
         result: dict[str, datetime.date | None] = {}
-        for name, date_function in self._date_functions.items():
-            result[name] = date_function(year)
+        for name in self if names is None else names:
+            date_function = self.get(name)
+            if date_function is not None:
+                result[name] = date_function(year)
         return result
+
+    def evaluate_many(
+        self,
+        years: Sequence[int],
+        names: Iterable[str] | None = None,
+    ) -> dict[str, DateColumn]:
+        """Evaluate the registered functions for many years at once.
+
+        The results are returned column by column, see
+        :func:`evaluate_column`, so no date objects are created.
+
+        Parameters
+        ----------
+        years : Sequence[int]
+            the years for which the functions are evaluated,
+            e.g. a :class:`range`
+        names : Iterable[str] | None
+            the names of the functions to be evaluated;
+            unknown names are skipped (optional, default: all functions)
+
+        Return
+        ------
+        dict[str, DateColumn]
+            a mapping between function names and their results
+
+        Example
+        -------
+        >>> from annual.registry import FunctionRegistry
+        >>> registry = FunctionRegistry()
+        >>> columns = registry.evaluate_many(range(1582, 1585), ['easter'])
+        >>> columns['easter'].dates()
+        [None, datetime.date(1583, 4, 10), datetime.date(1584, 4, 1)]
+        """
+        result: dict[str, DateColumn] = {}
+        for name in self if names is None else names:
+            date_function = self.get(name)
+            if date_function is not None:
+                result[name] = evaluate_column(date_function, years)
+        return result
+
+    def evaluate_lazy(self, year: int) -> LazyDates:
+        """Evaluate the registered functions on demand.
+
+        Parameters
+        ----------
+        year : int
+            the year for which the functions are evaluated
+
+        Return
+        ------
+        LazyDates
+            a mapping between function names and their results,
+            which calls each function only when its result is
+            looked up for the first time
+        """
+        return LazyDates(self, year)
+
+    def _register(self, name: str, date_function: DateFunction) -> None:
+        """Register a date function, wrapped for memoization if enabled."""
+        if self._cache_size > 0:
+            date_function = functools.lru_cache(maxsize=self._cache_size)(
+                date_function,
+            )
+        self._date_functions[name] = date_function
+
+    def _add_lazy_plugin(
+        self,
+        module_name: str,
+        manifest: Iterable[EntryPoint],
+    ) -> None:
+        """Record a plugin module for importing it on demand."""
+        declared = [
+            entry_point
+            for entry_point in manifest
+            if entry_point.module == module_name
+            or entry_point.module.startswith(module_name + '.')
+        ]
+        with self._lock:
+            if not declared:
+                self._pending_modules.append(module_name)
+            for entry_point in declared:
+                self._declared_functions.setdefault(
+                    entry_point.name,
+                    entry_point,
+                )
+
+    def _resolve(self, name: str) -> DateFunction | None:
+        """Load a date function of a lazy plugin."""
+        with self._lock:
+            entry_point = self._declared_functions.pop(name, None)
+            if entry_point is not None:
+                loaded = entry_point.load()
+                if getattr(loaded, '__decorator__', None) == 'date_generator':
+                    for event_name in loaded.names:
+                        self._declared_functions.pop(event_name, None)
+                    self.add_date_generator(loaded)
+                else:
+                    self._register(name, cast(DateFunction, loaded))
+            while name not in self._date_functions and self._pending_modules:
+                self.add_from_module(self._pending_modules.pop(0))
+            return self._date_functions.get(name)
+
+    def _resolve_all(self) -> None:
+        """Load the date functions of all lazy plugins."""
+        with self._lock:
+            for name in list(self._declared_functions):
+                self._resolve(name)
+            while self._pending_modules:
+                self.add_from_module(self._pending_modules.pop(0))
+
+
+def _event_function(
+    events: Callable[[int], Mapping[str, datetime.date | None]],
+    name: str,
+) -> DateFunction:
+    """Create the date function of an event of a date generator."""
+
+    def event(year: int) -> datetime.date | None:
+        return events(year)[name]
+
+    event.__name__ = name
+    event.__qualname__ = name
+    event.__doc__ = f'Compute the date of {name!r} in the given year.'
+    return event
+
+
+class LazyDates(Mapping[str, datetime.date | None]):
+    """Mapping of date functions to their results computed on demand.
+
+    Parameters
+    ----------
+    date_functions : Mapping[str, DateFunction]
+        the date functions by name
+    year : int
+        the year for which the functions are evaluated
+    """
+
+    def __init__(
+        self,
+        date_functions: Mapping[str, DateFunction],
+        year: int,
+    ) -> None:
+        self._date_functions = date_functions
+        self._year = year
+        self._results: dict[str, datetime.date | None] = {}
+
+    def __getitem__(self, name: str) -> datetime.date | None:
+        """Look up the result of a date function, computing it once."""
+        if name in self._results:
+            return self._results[name]
+        result = self._date_functions[name](self._year)
+        self._results[name] = result
+        return result
+
+    def __contains__(self, name: object) -> bool:
+        """Check for a date function without evaluating it."""
+        return name in self._date_functions
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the names of the date functions."""
+        return iter(self._date_functions)
+
+    def __len__(self) -> int:
+        """Return the number of date functions."""
+        return len(self._date_functions)
+
+
+@dataclass(frozen=True)
+class DateColumn:
+    """Results of a date function for a sequence of years.
+
+    Properties:
+    -----------
+    - ordinals
+        the day ordinals of the results, one per year, where
+        missing results are :data:`annual.datecalc.NEVER`
+    - missing
+        one byte per year, which is 1 if the function has no result
+        for the year and 0 otherwise
+    """
+
+    ordinals: array[int]
+    missing: bytes
+
+    def __len__(self) -> int:
+        """Return the number of years."""
+        return len(self.ordinals)
+
+    def dates(self) -> list[datetime.date | None]:
+        """Convert the results to dates."""
+        return [
+            datetime.date.fromordinal(day) if day != NEVER else None
+            for day in self.ordinals
+        ]
+
+
+def evaluate_column(
+    date_function: DateFunction,
+    years: Sequence[int],
+) -> DateColumn:
+    """Evaluate a date function for a sequence of years.
+
+    If the function has a ``vectorized`` attribute, which is set by
+    :py:func:`annual.decorators.date_function`, it is called with all
+    years at once and must return a pair of sequences (e.g. NumPy
+    arrays) holding the day ordinals and the missing flags,
+    respectively. Otherwise, the function is called for one year
+    after the other.
+
+    Parameters
+    ----------
+    date_function : DateFunction
+        the date function
+    years : Sequence[int]
+        the years for which the function is evaluated
+
+    Return
+    ------
+    DateColumn
+        the results of the function
+
+    Raises
+    ------
+    ValueError
+        if the vectorized function returns a wrong number of results
+    """
+    vectorized = getattr(date_function, 'vectorized', None)
+    if vectorized is None:
+        days = [date_function(year) for year in years]
+        return DateColumn(
+            array('i', [day.toordinal() if day else NEVER for day in days]),
+            bytes([day is None for day in days]),
+        )
+    ordinals, missing = vectorized(years)
+    column = DateColumn(array('i', ordinals), bytes(missing))
+    if len(column.ordinals) != len(years) or len(column.missing) != len(years):
+        raise ValueError(
+            f'Vectorized date function returned {len(column.ordinals)}'
+            f' ordinals and {len(column.missing)} flags for'
+            f' {len(years)} years',
+        )
+    index = column.missing.find(1)
+    while index >= 0:
+        column.ordinals[index] = NEVER
+        index = column.missing.find(1, index + 1)
+    return column
@@ -0,0 +1,122 @@
+"""Persistent on-disk cache of compiled rules.
+
+Compiled rules are stored in a cache directory, one file per
+rule expression. The files are grouped in a subdirectory named
+after the grammar version, such that a change of ``rule_grammar``
+(or of the installed ``lark`` version) invalidates all
+previously cached rules.
+
+The cache files are written to a temporary file first and then
+atomically moved into place. Therefore, concurrent readers
+either see a complete entry or none at all, and concurrent
+writers of the same entry do not corrupt each other.
+
+.. warning::
+   Cache entries are stored with :py:mod:`pickle`.
+   Only use cache directories which are not writable
+   by untrusted parties.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle  # nosec B403
+import tempfile
+from pathlib import Path
+
+import lark
+
+from .ruleparser import CompiledRule, compile_rule, grammar_digest
+
+__all__ = ['RuleCache']
+
+_SUFFIX = '.pickle'
+
+
+class RuleCache:
+    """Cache of compiled rules in the file system.
+
+    Parameters
+    ----------
+    directory : str | os.PathLike[str]
+        the base directory of the cache, which is created on demand
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        version = hashlib.sha256(
+            f'{grammar_digest}:{lark.__version__}'.encode(),
+        ).hexdigest()
+        self._directory = Path(directory) / version[:16]
+
+    @property
+    def directory(self) -> Path:
+        """Return the directory holding the entries of this version."""
+        return self._directory
+
+    def compile_rule(self, text: str) -> CompiledRule:
+        """Compile a rule expression, using the cache if possible.
+
+        Parameters
+        ----------
+        text : str
+            the rule expression
+
+        Return
+        ------
+        CompiledRule
+            the compiled rule, either loaded from the cache or
+            freshly compiled and stored in the cache
+        """
+        path = self._entry_path(text)
+        rule = self._load(path, text)
+        if rule is None:
+            rule = compile_rule(text)
+            self._store(path, rule)
+        return rule
+
+    def clear(self) -> None:
+        """Remove all entries of the current grammar version."""
+        if not self._directory.is_dir():
+            return
+        for path in self._directory.glob('*' + _SUFFIX):
+            path.unlink(missing_ok=True)
+
+    def _entry_path(self, text: str) -> Path:
+        """Compute the path of the cache entry for an expression."""
+        key = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        return self._directory / (key + _SUFFIX)
+
+    def _load(self, path: Path, text: str) -> CompiledRule | None:
+        """Load a cache entry, return ``None`` if it is not usable."""
+        try:
+            with path.open('rb') as stream:
+                rule = pickle.load(stream)  # nosec B301
+        except Exception:
+            # A truncated or outdated entry may fail in many ways,
+            # e.g. with an unsupported protocol or a renamed class.
+            # It is recompiled and rewritten in any case.
+            return None
+        if not isinstance(rule, CompiledRule) or rule.text != text:
+            return None
+        return rule
+
+    def _store(self, path: Path, rule: CompiledRule) -> None:
+        """Atomically write a cache entry.
+
+        Failures are ignored, since the cache is an optimization only.
+        """
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            handle, tmp_name = tempfile.mkstemp(
+                dir=self._directory,
+                suffix='.tmp',
+            )
+        except OSError:
+            return
+        try:
+            with os.fdopen(handle, 'wb') as stream:
+                pickle.dump(rule, stream, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, path)
+        except OSError:
+            Path(tmp_name).unlink(missing_ok=True)
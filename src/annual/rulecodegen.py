@@ -0,0 +1,509 @@
+"""Generate Python source code from compiled rules.
+
+The functions of this module translate a compiled rule into the
+source code of a plain Python function::
+
+    def rule(year, funcs):
+        ...
+
+which evaluates the rule with integer day arithmetic on day ordinals
+(see :py:meth:`datetime.date.toordinal`) and converts the result to
+a :py:class:`datetime.date` only when returning. Its signature and
+results are the same as those of
+:py:meth:`annual.ruleparser.CompiledRule.evaluate` for the years
+1 to 9999, hence it can be used in place of the rule where
+the remaining interpretive overhead matters.
+
+The source is compiled with :func:`compile`. The resulting code
+objects are cached per source, and can be stored with
+:py:mod:`marshal`. Alternatively, :func:`write_module` emits
+a module file defining several rule functions.
+"""
+
+from __future__ import annotations
+
+import datetime
+import functools
+import keyword
+import warnings
+from collections.abc import Mapping
+from pathlib import Path
+from types import CodeType
+from typing import Final
+
+from lark import Token, v_args
+
+from .datecalc import DAYS_BEFORE_MONTH, DAYS_IN_MONTH, NEVER
+from .model import Month, WeekDay
+from .ruleparser import CompiledRule, DateFunc, TermEvaluator
+
+__all__ = [
+    'compile_function',
+    'generate_source',
+    'invalid_literal',
+    'lookup_ordinal',
+    'rule_code',
+    'write_module',
+]
+
+_IMPORTS: Final = (
+    'from datetime import date\n'
+    '\n'
+    'from annual.datecalc import NEVER\n'
+    'from annual.rulecodegen import invalid_literal, lookup_ordinal\n'
+)
+
+
+def lookup_ordinal(
+    funcs: Mapping[str, datetime.date | None],
+    name: str,
+) -> int:
+    """Look up a precomputed date as day ordinal.
+
+    This function is called by generated code.
+
+    Parameters
+    ----------
+    funcs : Mapping[str, datetime.date | None]
+        the precomputed dates
+    name : str
+        the name of the date
+
+    Return
+    ------
+    int
+        the day ordinal of the date, or
+        :data:`annual.datecalc.NEVER` if there is none
+    """
+    if name not in funcs:
+        warnings.warn(
+            f'Unknown date function {name} referenced.',
+            stacklevel=3,
+        )
+        return NEVER
+    day = funcs[name]
+    return day.toordinal() if day else NEVER
+
+
+def invalid_literal(year: int, month: int, day: int) -> int:
+    """Report a date literal which does not exist in a year.
+
+    This function is called by generated code.
+
+    Parameters
+    ----------
+    year : int
+        the year of the literal
+    month : int
+        the number of the month of the literal, 1 for January
+    day : int
+        the day of the month of the literal
+
+    Return
+    ------
+    int
+        always :data:`annual.datecalc.NEVER`
+    """
+    warnings.warn(
+        f'Date literal cannot be converted: {year}/{Month(month)}/{day}',
+        stacklevel=3,
+    )
+    return NEVER
+
+
+def generate_source(rule: CompiledRule, name: str = 'rule') -> str:
+    """Generate the source code of a function evaluating a rule.
+
+    Parameters
+    ----------
+    rule : CompiledRule
+        the rule to be translated
+    name : str
+        the name of the generated function (optional, default = rule)
+
+    Return
+    ------
+    str
+        the definition of a function taking the year and a mapping
+        of precomputed dates; the function requires the names
+        ``date``, ``NEVER``, ``invalid_literal`` and ``lookup_ordinal``
+        in its global namespace
+
+    Raises
+    ------
+    ValueError
+        if ``name`` is not a valid Python identifier
+
+    Example
+    -------
+    >>> from annual.ruleparser import compile_rule
+    >>> from annual.rulecodegen import generate_source
+    >>> print(generate_source(compile_rule('2 days after easter')))
+    def rule(year, funcs):
+        '2 days after easter'
+        day = (_t0 + 2
+            if (_t0 := lookup_ordinal(funcs, 'easter')) != NEVER else NEVER)
+        return None if day == NEVER else date.fromordinal(day)
+    <BLANKLINE>
+    """
+    if not name.isidentifier() or keyword.iskeyword(name):
+        raise ValueError(f'Not a valid function name: {name!r}')
+    generator = _SourceGenerator()
+    expression = generator.transform(rule.tree)
+    lines = [f'def {name}(year, funcs):', f'    {rule.text!r}']
+    if generator.uses_start:
+        lines.append('    y = year - 1')
+        lines.append('    start = y * 365 + y // 4 - y // 100 + y // 400')
+    if generator.uses_leap:
+        lines.append(
+            '    leap = year % 4 == 0'
+            ' and (year % 100 != 0 or year % 400 == 0)',
+        )
+    lines.append(f'    day = {expression}')
+    lines.append(
+        '    return None if day == NEVER else date.fromordinal(day)',
+    )
+    return '\n'.join(lines) + '\n'
+
+
+def rule_code(rule: CompiledRule, name: str = 'rule') -> CodeType:
+    """Compile the generated source of a rule.
+
+    The code objects are cached per generated source.
+
+    Parameters
+    ----------
+    rule : CompiledRule
+        the rule to be translated
+    name : str
+        the name of the generated function (optional, default = rule)
+
+    Return
+    ------
+    CodeType
+        the code of a module defining the function ``name``;
+        it can be stored with :py:func:`marshal.dumps`
+    """
+    return _compile_source(_IMPORTS + '\n\n' + generate_source(rule, name))
+
+
+def compile_function(rule: CompiledRule, name: str = 'rule') -> DateFunc:
+    """Translate a rule into a Python function.
+
+    Parameters
+    ----------
+    rule : CompiledRule
+        the rule to be translated
+    name : str
+        the name of the generated function (optional, default = rule)
+
+    Return
+    ------
+    DateFunc
+        a function evaluating the rule for a year and a mapping
+        of precomputed dates
+
+    Example
+    -------
+    >>> from annual.ruleparser import compile_rule
+    >>> from annual.rulecodegen import compile_function
+    >>> dst_end = compile_function(compile_rule('last Sunday of October'))
+    >>> dst_end(2024, {})
+    datetime.date(2024, 10, 27)
+    """
+    namespace: dict[str, object] = {}
+    exec(rule_code(rule, name), namespace)  # nosec B102
+    function: DateFunc = namespace[name]  # type: ignore[assignment]
+    return function
+
+
+def write_module(
+    rules: Mapping[str, CompiledRule],
+    path: str | Path,
+) -> Path:
+    """Write a module defining a function for each rule.
+
+    The :py:exc:`ValueError` of :func:`generate_source` propagates
+    if a name is not a valid Python identifier.
+
+    Parameters
+    ----------
+    rules : Mapping[str, CompiledRule]
+        the rules by function name
+    path : str | Path
+        the file to be written
+
+    Return
+    ------
+    Path
+        the path of the written module
+    """
+    parts = [
+        '"""Rules compiled to Python.\n\n'
+        'Generated by ``annual.rulecodegen``. Do not edit.\n"""\n',
+        _IMPORTS,
+    ]
+    parts.extend(
+        '\n' + generate_source(rule, name) for name, rule in rules.items()
+    )
+    target = Path(path)
+    target.write_text('\n'.join(parts), encoding='utf-8')
+    return target
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_source(source: str) -> CodeType:
+    """Compile generated source code."""
+    return compile(source, '<annual.rulecodegen>', 'exec')
+
+
+def _month_start(month: Month) -> str:
+    """Generate the day ordinal of the first day of a month."""
+    offset = DAYS_BEFORE_MONTH[month.value - 1] + 1
+    if month.value > 2:
+        return f'(start + {offset} + leap)'
+    return f'(start + {offset})'
+
+
+def _month_length(month: Month) -> str:
+    """Generate the number of days of a month."""
+    if month == Month.FEBRUARY:
+        return '(28 + leap)'
+    return str(DAYS_IN_MONTH[month.value - 1])
+
+
+@v_args(inline=True)
+class _SourceGenerator(TermEvaluator):
+    """Translate rules into Python expressions on day ordinals.
+
+    Dates are represented by their day ordinal, where
+    :data:`annual.datecalc.NEVER` stands for no date. Values used
+    more than once are bound to temporary variables by assignment
+    expressions.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.uses_start = False
+        self.uses_leap = False
+        self._temps = 0
+
+    def _temp(self) -> str:
+        """Allocate a new temporary variable."""
+        self._temps += 1
+        return f'_t{self._temps - 1}'
+
+    def _month(self, month: Month) -> tuple[str, str]:
+        """Generate the first day and the length of a month."""
+        self.uses_start = True
+        self.uses_leap = self.uses_leap or month.value >= 2
+        return _month_start(month), _month_length(month)
+
+    def rule(
+        self,
+        t_value: str,
+        condition: str | None,
+        f_value: str | None,
+    ) -> str:
+        """Translate an optional conditional expression."""
+        if condition is None or f_value is None:
+            return t_value
+        return f'({t_value} if {condition} else {f_value})'
+
+    def literal(self, month: Month, day: int) -> str:
+        """Translate a date literal."""
+        invalid = f'invalid_literal(year, {month.value}, {day})'
+        length = DAYS_IN_MONTH[month.value - 1]
+        if month == Month.FEBRUARY and day == length + 1:
+            self.uses_start = self.uses_leap = True
+            return f'(start + {31 + day} if leap else {invalid})'
+        if day < 1 or day > length:
+            return invalid
+        start, _ = self._month(month)
+        return f'({start} + {day - 1})'
+
+    def NAME(self, token: Token) -> str:  # noqa: N802
+        """Translate a name lookup."""
+        return f'lookup_ordinal(funcs, {token.value!r})'
+
+    def NEVER(self, token: Token) -> str:  # noqa: N802
+        """Translate ``NEVER``."""
+        return 'NEVER'
+
+    def offset_rule(
+        self,
+        number: int,
+        unit: int,
+        preposition: int,
+        recurrence: str,
+    ) -> str:
+        """Translate an offset rule."""
+        temp = self._temp()
+        num_days = number * unit * preposition
+        return (
+            f'({temp} + {num_days}'
+            f' if ({temp} := {recurrence}) != NEVER else NEVER)'
+        )
+
+    def owm_rule(self, ordinal: int, week_day: WeekDay, hook: Month) -> str:
+        """Translate a weekday-of-month rule."""
+        start, length = self._month(hook)
+        temp = self._temp()
+        day = (
+            f'{start} + ({week_day.value + 1} - {start}) % 7'
+            f' + {7 * (ordinal - 1)}'
+        )
+        return (
+            f'({temp} if {start} <= ({temp} := {day}) < {start} + {length}'
+            ' else NEVER)'
+        )
+
+    def wd_rule(
+        self,
+        ordinal: int | None,
+        week_day: WeekDay,
+        neg: Token | None,
+        preposition: int,
+        recurrence: str,
+    ) -> str:
+        """Translate a weekday-relative-to rule."""
+        include_start: bool = neg is not None
+        direction = -preposition if include_start else preposition
+        skip = direction * 7 * (ordinal - 1 if ordinal else 0)
+        temp = self._temp()
+        wd_value = week_day.value
+        if direction > 0 and include_start:
+            day = f'{temp} + ({wd_value + 1} - {temp}) % 7 + {skip}'
+        elif direction > 0:
+            day = f'{temp} + ({wd_value} - {temp}) % 7 + {skip + 1}'
+        elif include_start:
+            day = f'{temp} - ({temp} + {6 - wd_value}) % 7 + {skip}'
+        else:
+            day = f'{temp} - ({temp} + {5 - wd_value}) % 7 + {skip - 1}'
+        return f'({day} if ({temp} := {recurrence}) != NEVER else NEVER)'
+
+    def lwd_rule(self, week_day: WeekDay, month: Month) -> str:
+        """Translate a last-weekday-of-month rule."""
+        start, length = self._month(month)
+        temp = self._temp()
+        return (
+            f'(({temp} := {start} + {length} - 1)'
+            f' - ({temp} + {6 - week_day.value}) % 7)'
+        )
+
+    def wd_condition(
+        self,
+        recur_ref: str,
+        not_tok: Token | None,
+        week_day: WeekDay | str,
+    ) -> str:
+        """Translate a weekday condition."""
+        compare = '==' if not_tok is None else '!='
+        if not isinstance(week_day, WeekDay):
+            # recur_ref IS [NOT] NEVER
+            return f'({recur_ref} {compare} NEVER)'
+        temp = self._temp()
+        return (
+            f'(({temp} := {recur_ref}) != NEVER'
+            f' and ({temp} + 6) % 7 {compare} {week_day.value})'
+        )
+
+    def day_eq_condition(
+        self,
+        recur_ref: str,
+        not_tok: Token | None,
+        recur_ref_2: str,
+    ) -> str:
+        """Translate a day equality condition."""
+        temp, temp_2 = self._temp(), self._temp()
+        compare = '==' if not_tok is None else '!='
+        return (
+            f'(({temp} := {recur_ref}) != NEVER'
+            f' and ({temp_2} := {recur_ref_2}) != NEVER'
+            f' and {temp} {compare} {temp_2})'
+        )
+
+    def day_prep_condition(
+        self,
+        recur_ref: str,
+        not_tok: Token | None,
+        preposition: int,
+        recur_ref_2: str,
+    ) -> str:
+        """Translate a day preposition condition."""
+        temp, temp_2 = self._temp(), self._temp()
+        compare = '>' if not_tok is None else '<='
+        return (
+            f'(({temp} := {recur_ref}) != NEVER'
+            f' and ({temp_2} := {recur_ref_2}) != NEVER'
+            f' and ({temp} - {temp_2}) * {preposition} {compare} 0)'
+        )
+
+    def month_condition(
+        self,
+        recur_ref: str,
+        not_tok: Token | None,
+        month: Month,
+    ) -> str:
+        """Translate a month condition."""
+        start, length = self._month(month)
+        temp = self._temp()
+        within = f'{start} <= {temp} < {start} + {length}'
+        if not_tok is None:
+            return f'(({temp} := {recur_ref}) != NEVER and {within})'
+        return f'(({temp} := {recur_ref}) != NEVER and not {within})'
+
+    def exist_condition(self, recurrence: str) -> str:
+        """Translate an existence condition."""
+        return f'({recurrence} != NEVER)'
+
+    def and_condition(self, cond1: str, cond2: str | None) -> str:
+        """Translate an and-condition."""
+        if cond2 is None:
+            return cond1
+        return f'({cond1} and {cond2})'
+
+    def or_condition(self, cond1: str, cond2: str | None) -> str:
+        """Translate an or-condition."""
+        if cond2 is None:
+            return cond1
+        return f'({cond1} or {cond2})'
+
+    def TRUE(self, token: Token) -> str:  # noqa: N802
+        """Translate boolean literal."""
+        return 'True'
+
+    def FALSE(self, token: Token) -> str:  # noqa: N802
+        """Translate boolean literal."""
+        return 'False'
+
+    def ydiv_cond(self, not_tok: Token | None, cond: str) -> str:
+        """Translate division like conditions."""
+        if not_tok is None:
+            return cond
+        return f'(not {cond})'
+
+    def ycmp_cond(
+        self,
+        not_tok: Token | None,
+        preposition: int,
+        number: int,
+    ) -> str:
+        """Translate a comparison of the year number."""
+        after = preposition > 0
+        if not_tok is None:
+            compare = '>' if after else '<'
+        else:
+            compare = '<=' if after else '>='
+        return f'(year {compare} {number})'
+
+    def LEAP(self, _: Token) -> str:  # noqa: N802
+        """Translate the leap year check."""
+        self.uses_leap = True
+        return 'leap'
+
+    def ymod_cond(self, rem: int, divi: int | None) -> str:
+        """Translate a check of the year in modular arithmetic."""
+        if not divi:
+            return f'(year == {rem})'
+        return f'(year % {divi} == {rem})'
@@ -0,0 +1,309 @@
+"""Simplify compiled rules ahead of their evaluation.
+
+Expressions generated by tools often contain parts which can be
+decided without knowing the year, such as ``if true else ...``,
+``year is 0 mod 1`` or offsets relative to ``never``. The function
+:func:`simplify_rule` folds such constants in the parse tree of a
+compiled rule. The result is again a parse tree according to
+``rule_grammar``, so it can be evaluated by all evaluators of
+:py:mod:`annual.ruleparser`.
+
+Optionally, a rule is specialized for a range of years. Then,
+year conditions holding either for all or for none of these years
+are decided as well, and the branches which are never taken
+are removed.
+"""
+
+from __future__ import annotations
+
+import calendar
+from collections.abc import Callable
+from typing import Any, Final
+
+from lark import Token, Transformer, Tree
+
+from .ruleparser import CompiledRule
+
+__all__ = ['simplify_rule']
+
+_LEAP_CYCLE: Final = 400
+"""Number of years after which the leap years repeat."""
+
+
+def simplify_rule(
+    rule: CompiledRule,
+    years: range | None = None,
+) -> CompiledRule:
+    """Fold the constant parts of a compiled rule.
+
+    Parameters
+    ----------
+    rule : CompiledRule
+        the rule to be simplified
+    years : range | None
+        the years for which the rule will be evaluated, if known
+        (optional, default = any year)
+
+    Return
+    ------
+    CompiledRule
+        a rule with the same text, evaluating to the same dates as
+        ``rule`` for all years in ``years``; evaluating it for other
+        years may give different results, hence it records these
+        years and does not compare equal to ``rule``
+
+    Example
+    -------
+    >>> from annual.ruleparser import compile_rule
+    >>> from annual.ruleoptimizer import simplify_rule
+    >>> rule = compile_rule('mar 1 if year after 1900 else 2 days after never')
+    >>> simplified = simplify_rule(rule, range(2000, 2100))
+    >>> simplified.tree == compile_rule('mar 1').tree
+    True
+    """
+    tree = _Simplifier(years).transform(rule.tree)
+    return CompiledRule(rule.text, tree, _common_years(rule.years, years))
+
+
+def _common_years(
+    first: range | None,
+    second: range | None,
+) -> range | None:
+    """Intersect the year windows of nested specializations.
+
+    Windows of steps other than 1 are not intersected. Instead, the
+    rule is marked as specialized for no year, which is conservative.
+    """
+    if first is None or second is None:
+        return second if first is None else first
+    if first.step != 1 or second.step != 1:
+        return range(0)
+    start = max(first.start, second.start)
+    return range(start, max(start, min(first.stop, second.stop)))
+
+
+class _Simplifier(Transformer):
+    """Rebuild a parse tree with constant subtrees folded.
+
+    Folded recurrences are represented as ``recurrence(NEVER)``,
+    folded conditions as ``TRUE`` or ``FALSE`` tokens within
+    the node of the respective condition.
+    """
+
+    def __init__(self, years: range | None) -> None:
+        super().__init__()
+        self.years = years
+
+    def __default__(self, data: str, children: list, meta: Any) -> Tree:
+        """Rebuild all other nodes unchanged."""
+        return Tree(data, children, meta)
+
+    def rule(self, children: list) -> Tree:
+        """Select the branch of a decided condition."""
+        recurrence, condition, else_rule = children
+        unconditional = Tree('rule', [recurrence, None, None])
+        value = _constant(condition)
+        if value is False:
+            return else_rule
+        if (
+            value is None
+            and condition is not None
+            and else_rule != unconditional
+        ):
+            return Tree('rule', children)
+        inner = recurrence.children[0]
+        if isinstance(inner, Tree) and inner.data == 'rule':
+            return inner
+        return unconditional
+
+    def recurrence(self, children: list) -> Tree:
+        """Remove parentheses around unconditional rules."""
+        (inner,) = children
+        if isinstance(inner, Tree):
+            if inner.data == 'recurrence':
+                return inner
+            if inner.data == 'rule' and inner.children[1] is None:
+                return inner.children[0]
+        return Tree('recurrence', children)
+
+    def weekday_rule(self, children: list) -> Tree:
+        """Propagate ``NEVER`` from a weekday rule."""
+        (inner,) = children
+        if inner.data == 'recurrence':
+            return inner
+        return Tree('weekday_rule', children)
+
+    def offset_rule(self, children: list) -> Tree:
+        """Propagate ``NEVER`` and drop offsets of zero days."""
+        number, recurrence = children[0], children[-1]
+        if _is_never(recurrence) or int(number) == 0:
+            return recurrence
+        return Tree('offset_rule', children)
+
+    def wd_rule(self, children: list) -> Tree:
+        """Propagate ``NEVER`` through a weekday-relative-to rule."""
+        if _is_never(children[-1]):
+            return children[-1]
+        return Tree('wd_rule', children)
+
+    def exist_condition(self, children: list) -> Tree | Token:
+        """Decide whether ``NEVER`` exists."""
+        if _is_never(children[0]):
+            return _boolean(False)
+        return Tree('exist_condition', children)
+
+    def month_condition(self, children: list) -> Tree | Token:
+        """Decide a month condition of ``NEVER``."""
+        if _is_never(children[0]):
+            return _boolean(False)
+        return Tree('month_condition', children)
+
+    def wd_condition(self, children: list) -> Tree | Token:
+        """Decide a weekday condition of ``NEVER``."""
+        recur_ref, not_tok, week_day = children
+        if not _is_never(recur_ref):
+            return Tree('wd_condition', children)
+        if isinstance(week_day, Token):
+            # NEVER IS [NOT] NEVER
+            return _boolean(not_tok is None)
+        return _boolean(False)
+
+    def day_eq_condition(self, children: list) -> Tree | Token:
+        """Decide a day equality condition with ``NEVER``."""
+        if _is_never(children[0]) or _is_never(children[-1]):
+            return _boolean(False)
+        return Tree('day_eq_condition', children)
+
+    def day_prep_condition(self, children: list) -> Tree | Token:
+        """Decide a day preposition condition with ``NEVER``."""
+        if _is_never(children[0]) or _is_never(children[-1]):
+            return _boolean(False)
+        return Tree('day_prep_condition', children)
+
+    def year_condition(self, children: list) -> Tree | Token:
+        """Decide a year condition, if possible."""
+        (predicate,) = children[0].children
+        not_tok = predicate.children[0]
+        if predicate.data == 'ycmp_cond':
+            value = self._compare(predicate.children[1], predicate.children[2])
+        else:
+            value = self._divide(predicate.children[1])
+        if value is None:
+            return Tree('year_condition', children)
+        return _boolean(value == (not_tok is None))
+
+    def and_condition(self, children: list) -> Tree:
+        """Fold a conjunction with a constant operand."""
+        return _fold_junction('and_condition', False, children)
+
+    def or_condition(self, children: list) -> Tree:
+        """Fold a disjunction with a constant operand."""
+        return _fold_junction('or_condition', True, children)
+
+    def _compare(self, preposition: Tree, number: Token) -> bool | None:
+        """Decide ``year before/after NUMBER`` for the years."""
+        if not self.years:
+            return None
+        (direction,) = preposition.children
+        after = isinstance(direction, Token) and direction.type == 'AFTER'
+        first, last = min(self.years), max(self.years)
+        low, high = (first, last) if after else (-last, -first)
+        limit = int(number) if after else -int(number)
+        if low > limit:
+            return True
+        if high <= limit:
+            return False
+        return None
+
+    def _divide(self, division: Tree) -> bool | None:
+        """Decide ``year is leap`` or ``year is N [mod M]``."""
+        if division.data == 'ymod_cond':
+            remainder_tok, divisor_tok = division.children
+            remainder = int(str(remainder_tok))
+            divisor = int(str(divisor_tok)) if divisor_tok else 0
+            if divisor and remainder >= divisor:
+                return False
+            if divisor == 1:
+                return True
+            if not divisor:
+                return self._decide(lambda year: year == remainder, None)
+            return self._decide(
+                lambda year: year % divisor == remainder,
+                divisor,
+            )
+        return self._decide(calendar.isleap, _LEAP_CYCLE)
+
+    def _decide(
+        self,
+        predicate: Callable[[int], bool],
+        period: int | None,
+    ) -> bool | None:
+        """Check whether a predicate is constant for the years.
+
+        If ``period`` is given, the predicate repeats after that many
+        years, hence it suffices to check the first period.
+        """
+        if not self.years:
+            return None
+        years = self.years if period is None else self.years[:period]
+        values = set(map(predicate, years))
+        if len(values) == 1:
+            return values.pop()
+        return None
+
+
+def _is_never(tree: Tree | None) -> bool:
+    """Check whether a recurrence is ``NEVER``."""
+    return (
+        isinstance(tree, Tree)
+        and tree.data == 'recurrence'
+        and isinstance(tree.children[0], Token)
+        and tree.children[0].type == 'NEVER'
+    )
+
+
+def _boolean(value: bool) -> Token:
+    """Create a boolean literal token."""
+    return Token('TRUE', 'true') if value else Token('FALSE', 'false')
+
+
+def _constant(tree: Tree | Token | None) -> bool | None:
+    """Return the value of a constant condition, ``None`` otherwise."""
+    while isinstance(tree, Tree):
+        if tree.data in ('and_condition', 'or_condition'):
+            if tree.children[1] is not None:
+                return None
+        elif tree.data not in ('condition', 'simple_condition'):
+            return None
+        tree = tree.children[0]
+    if isinstance(tree, Token) and tree.type in ('TRUE', 'FALSE'):
+        return tree.type == 'TRUE'
+    return None
+
+
+def _fold_junction(data: str, absorbing: bool, children: list) -> Tree:
+    """Fold an and- or or-condition.
+
+    The ``absorbing`` operand value decides the junction on its own,
+    whereas operands of the opposite value are dropped.
+    """
+    first, rest = children
+    first_value = _constant(first)
+    rest_value = None if rest is None else _constant(rest)
+    if absorbing in (first_value, rest_value):
+        return _constant_junction(data, absorbing)
+    if rest is None:
+        return Tree(data, children)
+    if first_value is not None:
+        return rest
+    if rest_value is not None:
+        return Tree(data, [first, None])
+    return Tree(data, children)
+
+
+def _constant_junction(data: str, value: bool) -> Tree:
+    """Build a constant and- or or-condition."""
+    node: Tree = Tree('simple_condition', [_boolean(value)])
+    if data == 'or_condition':
+        node = Tree('and_condition', [node, None])
+    return Tree(data, [node, None])
@@ -1,23 +1,75 @@
-"""Parse Rule Expressions."""
+"""Parse Rule Expressions.
+
+Thread Safety
+-------------
+Rule expressions are evaluated reentrantly by :func:`compile_rule`
+and :meth:`CompiledRule.evaluate` (or :func:`evaluate_rule`),
+which take the year and the precomputed dates as arguments of
+every call. The :func:`shared_parser` and all compiled rules are
+immutable once created, so they can be shared by any number of
+threads evaluating different years at the same time. The same holds
+for :py:class:`annual.ruleset.RuleSet` and
+:py:class:`annual.calendars.Calendar` objects, and for a
+:py:class:`annual.registry.FunctionRegistry` which is no longer
+modified.
+
+In contrast, a parser created by :func:`rule_parser` holds
+the year and the dates of a single evaluation. It must not be
+shared by threads evaluating different years.
+"""
 
 from __future__ import annotations
 
 import calendar
 import datetime
+import functools
+import hashlib
+import importlib
+import io
+import pickle  # nosec B403
+import pprint
+import sys
 import warnings
-from typing import Final
+from array import array
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Final, TypeVar
 
-from lark import Lark, Token, Transformer, v_args
+import lark
+from lark import Lark, Token, Transformer, Tree, v_args
+from lark.exceptions import LarkError
 
 from .datecalc import (
+    DAYS_IN_MONTH,
+    NEVER,
     days_relative_to,
     last_wd_of_month,
+    month_length,
+    month_start,
+    ordinal_last_wd_of_month,
+    ordinal_wd_of_month,
+    ordinal_wd_relative_to,
+    ordinal_weekday,
     wd_of_month,
     wd_relative_to,
 )
 from .model import Month, WeekDay
 
-__all__ = ['rule_parser']
+__all__ = [
+    'ClosureCompiler',
+    'CompiledRule',
+    'RangeEvaluator',
+    'TermEvaluator',
+    'compile_rule',
+    'evaluate_rule',
+    'grammar_digest',
+    'rule_parser',
+    'shared_parser',
+    'write_precompiled_parser',
+]
+
+_T = TypeVar('_T')
 
 
 rule_grammar: Final = r"""
@@ -155,9 +207,106 @@ rule_grammar: Final = r"""
     %ignore /[ \t\n\r]+/
     """
 
+grammar_digest: Final = hashlib.sha256(rule_grammar.encode()).hexdigest()
+"""Fingerprint of ``rule_grammar`` identifying derived artifacts."""
+
+
+@v_args(inline=True)
+class TermEvaluator(Transformer):
+    """Translate the year independent terms of recurrence rules.
+
+    This is the common base class of the rule evaluators and
+    of the source generator of :py:mod:`annual.rulecodegen`.
+    """
+
+    def weekday_rule(self, rec: _T) -> _T:
+        """Translate a weekday rule."""
+        return rec
+
+    def preposition(self, the_prep: int) -> int:
+        """Return the actual preposition."""
+        return the_prep
+
+    def recurrence(self, rd: _T) -> _T:
+        """Translate a recurrence."""
+        return rd
+
+    def simple_condition(self, cond: _T) -> _T:
+        """Evaluate condition."""
+        return cond
+
+    def condition(self, cond: _T) -> _T:
+        """Evaluate condition."""
+        return cond
+
+    def weekday(self, token) -> WeekDay:
+        """Parse a weekday."""
+        return WeekDay[token.type]
+
+    def month(self, token: Token) -> Month:
+        """Parse a weekday."""
+        return Month[token.type]
+
+    def NUMBER(self, token: Token) -> int:  # noqa: N802
+        """Interpret nimber."""
+        return int(token.value)
+
+    def BEFORE(self, token: Token) -> int:  # noqa: N802
+        """Translate ``BEFORE`` to -1."""
+        return -1
+
+    def AFTER(self, token: Token) -> int:  # noqa: N802
+        """Translate ``AFTER`` to +1."""
+        return 1
+
+    def DAYS(self, token: Token) -> int:  # noqa: N802
+        """Translate ``DAYS`` to +1."""
+        return 1
+
+    def WEEKS(self, token: Token) -> int:  # noqa: N802
+        """Translate ``WEEKS`` to 7."""
+        return 7
+
+    def FIRST(self, token: Token) -> int:  # noqa: N802
+        """Translate ordinal to int."""
+        return 1
+
+    def SECOND(self, token: Token) -> int:  # noqa: N802
+        """Translate ordinal to int."""
+        return 2
+
+    def THIRD(self, token: Token) -> int:  # noqa: N802
+        """Translate ordinal to int."""
+        return 3
+
+    def FOURTH(self, token: Token) -> int:  # noqa: N802
+        """Translate ordinal to int."""
+        return 4
+
+    def TH(self, token: Token) -> int:  # noqa: N802
+        """Translate ordinal to int."""
+        result: int = 0
+        for dig in token.value:
+            if dig >= '0' and dig <= '9':
+                result *= 10
+                result += ord(dig) - ord('0')
+        return result
+
+    def year_condition(self, year_predicate: _T) -> _T:
+        """Evaluate a year condition."""
+        return year_predicate
+
+    def year_predicate(self, cond: _T) -> _T:
+        """Evaluate year condition."""
+        return cond
+
+    def division(self, cond: _T) -> _T:
+        """Evaluate division rule."""
+        return cond
+
 
 @v_args(inline=True)
-class RuleEvaluator(Transformer):
+class RuleEvaluator(TermEvaluator):
     """Evaluate recurrence rules for a given year.
 
     Properties:
@@ -170,10 +319,10 @@ class RuleEvaluator(Transformer):
 
     def __init__(
         self,
-        funcs: dict[str, datetime.date | None],
+        funcs: Mapping[str, datetime.date | None],
         year: int,
     ) -> None:
-        self.funcs: dict[str, datetime.date | None] = funcs
+        self.funcs: Mapping[str, datetime.date | None] = funcs
         self.year: int = year
 
     def rule(
@@ -187,28 +336,6 @@ class RuleEvaluator(Transformer):
             return t_value
         return f_value
 
-    def weekday_rule(
-        self,
-        rec: datetime.date | None,
-    ) -> datetime.date | None:
-        """Translate a weekday rule."""
-        return rec
-
-    def preposition(self, the_prep: int) -> int:
-        """Return the actual preposition."""
-        return the_prep
-
-    def recurrence(self, rd: datetime.date | None) -> datetime.date | None:
-        return rd
-
-    def simple_condition(self, cond: bool) -> bool:
-        """Evaluate condition."""
-        return cond
-
-    def condition(self, cond: bool) -> bool:
-        """Evaluate condition."""
-        return cond
-
     def literal(self, month: Month, day: int) -> datetime.date | None:
         """Convert literal to date."""
         try:
@@ -221,14 +348,6 @@ class RuleEvaluator(Transformer):
             )
             return None
 
-    def weekday(self, token) -> WeekDay:
-        """Parse a weekday."""
-        return WeekDay[token.type]
-
-    def month(self, token: Token) -> Month:
-        """Parse a weekday."""
-        return Month[token.type]
-
     def NAME(self, token: Token) -> datetime.date | None:  # noqa: N802
         """Lookup name."""
         name = token.value
@@ -243,10 +362,6 @@ class RuleEvaluator(Transformer):
     def NEVER(self, token: Token) -> None:  # noqa: N802
         """Translate ``NEVER`` to ``None``."""
 
-    def NUMBER(self, token: Token) -> int:  # noqa: N802
-        """Interpret nimber."""
-        return int(token.value)
-
     def offset_rule(
         self,
         number: int,
@@ -367,47 +482,6 @@ class RuleEvaluator(Transformer):
             return cond1
         return cond1 or cond2
 
-    def BEFORE(self, token: Token) -> int:  # noqa: N802
-        """Translate ``BEFORE`` to -1."""
-        return -1
-
-    def AFTER(self, token: Token) -> int:  # noqa: N802
-        """Translate ``AFTER`` to +1."""
-        return 1
-
-    def DAYS(self, token: Token) -> int:  # noqa: N802
-        """Translate ``DAYS`` to +1."""
-        return 1
-
-    def WEEKS(self, token: Token) -> int:  # noqa: N802
-        """Translate ``WEEKS`` to 7."""
-        return 7
-
-    def FIRST(self, token: Token) -> int:  # noqa: N802
-        """Translate ordinal to int."""
-        return 1
-
-    def SECOND(self, token: Token) -> int:  # noqa: N802
-        """Translate ordinal to int."""
-        return 2
-
-    def THIRD(self, token: Token) -> int:  # noqa: N802
-        """Translate ordinal to int."""
-        return 3
-
-    def FOURTH(self, token: Token) -> int:  # noqa: N802
-        """Translate ordinal to int."""
-        return 4
-
-    def TH(self, token: Token) -> int:  # noqa: N802
-        """Translate ordinal to int."""
-        result: int = 0
-        for dig in token.value:
-            if dig >= '0' and dig <= '9':
-                result *= 10
-                result += ord(dig) - ord('0')
-        return result
-
     def TRUE(self, token: Token) -> bool:  # noqa: N802
         """Transform boolean literal."""
         return True
@@ -416,14 +490,6 @@ class RuleEvaluator(Transformer):
         """Transform boolean literal."""
         return False
 
-    def year_condition(self, year_predicate: bool) -> bool:
-        """Evaluate a year condition."""
-        return year_predicate
-
-    def year_predicate(self, cond: bool) -> bool:
-        """Evaluate year condition."""
-        return cond
-
     def ydiv_cond(self, not_tok: Token | None, cond: bool) -> bool:
         """Evaluate division like conditions."""
         return _negate(not_tok, cond)
@@ -437,10 +503,6 @@ class RuleEvaluator(Transformer):
         """Compare year number."""
         return _negate(not_tok, (self.year - number) * preposition > 0)
 
-    def division(self, cond: bool) -> bool:
-        """Evaluate division rule."""
-        return cond
-
     def LEAP(self, _: Token) -> bool:
         """Check whether year is a leap year."""
         return calendar.isleap(self.year)
@@ -455,17 +517,627 @@ def _negate(not_tok: Token | None, cond: bool) -> bool:
     return cond == (not_tok is None)
 
 
+@v_args(inline=True)
+class RangeEvaluator(TermEvaluator):
+    """Evaluate recurrence rules for a range of years at once.
+
+    Every date valued node evaluates to a list holding one day
+    ordinal per year, where :data:`annual.datecalc.NEVER` marks
+    years without a date. Likewise, every condition evaluates
+    to a list of booleans. Year-only terms are computed from
+    precomputed per-year tables, so the parse tree is visited
+    only once for the whole range.
+
+    Properties:
+    -----------
+    - funcs
+        a dictionary of precomputed day ordinals, one per year
+    - years
+        the years for which new dates are computed
+    """
+
+    def __init__(
+        self,
+        funcs: Mapping[str, Sequence[int]],
+        years: range,
+    ) -> None:
+        self.funcs: Mapping[str, Sequence[int]] = funcs
+        self.years: range = years
+        self.leap: list[bool] = [calendar.isleap(year) for year in years]
+
+    def rule(
+        self,
+        t_value: list[int],
+        condition: list[bool] | None,
+        f_value: list[int] | None,
+    ) -> list[int]:
+        """Evaluate an optional conditional expression."""
+        if condition is None or f_value is None:
+            return t_value
+        return [
+            t_val if cond else f_val
+            for t_val, cond, f_val in zip(t_value, condition, f_value)
+        ]
+
+    def literal(self, month: Month, day: int) -> list[int]:
+        """Convert literal to day ordinals."""
+        longest = DAYS_IN_MONTH[month.value - 1] + (month == Month.FEBRUARY)
+        if day < 1 or day > longest:
+            warnings.warn(
+                f'Date literal cannot be converted: {month}/{day}',
+                stacklevel=2,
+            )
+            return self._never()
+        return [
+            first + day - 1 if day <= length else NEVER
+            for first, length in self._month_spans(month)
+        ]
+
+    def NAME(self, token: Token) -> list[int]:  # noqa: N802
+        """Lookup name."""
+        name = token.value
+        if name not in self.funcs:
+            warnings.warn(
+                f'Unknown date function {name} referenced.',
+                stacklevel=2,
+            )
+            return self._never()
+        column = self.funcs[name]
+        if len(column) != len(self.years):
+            raise ValueError(
+                f'Date function {name} has {len(column)} values '
+                + f'for {len(self.years)} years.',
+            )
+        return list(column)
+
+    def NEVER(self, token: Token) -> list[int]:  # noqa: N802
+        """Translate ``NEVER`` to a column of ``NEVER`` ordinals."""
+        return self._never()
+
+    def offset_rule(
+        self,
+        number: int,
+        unit: int,
+        preposition: int,
+        recurrence: list[int],
+    ) -> list[int]:
+        """Translate offset rules."""
+        num_days = number * unit * preposition
+        return [rd + num_days if rd else NEVER for rd in recurrence]
+
+    def owm_rule(
+        self,
+        ordinal: int,
+        week_day: WeekDay,
+        hook: Month,
+    ) -> list[int]:
+        """Translate weekday-of-month rule."""
+        result: list[int] = []
+        for first, length in self._month_spans(hook):
+            offs = (week_day.value - (first + 6) % 7) % 7
+            offs += (ordinal - 1) * 7
+            result.append(first + offs if 0 <= offs < length else NEVER)
+        return result
+
+    def wd_rule(
+        self,
+        ordinal: int | None,
+        week_day: WeekDay,
+        neg: Token | None,
+        preposition: int,
+        recurrence: list[int],
+    ) -> list[int]:
+        """Translate weekday-relative-to rule."""
+        include_start: bool = neg is not None
+        direction = -preposition if include_start else preposition
+        extra = direction * 7 * (ordinal - 1 if ordinal else 0)
+        result: list[int] = []
+        for rd in recurrence:
+            if not rd:
+                result.append(NEVER)
+                continue
+            delta = (week_day.value - (rd + 6) % 7) % 7
+            if delta == 0:
+                if not include_start:
+                    delta = 7 if direction > 0 else -7
+            elif direction < 0:
+                delta -= 7
+            result.append(rd + delta + extra)
+        return result
+
+    def lwd_rule(self, week_day: WeekDay, month: Month) -> list[int]:
+        """Compute last of a week day of a month."""
+        result: list[int] = []
+        for first, length in self._month_spans(month):
+            last = first + length - 1
+            result.append(last - ((last + 6) % 7 - week_day.value) % 7)
+        return result
+
+    def wd_condition(
+        self,
+        recur_ref: list[int],
+        not_tok: Token | None,
+        week_day: WeekDay | list[int],
+    ) -> list[bool]:
+        """Evaluate weekday condition."""
+        if not isinstance(week_day, WeekDay):
+            # recur_ref IS [NOT] NEVER
+            return [_negate(not_tok, not rd) for rd in recur_ref]
+        return [
+            bool(rd) and _negate(not_tok, (rd + 6) % 7 == week_day.value)
+            for rd in recur_ref
+        ]
+
+    def day_eq_condition(
+        self,
+        recur_ref: list[int],
+        not_tok: Token | None,
+        recur_ref_2: list[int],
+    ) -> list[bool]:
+        """Evaluate day equality condition."""
+        return [
+            bool(rd and rd_2) and _negate(not_tok, rd == rd_2)
+            for rd, rd_2 in zip(recur_ref, recur_ref_2)
+        ]
+
+    def day_prep_condition(
+        self,
+        recur_ref: list[int],
+        not_tok: Token | None,
+        preposition: int,
+        recur_ref_2: list[int],
+    ) -> list[bool]:
+        """Evaluate day preposition condition."""
+        return [
+            bool(rd and rd_2)
+            and _negate(not_tok, preposition * (rd - rd_2) > 0)
+            for rd, rd_2 in zip(recur_ref, recur_ref_2)
+        ]
+
+    def month_condition(
+        self,
+        recur_ref: list[int],
+        not_tok: Token | None,
+        month: Month,
+    ) -> list[bool]:
+        """Check whether a date is in the given month."""
+        return [
+            bool(rd)
+            and _negate(not_tok, first <= rd < first + length)
+            for rd, (first, length) in zip(
+                recur_ref,
+                self._month_spans(month),
+            )
+        ]
+
+    def exist_condition(self, recurrence: list[int]) -> list[bool]:
+        """Check a date for existence."""
+        return [bool(rd) for rd in recurrence]
+
+    def and_condition(
+        self,
+        cond1: list[bool],
+        cond2: list[bool] | None,
+    ) -> list[bool]:
+        """Evaluate an and-condition."""
+        if cond2 is None:
+            return cond1
+        return [c1 and c2 for c1, c2 in zip(cond1, cond2)]
+
+    def or_condition(
+        self,
+        cond1: list[bool],
+        cond2: list[bool] | None,
+    ) -> list[bool]:
+        """Evaluate an or-condition."""
+        if cond2 is None:
+            return cond1
+        return [c1 or c2 for c1, c2 in zip(cond1, cond2)]
+
+    def TRUE(self, token: Token) -> list[bool]:  # noqa: N802
+        """Transform boolean literal."""
+        return [True] * len(self.years)
+
+    def FALSE(self, token: Token) -> list[bool]:  # noqa: N802
+        """Transform boolean literal."""
+        return [False] * len(self.years)
+
+    def ydiv_cond(
+        self,
+        not_tok: Token | None,
+        cond: list[bool],
+    ) -> list[bool]:
+        """Evaluate division like conditions."""
+        return [_negate(not_tok, c) for c in cond]
+
+    def ycmp_cond(
+        self,
+        not_tok: Token | None,
+        preposition: int,
+        number: int,
+    ) -> list[bool]:
+        """Compare year number."""
+        return [
+            _negate(not_tok, (year - number) * preposition > 0)
+            for year in self.years
+        ]
+
+    def LEAP(self, _: Token) -> list[bool]:
+        """Check whether years are leap years."""
+        return self.leap
+
+    def ymod_cond(self, rem: int, divi: int | None) -> list[bool]:
+        """Check years in nodular arithmetic."""
+        if not divi:
+            return [rem == year for year in self.years]
+        return [rem == year % divi for year in self.years]
+
+    def _never(self) -> list[int]:
+        """Return a column of ``NEVER`` ordinals."""
+        return [NEVER] * len(self.years)
+
+    def _month_spans(self, month: Month) -> list[tuple[int, int]]:
+        """List first day ordinal and length of a month per year."""
+        return [
+            (month_start(year, month.value), month_length(year, month.value))
+            for year in self.years
+        ]
+
+
+DateFunc = Callable[
+    [int, Mapping[str, datetime.date | None]],
+    datetime.date | None,
+]
+"""Signature of a rule evaluated for a year and precomputed dates."""
+
+OrdinalFunc = Callable[[int, Mapping[str, datetime.date | None]], int]
+"""Signature of a rule lowered by the :class:`ClosureCompiler`."""
+
+CondFunc = Callable[[int, Mapping[str, datetime.date | None]], bool]
+"""Signature of a condition lowered by the :class:`ClosureCompiler`."""
+
+
+@v_args(inline=True)
+class ClosureCompiler(TermEvaluator):
+    """Lower recurrence rules to nested Python closures.
+
+    The parse tree is visited only once. Every date valued node
+    is translated to a function of the year and the precomputed
+    dates, which calls the functions of its child nodes directly
+    and returns a day ordinal, where :data:`annual.datecalc.NEVER`
+    marks a date which does not occur. Likewise, every condition
+    is translated to a predicate. Year independent terms, such as
+    weekdays, months and numbers, are resolved while compiling,
+    and pass-through nodes like ``recurrence`` or ``condition``
+    vanish.
+
+    The resulting functions do not hold any per-call state,
+    so they can be called for any number of years.
+    """
+
+    def rule(
+        self,
+        t_value: OrdinalFunc,
+        condition: CondFunc | None,
+        f_value: OrdinalFunc | None,
+    ) -> OrdinalFunc:
+        """Lower an optional conditional expression."""
+        if condition is None or f_value is None:
+            return t_value
+
+        def rule(year, funcs):
+            if condition(year, funcs):
+                return t_value(year, funcs)
+            return f_value(year, funcs)
+
+        return rule
+
+    def literal(self, month: Month, day: int) -> OrdinalFunc:
+        """Lower a date literal."""
+        month_no = month.value
+
+        def literal(year, funcs):
+            if not 1 <= day <= month_length(year, month_no):
+                warnings.warn(
+                    f'Date literal cannot be converted: {year}/{month}/{day}',
+                    stacklevel=2,
+                )
+                return NEVER
+            return month_start(year, month_no) + day - 1
+
+        return literal
+
+    def NAME(self, token: Token) -> OrdinalFunc:  # noqa: N802
+        """Lower a name lookup."""
+        name = token.value
+
+        def lookup(year, funcs):
+            if name not in funcs:
+                warnings.warn(
+                    f'Unknown date function {name} referenced.',
+                    stacklevel=2,
+                )
+                return NEVER
+            day = funcs[name]
+            return day.toordinal() if day else NEVER
+
+        return lookup
+
+    def NEVER(self, token: Token) -> OrdinalFunc:  # noqa: N802
+        """Lower ``NEVER``."""
+        return _never
+
+    def offset_rule(
+        self,
+        number: int,
+        unit: int,
+        preposition: int,
+        recurrence: OrdinalFunc,
+    ) -> OrdinalFunc:
+        """Lower an offset rule."""
+        num_days = number * unit * preposition
+
+        def offset_rule(year, funcs):
+            day = recurrence(year, funcs)
+            return day + num_days if day else NEVER
+
+        return offset_rule
+
+    def owm_rule(
+        self,
+        ordinal: int,
+        week_day: WeekDay,
+        hook: Month,
+    ) -> OrdinalFunc:
+        """Lower a weekday-of-month rule."""
+        month_no, week_day_no = hook.value, week_day.value
+
+        def owm_rule(year, funcs):
+            return ordinal_wd_of_month(year, month_no, ordinal, week_day_no)
+
+        return owm_rule
+
+    def wd_rule(
+        self,
+        ordinal: int | None,
+        week_day: WeekDay,
+        neg: Token | None,
+        preposition: int,
+        recurrence: OrdinalFunc,
+    ) -> OrdinalFunc:
+        """Lower a weekday-relative-to rule."""
+        include_start: bool = neg is not None
+        direction = -preposition if include_start else preposition
+        num_days = direction * 7 * (ordinal - 1 if ordinal else 0)
+        week_day_no = week_day.value
+
+        def wd_rule(year, funcs):
+            day = recurrence(year, funcs)
+            if not day:
+                return NEVER
+            return num_days + ordinal_wd_relative_to(
+                day,
+                week_day_no,
+                direction,
+                include_start,
+            )
+
+        return wd_rule
+
+    def lwd_rule(self, week_day: WeekDay, month: Month) -> OrdinalFunc:
+        """Lower a last-weekday-of-month rule."""
+        month_no, week_day_no = month.value, week_day.value
+
+        def lwd_rule(year, funcs):
+            return ordinal_last_wd_of_month(year, month_no, week_day_no)
+
+        return lwd_rule
+
+    def wd_condition(
+        self,
+        recur_ref: OrdinalFunc,
+        not_tok: Token | None,
+        week_day: WeekDay | OrdinalFunc,
+    ) -> CondFunc:
+        """Lower a weekday condition."""
+        negated = not_tok is not None
+        if not isinstance(week_day, WeekDay):
+            # recur_ref IS [NOT] NEVER
+            def is_never(year, funcs):
+                return (recur_ref(year, funcs) == NEVER) != negated
+
+            return is_never
+        week_day_no = week_day.value
+
+        def wd_condition(year, funcs):
+            day = recur_ref(year, funcs)
+            if not day:
+                return False
+            return (ordinal_weekday(day) == week_day_no) != negated
+
+        return wd_condition
+
+    def day_eq_condition(
+        self,
+        recur_ref: OrdinalFunc,
+        not_tok: Token | None,
+        recur_ref_2: OrdinalFunc,
+    ) -> CondFunc:
+        """Lower a day equality condition."""
+        negated = not_tok is not None
+
+        def day_eq_condition(year, funcs):
+            day = recur_ref(year, funcs)
+            day_2 = recur_ref_2(year, funcs)
+            if not day or not day_2:
+                return False
+            return (day == day_2) != negated
+
+        return day_eq_condition
+
+    def day_prep_condition(
+        self,
+        recur_ref: OrdinalFunc,
+        not_tok: Token | None,
+        preposition: int,
+        recur_ref_2: OrdinalFunc,
+    ) -> CondFunc:
+        """Lower a day preposition condition."""
+        negated = not_tok is not None
+
+        def day_prep_condition(year, funcs):
+            day = recur_ref(year, funcs)
+            day_2 = recur_ref_2(year, funcs)
+            if not day or not day_2:
+                return False
+            return ((day - day_2) * preposition > 0) != negated
+
+        return day_prep_condition
+
+    def month_condition(
+        self,
+        recur_ref: OrdinalFunc,
+        not_tok: Token | None,
+        month: Month,
+    ) -> CondFunc:
+        """Lower a month condition."""
+        negated = not_tok is not None
+        month_no = month.value
+
+        def month_condition(year, funcs):
+            day = recur_ref(year, funcs)
+            if not day:
+                return False
+            first = month_start(year, month_no)
+            within = first <= day < first + month_length(year, month_no)
+            return within != negated
+
+        return month_condition
+
+    def exist_condition(self, recurrence: OrdinalFunc) -> CondFunc:
+        """Lower an existence condition."""
+
+        def exist_condition(year, funcs):
+            return recurrence(year, funcs) != NEVER
+
+        return exist_condition
+
+    def and_condition(
+        self,
+        cond1: CondFunc,
+        cond2: CondFunc | None,
+    ) -> CondFunc:
+        """Lower an and-condition."""
+        if cond2 is None:
+            return cond1
+
+        def and_condition(year, funcs):
+            return cond1(year, funcs) and cond2(year, funcs)
+
+        return and_condition
+
+    def or_condition(
+        self,
+        cond1: CondFunc,
+        cond2: CondFunc | None,
+    ) -> CondFunc:
+        """Lower an or-condition."""
+        if cond2 is None:
+            return cond1
+
+        def or_condition(year, funcs):
+            return cond1(year, funcs) or cond2(year, funcs)
+
+        return or_condition
+
+    def TRUE(self, token: Token) -> CondFunc:  # noqa: N802
+        """Lower boolean literal."""
+        return _always
+
+    def FALSE(self, token: Token) -> CondFunc:  # noqa: N802
+        """Lower boolean literal."""
+        return _never_true
+
+    def ydiv_cond(self, not_tok: Token | None, cond: CondFunc) -> CondFunc:
+        """Lower division like conditions."""
+        if not_tok is None:
+            return cond
+
+        def not_cond(year, funcs):
+            return not cond(year, funcs)
+
+        return not_cond
+
+    def ycmp_cond(
+        self,
+        not_tok: Token | None,
+        preposition: int,
+        number: int,
+    ) -> CondFunc:
+        """Lower a comparison of the year number."""
+        negated = not_tok is not None
+
+        def ycmp_cond(year, funcs):
+            return ((year - number) * preposition > 0) != negated
+
+        return ycmp_cond
+
+    def LEAP(self, _: Token) -> CondFunc:
+        """Lower the leap year check."""
+
+        def is_leap(year, funcs):
+            return calendar.isleap(year)
+
+        return is_leap
+
+    def ymod_cond(self, rem: int, divi: int | None) -> CondFunc:
+        """Lower a check of the year in modular arithmetic."""
+        if not divi:
+
+            def year_is(year, funcs):
+                return year == rem
+
+            return year_is
+
+        def ymod_cond(year, funcs):
+            return year % divi == rem
+
+        return ymod_cond
+
+
+def _never(year: int, funcs: Mapping[str, datetime.date | None]) -> int:
+    """Evaluate ``NEVER``."""
+    return NEVER
+
+
+def _always(year: int, funcs: Mapping[str, datetime.date | None]) -> bool:
+    """Evaluate ``TRUE``."""
+    return True
+
+
+def _never_true(
+    year: int,
+    funcs: Mapping[str, datetime.date | None],
+) -> bool:
+    """Evaluate ``FALSE``."""
+    return False
+
+
 def rule_parser(
     year: int,
-    funcs: dict[str, datetime.date | None] | None = None,
+    funcs: Mapping[str, datetime.date | None] | None = None,
 ) -> Lark:
     """Generate rule parser.
 
+    The returned parser evaluates expressions for the given year
+    while parsing them. Prefer :func:`compile_rule`, which parses
+    an expression once for all years and can be shared by threads.
+
     Arguments
     ---------
     year : int
         The year for which new dates are computed.
-    funcs : dict[str, datetime.date | None] | None, optional
+    funcs : Mapping[str, datetime.date | None] | None, optional
         A dictionary of precomputed dates.
 
     Return
@@ -488,9 +1160,444 @@ def rule_parser(
     >>> rule_parser(year, funcs).parse('49 days after easter')
     datetime.date(2024, 5, 19)
     """
+    if funcs is None:
+        funcs = {}
+    return _make_parser(RuleEvaluator(funcs, year))
+
+
+@functools.cache
+def shared_parser() -> Lark:
+    """Return the process-wide rule parser.
+
+    The parser is created on first use and shared afterwards,
+    so that grammar analysis and LALR table construction
+    happen at most once per process.
+    Unlike the parsers returned by :func:`rule_parser`, it has
+    no embedded transformer: ``parse`` returns the parse tree,
+    which can be evaluated with :class:`RuleEvaluator`.
+
+    Return
+    ------
+    Lark
+        the shared ``Lark`` parser instance
+
+    Example
+    -------
+    >>> from annual.ruleparser import shared_parser
+    >>> shared_parser() is shared_parser()
+    True
+    """
+    return _make_parser(None)
+
+
+_PRECOMPILED_MODULE: Final = 'annual._ruleparser_data'
+
+
+class _EvaluatingParser(Lark):
+    """A precompiled rule parser evaluating the parse trees.
+
+    Parsers loaded by :meth:`lark.Lark.load` cannot embed a
+    transformer. Instead, the transformer is applied to the
+    tree returned by ``parse``.
+    """
+
+    transformer: Transformer
+
+    def parse(self, text: Any, *args: Any, **kwargs: Any) -> Any:
+        """Parse a rule expression and evaluate it."""
+        return self.transformer.transform(
+            super().parse(text, *args, **kwargs),
+        )
+
+
+def _make_parser(transformer: Transformer | None) -> Lark:
+    """Create a rule parser with an optional embedded transformer.
+
+    The parser tables are loaded from the precompiled module
+    if it matches the current grammar. Otherwise, the parser
+    is built from ``rule_grammar``.
+    """
+    precompiled = _load_precompiled()
+    if precompiled is not None:
+        try:
+            if transformer is None:
+                return Lark.load(io.BytesIO(precompiled))
+            parser = _EvaluatingParser.load(io.BytesIO(precompiled))
+        except (LarkError, pickle.UnpicklingError, KeyError, TypeError):
+            warnings.warn(
+                'Precompiled rule parser cannot be loaded.',
+                stacklevel=2,
+            )
+        else:
+            parser.transformer = transformer
+            return parser
     return Lark(
         rule_grammar,
         start='rule',
         parser='lalr',
-        transformer=RuleEvaluator(funcs if funcs else {}, year),
+        transformer=transformer,
+    )
+
+
+@functools.cache
+def _load_precompiled() -> bytes | None:
+    """Load the serialized parser if it is fresh.
+
+    The serialized parser is fresh if it has been generated
+    from the current ``rule_grammar`` with the installed version
+    of ``lark``. Parser tables saved by one version of ``lark``
+    cannot be expected to load in another one.
+    """
+    try:
+        module = importlib.import_module(_PRECOMPILED_MODULE)
+    except ImportError:
+        return None
+    if module.GRAMMAR_DIGEST != grammar_digest:
+        return None
+    if module.LARK_VERSION != lark.__version__:
+        return None
+    parser: bytes = module.PARSER
+    return parser
+
+
+def write_precompiled_parser(path: str | Path | None = None) -> Path:
+    """Generate the module holding the precompiled rule parser.
+
+    The module contains the LALR tables for ``rule_grammar``
+    saved by :meth:`lark.Lark.save`, together with the
+    :data:`grammar_digest` and the version of ``lark``,
+    which are checked before the tables are used.
+    It must be regenerated whenever ``rule_grammar`` changes
+    or another version of ``lark`` is installed::
+
+        python -m annual.ruleparser
+
+    Arguments
+    ---------
+    path : str | Path | None, optional
+        The file to be written. By default, the module
+        ``annual/_ruleparser_data.py`` next to this file is replaced.
+
+    Return
+    ------
+    Path
+        The path of the generated file.
+    """
+    target = Path(path) if path else Path(__file__).with_name(
+        '_ruleparser_data.py',
     )
+    stream = io.BytesIO()
+    Lark(rule_grammar, start='rule', parser='lalr').save(stream)
+    saved = pickle.loads(stream.getvalue())  # nosec B301
+    saved['data']['parser']['parser'] = _canonical_parse_table(
+        saved['data']['parser']['parser'],
+    )
+    parser = pickle.dumps(_rebuild(saved), pickle.HIGHEST_PROTOCOL)
+    lines = [
+        '"""Precompiled rule parser.',
+        '',
+        'Generated by ``python -m annual.ruleparser``. Do not edit.',
+        '"""',
+        '',
+        '# fmt: off',
+        'GRAMMAR_DIGEST = (',
+        f'    {grammar_digest!r}',
+        ')',
+        f'LARK_VERSION = {lark.__version__!r}',
+        f'PARSER = {pprint.pformat(parser, width=79)}',
+        '',
+    ]
+    target.write_text('\n'.join(lines), encoding='utf-8')
+    return target
+
+
+def _rebuild(data: Any) -> Any:
+    """Copy plain data, sharing exactly the equal strings.
+
+    Pickle writes objects referred to twice only once, hence
+    the saved bytes depend on the identities of the objects.
+    """
+    if isinstance(data, str):
+        return sys.intern(data)
+    if isinstance(data, dict):
+        return {_rebuild(key): _rebuild(value) for key, value in data.items()}
+    if isinstance(data, list | tuple):
+        return type(data)(_rebuild(item) for item in data)
+    return data
+
+
+def _canonical_parse_table(table: dict[str, Any]) -> dict[str, Any]:
+    """Renumber the tokens and states of a serialized LALR table.
+
+    ``lark`` numbers them in the iteration order of sets, which
+    depends on the addresses of objects. Here, the tokens are numbered
+    by name and the states in breadth-first order from the start
+    states, such that the same grammar always gives the same table.
+    """
+    names = sorted(table['tokens'].values())
+    token_ids = {name: index for index, name in enumerate(names)}
+    old_names = table['tokens']
+    order = [
+        table['start_states'][start] for start in sorted(table['start_states'])
+    ]
+    state_ids = {state: index for index, state in enumerate(order)}
+    for state in order:
+        actions = table['states'][state]
+        for token in sorted(actions, key=lambda tok: old_names[tok]):
+            kind, arg = actions[token]
+            if kind == 0 and arg not in state_ids:
+                state_ids[arg] = len(order)
+                order.append(arg)
+    for state in table['states']:
+        if state not in state_ids:
+            state_ids[state] = len(order)
+            order.append(state)
+
+    def action(entry: tuple[int, Any]) -> tuple[int, Any]:
+        """Renumber the target state of a shift action."""
+        kind, arg = entry
+        return (kind, state_ids[arg]) if kind == 0 else entry
+
+    return {
+        'tokens': dict(enumerate(names)),
+        'states': {
+            state_ids[state]: {
+                token_ids[old_names[token]]: action(entry)
+                for token, entry in sorted(
+                    table['states'][state].items(),
+                    key=lambda item: old_names[item[0]],
+                )
+            }
+            for state in order
+        },
+        'start_states': {
+            start: state_ids[state]
+            for start, state in sorted(table['start_states'].items())
+        },
+        'end_states': {
+            end: state_ids[state]
+            for end, state in sorted(table['end_states'].items())
+        },
+    }
+
+
+def evaluate_rule(
+    text: str,
+    year: int,
+    funcs: Mapping[str, datetime.date | None] | None = None,
+) -> datetime.date | None:
+    """Evaluate a rule expression for the given year.
+
+    The expression is parsed with the :func:`shared_parser`,
+    hence no grammar is built per call. The 1024 most recently used
+    expressions are kept compiled in a least recently used cache and
+    are not parsed again. This function can be called from several
+    threads at once.
+
+    Arguments
+    ---------
+    text : str
+        The rule expression.
+    year : int
+        The year for which new dates are computed.
+    funcs : Mapping[str, datetime.date | None] | None, optional
+        A dictionary of precomputed dates.
+
+    Return
+    ------
+    datetime.date | None
+        The date the expression evaluates to, or ``None``
+        if the event does not occur in the given year.
+
+    Example
+    -------
+    >>> from annual.ruleparser import evaluate_rule
+    >>> evaluate_rule('last Sunday of October', 2024)
+    datetime.date(2024, 10, 27)
+    """
+    return _cached_rule(text).evaluate(year, funcs)
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """A parsed rule expression which is independent of the year.
+
+    Compiled rules are created by :func:`compile_rule`.
+    They can be evaluated for any number of years without
+    parsing the expression again.
+
+    Properties:
+    -----------
+    - text
+        the rule expression
+    - tree
+        the parse tree of the expression according to ``rule_grammar``
+    - years
+        the years for which the tree has been specialized by
+        :py:func:`annual.ruleoptimizer.simplify_rule`, or ``None``
+        if the tree evaluates like the expression for all years
+
+    Rules with the same text compare equal unless they have been
+    specialized for different years, so specialized rules are never
+    taken for general ones in sets or caches.
+    """
+
+    text: str
+    tree: Tree = field(repr=False, compare=False)
+    years: range | None = None
+
+    @functools.cached_property
+    def names(self) -> frozenset[str]:
+        """Return the names of the precomputed dates used by the rule.
+
+        Only these names need to be present in the ``funcs``
+        mapping passed to :meth:`evaluate`.
+
+        Return
+        ------
+        frozenset[str]
+            the names referred to by the rule expression
+
+        Example
+        -------
+        >>> from annual.ruleparser import compile_rule
+        >>> sorted(compile_rule('easter if xmas is sunday else easter').names)
+        ['easter', 'xmas']
+        """
+        return frozenset(
+            str(token)
+            for token in self.tree.scan_values(
+                lambda value: isinstance(value, Token)
+                and value.type == 'NAME',
+            )
+        )
+
+    @functools.cached_property
+    def function(self) -> DateFunc:
+        """Return the rule lowered to a function of year and dates.
+
+        The function is built by the :class:`ClosureCompiler` on first
+        use and takes the year and a mapping of precomputed dates.
+        Internally, it calculates with day ordinals, which are
+        converted to a date only when returning.
+
+        Return
+        ------
+        DateFunc
+            a function taking the year and a mapping of precomputed
+            dates, and returning the date the rule evaluates to, if any
+
+        Example
+        -------
+        >>> from annual.ruleparser import compile_rule
+        >>> compile_rule('1st monday of june').function(2024, {})
+        datetime.date(2024, 6, 3)
+        """
+        ordinal_function = ClosureCompiler().transform(self.tree)
+
+        def function(year, funcs):
+            day = ordinal_function(year, funcs)
+            return datetime.date.fromordinal(day) if day else None
+
+        return function
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Exclude the lowered function, which cannot be pickled."""
+        state = self.__dict__.copy()
+        state.pop('function', None)
+        return state
+
+    def evaluate(
+        self,
+        year: int,
+        funcs: Mapping[str, datetime.date | None] | None = None,
+    ) -> datetime.date | None:
+        """Evaluate the rule for the given year.
+
+        Arguments
+        ---------
+        year : int
+            The year for which new dates are computed.
+        funcs : Mapping[str, datetime.date | None] | None, optional
+            A dictionary of precomputed dates.
+
+        Return
+        ------
+        datetime.date | None
+            The date the rule evaluates to, or ``None``
+            if the event does not occur in the given year.
+        """
+        return self.function(year, funcs if funcs is not None else {})
+
+    def evaluate_range(
+        self,
+        start_year: int,
+        end_year: int,
+        funcs: Mapping[str, Sequence[int]] | None = None,
+    ) -> array[int]:
+        """Evaluate the rule for a range of years at once.
+
+        As with :func:`range`, ``end_year`` is not included.
+
+        Arguments
+        ---------
+        start_year : int
+            The first year for which dates are computed.
+        end_year : int
+            The year after the last year for which dates are computed.
+        funcs : Mapping[str, Sequence[int]] | None, optional
+            A dictionary of precomputed day ordinals, holding
+            one ordinal per year of the range.
+
+        Return
+        ------
+        array[int]
+            The day ordinals (see :py:meth:`datetime.date.toordinal`)
+            the rule evaluates to, one per year of the range.
+            Years without a date are marked with
+            :data:`annual.datecalc.NEVER`.
+
+        Example
+        -------
+        >>> from annual.ruleparser import compile_rule
+        >>> dst_end = compile_rule('last Sunday of October')
+        >>> ordinals = dst_end.evaluate_range(2024, 2027)
+        >>> [datetime.date.fromordinal(o).day for o in ordinals]
+        [27, 26, 25]
+        """
+        years = range(start_year, end_year)
+        evaluator = RangeEvaluator(funcs if funcs is not None else {}, years)
+        return array('i', evaluator.transform(self.tree))
+
+
+def compile_rule(text: str) -> CompiledRule:
+    """Parse a rule expression once for evaluation in many years.
+
+    Arguments
+    ---------
+    text : str
+        The rule expression.
+
+    Return
+    ------
+    CompiledRule
+        The compiled rule.
+
+    Example
+    -------
+    >>> from annual.ruleparser import compile_rule
+    >>> dst_end = compile_rule('last Sunday of October')
+    >>> [dst_end.evaluate(year).day for year in range(2024, 2028)]
+    [27, 26, 25, 31]
+    """
+    return CompiledRule(text, shared_parser().parse(text))
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_rule(text: str) -> CompiledRule:
+    """Compile a rule expression, reusing recently compiled rules."""
+    return compile_rule(text)
+
+
+if __name__ == '__main__':
+    sys.stdout.write(f'{write_precompiled_parser()}\n')
@@ -0,0 +1,364 @@
+"""Sets of named rules which may refer to one another.
+
+Within a :class:`RuleSet`, the name of a rule can be used in the
+expressions of the other rules just like the name of a date function.
+The rules are evaluated in dependency order, such that every rule
+is evaluated exactly once per year and its result is reused by all
+rules referring to it.
+
+Moreover, identical sub-expressions of the rules, such as
+``sunday after mar 21``, are detected by hash-consing the
+``recurrence`` subtrees of the parse trees. Every distinct
+sub-expression occurring more than once is hoisted into
+a hidden rule of its own, so that it is evaluated once per year
+as well.
+"""
+
+from __future__ import annotations
+
+import datetime
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Mapping, Sequence
+from graphlib import TopologicalSorter
+from typing import TypeVar, cast
+
+from lark import Token, Tree
+
+from .decorators import DateFunction
+from .registry import LazyDates, evaluate_column
+from .ruleparser import CompiledRule, compile_rule
+
+__all__ = ['RuleSet']
+
+_V = TypeVar('_V')
+
+
+class RuleSet:
+    """Named rules evaluated in dependency order.
+
+    Names which do not refer to a rule of the set are looked up
+    in the date functions. Rule names take precedence over the names
+    of date functions.
+
+    A rule set is not modified by its evaluation, hence it can be
+    evaluated by several threads at once.
+
+    Rules referring to each other in a cycle cannot be ordered,
+    the constructor then propagates the :py:exc:`graphlib.CycleError`
+    of the topological sort.
+
+    Parameters
+    ----------
+    rules : Mapping[str, str | CompiledRule]
+        the rules by name, either as expressions or compiled
+    date_functions : Mapping[str, DateFunction] | None
+        the date functions which may be referenced by the rules,
+        e.g. a :py:class:`annual.registry.FunctionRegistry`
+        (optional, default = no functions)
+    share_subexpressions : bool
+        determines whether identical sub-expressions are
+        evaluated only once (optional, default = ``True``)
+
+    Example
+    -------
+    >>> from annual.ruleset import RuleSet
+    >>> rules = RuleSet(
+    ...     {
+    ...         'Whit Monday': '1 day after pentecost',
+    ...         'pentecost': '49 days after easter',
+    ...         'easter': 'mar 31',
+    ...     },
+    ... )
+    >>> rules.order
+    ('easter', 'pentecost', 'Whit Monday')
+    >>> rules.evaluate(2024)['Whit Monday']
+    datetime.date(2024, 5, 20)
+    """
+
+    def __init__(
+        self,
+        rules: Mapping[str, str | CompiledRule],
+        date_functions: Mapping[str, DateFunction] | None = None,
+        share_subexpressions: bool = True,
+    ) -> None:
+        self._rules: dict[str, CompiledRule] = {
+            name: (
+                rule if isinstance(rule, CompiledRule) else compile_rule(rule)
+            )
+            for name, rule in rules.items()
+        }
+        self._date_functions: Mapping[str, DateFunction] = (
+            date_functions if date_functions is not None else {}
+        )
+        self._order = _dependency_order(self._rules)
+        self._shared_nodes = 0
+        self._plan: dict[str, CompiledRule] = self._rules
+        self._plan_order = self._order
+        if share_subexpressions:
+            sharing = _SubexpressionSharing(self._rules)
+            if sharing.shared_nodes:
+                self._shared_nodes = sharing.shared_nodes
+                self._plan = sharing.plan
+                self._plan_order = _dependency_order(self._plan)
+
+    @property
+    def rules(self) -> Mapping[str, CompiledRule]:
+        """Return the compiled rules by name."""
+        return self._rules
+
+    @property
+    def order(self) -> tuple[str, ...]:
+        """Return the rule names in evaluation order."""
+        return self._order
+
+    @property
+    def shared_nodes(self) -> int:
+        """Return the number of sub-expression evaluations saved per year.
+
+        This is the number of occurrences of sub-expressions which
+        are not evaluated, since an identical sub-expression
+        is evaluated elsewhere.
+        """
+        return self._shared_nodes
+
+    @property
+    def function_names(self) -> frozenset[str]:
+        """Return the names used by the rules which are not rules."""
+        used = frozenset[str]().union(
+            *(rule.names for rule in self._rules.values()),
+        )
+        return used - self._rules.keys()
+
+    def evaluate(self, year: int) -> dict[str, datetime.date | None]:
+        """Evaluate all rules for the given year.
+
+        Parameters
+        ----------
+        year : int
+            the year for which the rules are evaluated
+
+        Return
+        ------
+        dict[str, datetime.date | None]
+            a mapping between rule names and their results,
+            in evaluation order
+        """
+        results = _Scope(LazyDates(self._date_functions, year))
+        for name in self._plan_order:
+            results[name] = self._plan[name].evaluate(year, results)
+        return {name: results[name] for name in self._order}
+
+    def evaluate_range(
+        self,
+        start_year: int,
+        end_year: int,
+        funcs: Mapping[str, Sequence[int]] | None = None,
+        names: Iterable[str] | None = None,
+    ) -> dict[str, array[int]]:
+        """Evaluate all rules for a range of years at once.
+
+        As with :func:`range`, ``end_year`` is not included.
+        A :py:exc:`KeyError` propagates if one of the ``names``
+        is not the name of a rule.
+
+        Parameters
+        ----------
+        start_year : int
+            the first year for which the rules are evaluated
+        end_year : int
+            the year after the last year for which the rules are evaluated
+        funcs : Mapping[str, Sequence[int]] | None
+            precomputed day ordinals of date functions, one per year
+            of the range, which are used instead of evaluating
+            the date functions (optional, default = none)
+        names : Iterable[str] | None
+            the names of the rules to be evaluated, which are evaluated
+            along with the rules they refer to
+            (optional, default = all rules)
+
+        Return
+        ------
+        dict[str, array[int]]
+            a mapping between rule names and the day ordinals of their
+            results, see
+            :py:meth:`annual.ruleparser.CompiledRule.evaluate_range`
+        """
+        years = range(start_year, end_year)
+        selected = self._order if names is None else tuple(names)
+        plan_order = (
+            self._plan_order if names is None else self._required(selected)
+        )
+        columns: dict[str, Sequence[int]] = dict(funcs or {})
+        used = frozenset[str]().union(
+            *(self._plan[name].names for name in plan_order),
+        )
+        columns.update(
+            _date_columns(
+                self._date_functions,
+                used - self._plan.keys() - columns.keys(),
+                years,
+            ),
+        )
+        results = _Scope(columns)
+        for name in plan_order:
+            results[name] = self._plan[name].evaluate_range(
+                start_year,
+                end_year,
+                results,
+            )
+        return {name: cast('array[int]', results[name]) for name in selected}
+
+    def _required(self, names: tuple[str, ...]) -> tuple[str, ...]:
+        """Select the rules to evaluate for the given rules, in order."""
+        for name in names:
+            if name not in self._rules:
+                raise KeyError(name)
+        required: set[str] = set()
+        pending = list(names)
+        while pending:
+            name = pending.pop()
+            if name not in required:
+                required.add(name)
+                pending.extend(self._plan[name].names & self._plan.keys())
+        return tuple(name for name in self._plan_order if name in required)
+
+
+class _Scope(dict[str, _V]):
+    """Results of rules, falling back to the values of date functions."""
+
+    def __init__(self, fallback: Mapping[str, _V]) -> None:
+        super().__init__()
+        self._fallback = fallback
+
+    def __missing__(self, name: str) -> _V:
+        """Look up a name which is not a rule."""
+        return self._fallback[name]
+
+    def __contains__(self, name: object) -> bool:
+        """Check for a rule or date function."""
+        return super().__contains__(name) or name in self._fallback
+
+
+class _SubexpressionSharing:
+    """Hoist identical sub-expressions of rules into rules of their own.
+
+    The parse trees of the rules are hash-consed, such that identical
+    subtrees are represented by the same canonical node. Every
+    ``recurrence`` node referenced more than once is replaced by
+    a reference to a new rule, named ``$0``, ``$1``, etc.
+    These names cannot clash with the names of the rules,
+    since ``$`` is not allowed in names by the grammar.
+    """
+
+    def __init__(self, rules: Mapping[str, CompiledRule]) -> None:
+        self._canonical: dict[tuple[object, ...], Tree] = {}
+        roots = {name: self._intern(rule.tree) for name, rule in rules.items()}
+        references = self._count_references(roots.values())
+        self._hoisted: dict[int, str] = {}
+        self.shared_nodes = 0
+        hoisted_nodes: list[Tree] = []
+        for node in self._canonical.values():
+            count = references[id(node)]
+            if count > 1 and _is_shareable(node):
+                self._hoisted[id(node)] = f'${len(hoisted_nodes)}'
+                hoisted_nodes.append(node)
+                self.shared_nodes += count - 1
+        self.plan: dict[str, CompiledRule] = {
+            self._hoisted[id(node)]: CompiledRule(
+                self._hoisted[id(node)],
+                self._rewrite(node, True),
+            )
+            for node in hoisted_nodes
+        }
+        for name, root in roots.items():
+            self.plan[name] = CompiledRule(
+                rules[name].text,
+                self._rewrite(root, False),
+            )
+
+    def _intern(self, node: Tree) -> Tree:
+        """Return the canonical node of a subtree."""
+        children = [
+            self._intern(child) if isinstance(child, Tree) else child
+            for child in node.children
+        ]
+        key = (node.data, *(_node_key(child) for child in children))
+        canonical = self._canonical.get(key)
+        if canonical is None:
+            canonical = Tree(node.data, children)
+            self._canonical[key] = canonical
+        return canonical
+
+    @staticmethod
+    def _count_references(roots: Iterable[Tree]) -> Counter[int]:
+        """Count the references to canonical nodes."""
+        references: Counter[int] = Counter()
+        pending: list[Tree] = []
+        for root in roots:
+            references[id(root)] += 1
+            if references[id(root)] == 1:
+                pending.append(root)
+        while pending:
+            for child in pending.pop().children:
+                if isinstance(child, Tree):
+                    references[id(child)] += 1
+                    if references[id(child)] == 1:
+                        pending.append(child)
+        return references
+
+    def _rewrite(self, node: Tree, is_hoisted_root: bool) -> Tree:
+        """Replace hoisted subtrees by references to their rules."""
+        name = self._hoisted.get(id(node))
+        if name is not None and not is_hoisted_root:
+            return Tree('recurrence', [Token('NAME', name)])
+        children = [
+            self._rewrite(child, False) if isinstance(child, Tree) else child
+            for child in node.children
+        ]
+        return Tree(node.data, children)
+
+
+def _node_key(node: object) -> object:
+    """Compute the hash-consing key of a child of a canonical node."""
+    if isinstance(node, Tree):
+        return id(node)
+    if isinstance(node, Token):
+        match node.type:
+            case 'NAME':
+                return (node.type, node.value)
+            case 'NUMBER':
+                return (node.type, int(node.value))
+            case 'TH':
+                return (node.type, node.value.lower())
+        return node.type
+    return node
+
+
+def _is_shareable(node: Tree) -> bool:
+    """Check whether evaluating a node once saves any work."""
+    if node.data != 'recurrence':
+        return False
+    return not isinstance(node.children[0], Token)
+
+
+def _dependency_order(rules: Mapping[str, CompiledRule]) -> tuple[str, ...]:
+    """Sort rule names such that rules follow the rules they refer to."""
+    sorter = TopologicalSorter(
+        {name: rule.names & rules.keys() for name, rule in rules.items()},
+    )
+    return tuple(sorter.static_order())
+
+
+def _date_columns(
+    date_functions: Mapping[str, DateFunction],
+    names: Iterable[str],
+    years: range,
+) -> dict[str, array[int]]:
+    """Evaluate date functions to columns of day ordinals."""
+    columns: dict[str, array[int]] = {}
+    for name in names:
+        date_function = date_functions.get(name)
+        if date_function is not None:
+            columns[name] = evaluate_column(date_function, years).ordinals
+    return columns
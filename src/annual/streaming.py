@@ -0,0 +1,170 @@
+"""Stream the occurrences of rules in chronological order.
+
+The function :func:`occurrences` yields the dates of a set of named
+rules one after the other, across as many years as the caller
+consumes. The rules are evaluated for blocks of years at a time,
+and the dates of every rule are merged with those of the other rules
+by a heap, hence only a few blocks of years are kept in memory.
+"""
+
+from __future__ import annotations
+
+import datetime
+import functools
+import heapq
+import itertools
+import math
+from array import array
+from collections.abc import Callable, Iterator, Mapping
+
+from .datecalc import NEVER, year_start
+from .decorators import DateFunction
+from .ruleparser import CompiledRule
+from .ruleset import RuleSet
+
+__all__ = ['occurrences']
+
+_CACHED_BLOCKS = 4
+"""Number of blocks of years kept while the rules are merged."""
+
+_HORIZON = -1
+"""Rule index of the entries marking that a rule has no earlier dates."""
+
+
+def occurrences(
+    rules: Mapping[str, str | CompiledRule],
+    start: datetime.date,
+    end: datetime.date | None = None,
+    date_functions: Mapping[str, DateFunction] | None = None,
+    block_years: int = 16,
+) -> Iterator[tuple[str, datetime.date]]:
+    """Iterate over the occurrences of rules in chronological order.
+
+    Occurrences of several rules on the same date are ordered as
+    the rules. The dates of a rule need not be in the order of the
+    years for which they are computed, e.g. ``10 days after dec 25``,
+    as long as they are not more than ``block_years`` years apart.
+
+    Parameters
+    ----------
+    rules : Mapping[str, str | CompiledRule]
+        the rules by name, either as expressions or compiled;
+        rules may refer to each other as in a
+        :py:class:`annual.ruleset.RuleSet`
+    start : datetime.date
+        the first date of the period
+    end : datetime.date | None
+        the date after the last date of the period
+        (optional, default = the end of the supported dates)
+    date_functions : Mapping[str, DateFunction] | None
+        the date functions which may be referenced by the rules,
+        e.g. a :py:class:`annual.registry.FunctionRegistry`
+        (optional, default = no functions)
+    block_years : int
+        the number of years for which the rules are evaluated at once
+        (optional, default = ``16``)
+
+    Return
+    ------
+    Iterator[tuple[str, datetime.date]]
+        the names and dates of the occurrences
+
+    Example
+    -------
+    >>> import itertools
+    >>> from annual.streaming import occurrences
+    >>> holidays = occurrences(
+    ...     {'Christmas': 'dec 25', 'New Year': 'jan 1'},
+    ...     datetime.date(2024, 12, 1),
+    ... )
+    >>> for name, day in itertools.islice(holidays, 3):
+    ...     print(name, day)
+    Christmas 2024-12-25
+    New Year 2025-01-01
+    Christmas 2025-12-25
+    """
+    names = tuple(rules)
+    rule_set = RuleSet(rules, date_functions)
+    first = start.toordinal()
+    stop = datetime.date.max.toordinal() + 1
+    if end is not None:
+        stop = min(stop, end.toordinal())
+    # Dates up to ``block_years`` apart from their year may fall into
+    # the period, hence the rules are evaluated for as many more years.
+    first_year = max(start.year - block_years, datetime.MINYEAR)
+    stop_year = datetime.MAXYEAR + 1
+    if end is not None:
+        stop_year = min(stop_year, end.year + block_years + 1)
+    if first >= stop:
+        return iter(())
+
+    @functools.lru_cache(maxsize=_CACHED_BLOCKS)
+    def block(index: int) -> dict[str, array[int]]:
+        """Evaluate the rules for a block of years."""
+        begin = first_year + index * block_years
+        return rule_set.evaluate_range(
+            begin,
+            min(begin + block_years, stop_year),
+        )
+
+    block_count = math.ceil((stop_year - first_year) / block_years)
+    streams = [
+        _rule_stream(
+            name_id,
+            name,
+            block,
+            block_count,
+            first_year,
+            block_years,
+        )
+        for name_id, name in enumerate(names)
+    ]
+    return (
+        (names[name_id], datetime.date.fromordinal(ordinal))
+        for ordinal, name_id in itertools.takewhile(
+            lambda entry: entry[0] < stop,
+            heapq.merge(*streams),
+        )
+        if ordinal >= first and name_id != _HORIZON
+    )
+
+
+def _rule_stream(
+    name_id: int,
+    name: str,
+    block: Callable[[int], Mapping[str, array[int]]],
+    block_count: int,
+    first_year: int,
+    block_years: int,
+) -> Iterator[tuple[int, int]]:
+    """Iterate over the day ordinals of a rule in ascending order.
+
+    The dates of a block are held back until the next block has been
+    evaluated, such that they can be merged with earlier dates
+    of the next block. Since the later blocks have no dates before
+    the first year of the current block, the dates before it are
+    released in any case. An entry with the rule index ``_HORIZON``
+    follows every block, marking that no earlier dates follow,
+    such that the merge does not wait for rules which do not occur.
+    """
+    pending: list[int] = []
+    last = NEVER
+    for index in range(block_count):
+        ordinals = sorted(
+            ordinal for ordinal in block(index)[name] if ordinal != NEVER
+        )
+        if ordinals:
+            while pending and pending[0] <= ordinals[0]:
+                last = heapq.heappop(pending)
+                yield last, name_id
+        for ordinal in ordinals:
+            heapq.heappush(pending, ordinal)
+        horizon = year_start(first_year + index * block_years)
+        while pending and pending[0] < horizon:
+            last = heapq.heappop(pending)
+            yield last, name_id
+        if horizon > last:
+            last = horizon
+            yield last, _HORIZON
+    while pending:
+        yield heapq.heappop(pending), name_id
@@ -0,0 +1,217 @@
+"""Test the evaluation of rules from asyncio applications."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from lark.exceptions import UnexpectedInput
+
+from annual import aio
+from annual.aio import AsyncEvaluator
+from annual.decorators import date_function
+from annual.ruleoptimizer import simplify_rule
+from annual.ruleparser import compile_rule
+
+__all__ = []
+
+
+def test_async_evaluate() -> None:
+    """Evaluate rules for many years concurrently."""
+    rules = ['last mon of may', '1 day after anchor', compile_rule('jun 1')]
+    years = range(1990, 2030)
+
+    @date_function('anchor')
+    def anchor(year: int) -> dt.date:
+        """Return a fixed date."""
+        return dt.date(year, 3, 1)
+
+    async def evaluate_all() -> list[dt.date | None]:
+        async with AsyncEvaluator({'anchor': anchor}, max_batch=7) as ev:
+            return await asyncio.gather(
+                *(ev.evaluate(rule, year) for rule in rules for year in years),
+            )
+
+    result = asyncio.run(evaluate_all())
+
+    assert result == [
+        compile_rule(rule).evaluate(year, {'anchor': anchor(year)})
+        if isinstance(rule, str)
+        else rule.evaluate(year)
+        for rule in rules
+        for year in years
+    ]
+
+
+def test_async_coalesce() -> None:
+    """Concurrent requests for the same rule and year are evaluated once."""
+    calls = []
+
+    @date_function('anchor')
+    def anchor(year: int) -> dt.date:
+        """Record the call and return a fixed date."""
+        calls.append(year)
+        return dt.date(year, 3, 1)
+
+    async def evaluate_all() -> list[dt.date | None]:
+        async with AsyncEvaluator({'anchor': anchor}) as ev:
+            return await asyncio.gather(
+                *(ev.evaluate('anchor', year) for year in [2024] * 10),
+            )
+
+    result = asyncio.run(evaluate_all())
+
+    assert result == [dt.date(2024, 3, 1)] * 10
+    assert calls == [2024]
+
+
+def test_async_backpressure() -> None:
+    """Requests wait for a free place in a small queue."""
+    years = range(2000, 2100)
+
+    async def evaluate_all() -> list[dt.date | None]:
+        async with AsyncEvaluator(max_pending=2, max_tasks=1) as ev:
+            return await asyncio.gather(
+                *(ev.evaluate('feb 29', year) for year in years),
+            )
+
+    result = asyncio.run(evaluate_all())
+
+    assert result == [compile_rule('feb 29').evaluate(year) for year in years]
+
+
+def test_async_specialized_rule() -> None:
+    """Compiled rules sharing their expression are evaluated separately."""
+    rule = compile_rule('mar 1 if year after 2000 else never')
+    specialized = simplify_rule(rule, range(2001, 2010))
+
+    async def evaluate_both() -> list[dt.date | None]:
+        async with AsyncEvaluator() as ev:
+            return await asyncio.gather(
+                ev.evaluate(specialized, 1990),
+                ev.evaluate(rule, 1990),
+            )
+
+    result = asyncio.run(evaluate_both())
+
+    assert result == [specialized.evaluate(1990), None]
+
+
+def test_async_cancel_first_caller() -> None:
+    """Cancelling the caller queueing a request keeps it for the others."""
+    running = threading.Event()
+
+    @date_function('anchor')
+    def anchor(year: int) -> dt.date:
+        """Block the executor until it is released."""
+        running.wait(5)
+        return dt.date(year, 3, 1)
+
+    async def evaluate_second() -> dt.date | None:
+        async with AsyncEvaluator(
+            {'anchor': anchor},
+            max_pending=1,
+            max_tasks=1,
+        ) as ev:
+            requests = [
+                asyncio.create_task(ev.evaluate(rule, 2024))
+                for rule in ['anchor', 'may 1', 'jun 1', 'jul 1', 'jul 1']
+            ]
+            await asyncio.sleep(0.01)
+            requests[3].cancel()
+            await asyncio.sleep(0.01)
+            running.set()
+            return await asyncio.wait_for(requests[4], timeout=5)
+
+    result = asyncio.run(evaluate_second())
+
+    assert result == dt.date(2024, 7, 1)
+
+
+def test_async_error() -> None:
+    """Errors are raised to every request of a batch."""
+
+    async def evaluate_all() -> list[dt.date | None | BaseException]:
+        async with AsyncEvaluator() as ev:
+            return await asyncio.gather(
+                ev.evaluate('may 1 after', 2024),
+                ev.evaluate('may 1 after', 2025),
+                ev.evaluate('may 1', 2025),
+                return_exceptions=True,
+            )
+
+    result = asyncio.run(evaluate_all())
+
+    assert isinstance(result[0], UnexpectedInput)
+    assert isinstance(result[1], UnexpectedInput)
+    assert result[2] == dt.date(2025, 5, 1)
+
+
+def test_async_close() -> None:
+    """Closing the evaluator cancels pending requests."""
+
+    async def evaluate_later() -> dt.date | None:
+        ev = AsyncEvaluator(batch_delay=10)
+        request = asyncio.create_task(ev.evaluate('may 1', 2024))
+        await asyncio.sleep(0.01)
+        await ev.aclose()
+        return await request
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(evaluate_later())
+
+
+def test_async_submit_error() -> None:
+    """Requests fail if the executor does not accept tasks."""
+    executor = ThreadPoolExecutor(max_workers=1)
+    executor.shutdown()
+
+    async def evaluate_all() -> list[dt.date | None | BaseException]:
+        async with AsyncEvaluator(executor=executor, max_tasks=1) as ev:
+            return await asyncio.wait_for(
+                asyncio.gather(
+                    ev.evaluate('may 1', 2024),
+                    ev.evaluate('jun 1', 2024),
+                    return_exceptions=True,
+                ),
+                timeout=5,
+            )
+
+    result = asyncio.run(evaluate_all())
+
+    assert [type(error) for error in result] == [RuntimeError] * 2
+
+
+def test_async_dispatcher_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Requests fail fast once the dispatcher has crashed."""
+    executor = ThreadPoolExecutor(max_workers=1)
+    executor.shutdown()
+    monkeypatch.setattr(aio.AsyncEvaluator, '_reject', _crash)
+
+    async def evaluate_twice() -> list[dt.date | None | BaseException]:
+        async with AsyncEvaluator(executor=executor) as ev:
+            first = await asyncio.wait_for(
+                asyncio.gather(
+                    ev.evaluate('may 1', 2024),
+                    return_exceptions=True,
+                ),
+                timeout=5,
+            )
+            second = await asyncio.gather(
+                ev.evaluate('may 1', 2025),
+                return_exceptions=True,
+            )
+            return first + second
+
+    result = asyncio.run(evaluate_twice())
+
+    assert [type(error) for error in result] == [RuntimeError] * 2
+    assert 'stopped' in str(result[1])
+
+
+def _crash(*args: object) -> None:
+    """Replace a method of the evaluator in order to crash it."""
+    raise ZeroDivisionError
@@ -0,0 +1,145 @@
+"""Test calendars of named rules."""
+
+from __future__ import annotations
+
+import datetime as dt
+
+import pytest
+
+from annual.calendars import Calendar
+from annual.registry import FunctionRegistry
+
+__all__ = []
+
+RULES = {
+    'Easter Monday': '1 day after easter',
+    'May Day': 'may 1',
+    'Whit Monday': '50 days after easter',
+    'Leap Day': 'feb 29',
+}
+
+
+@pytest.fixture(name='calendar')
+def calendar_fixture() -> Calendar:
+    """Create a calendar for a couple of years."""
+    registry = FunctionRegistry(auto_plugins=False)
+    registry.add_from_module('annual.functions')
+    return Calendar(RULES, range(2023, 2026), registry)
+
+
+def test_calendar_len(calendar: Calendar) -> None:
+    """Each rule occurs once per year, the leap day only once."""
+    result = len(calendar)
+
+    assert result == 10
+
+
+def test_calendar_iter(calendar: Calendar) -> None:
+    """Occurrences are iterated in chronological order."""
+    result = list(calendar)
+
+    assert result[:3] == [
+        ('Easter Monday', dt.date(2023, 4, 10)),
+        ('May Day', dt.date(2023, 5, 1)),
+        ('Whit Monday', dt.date(2023, 5, 29)),
+    ]
+    assert [day for _, day in result] == sorted(day for _, day in result)
+
+
+@pytest.mark.parametrize(
+    ('day', 'expected'),
+    [
+        (dt.date(2024, 2, 29), True),
+        (dt.date(2024, 3, 1), False),
+        (dt.date(2026, 5, 1), False),
+        ('2024-05-01', False),
+    ],
+)
+def test_calendar_contains(
+    calendar: Calendar,
+    day: dt.date,
+    expected: bool,
+) -> None:
+    """Check dates for membership."""
+    result = day in calendar
+
+    assert result is expected
+
+
+def test_calendar_names_on(calendar: Calendar) -> None:
+    """Several rules may fall on the same date."""
+    cal = Calendar(
+        {'a': 'may 1', 'b': 'wed after apr 30', 'c': 'may 2'},
+        range(2024, 2025),
+    )
+
+    result = cal.names_on(dt.date(2024, 5, 1))
+
+    assert result == ['a', 'b']
+    assert not calendar.names_on(dt.date(2024, 5, 2))
+
+
+@pytest.mark.parametrize(
+    ('day', 'inclusive', 'expected'),
+    [
+        (dt.date(2024, 5, 1), False, ('Whit Monday', dt.date(2024, 5, 20))),
+        (dt.date(2024, 5, 1), True, ('May Day', dt.date(2024, 5, 1))),
+        (dt.date(2025, 6, 10), False, None),
+    ],
+)
+def test_calendar_next(
+    calendar: Calendar,
+    day: dt.date,
+    inclusive: bool,
+    expected: tuple[str, dt.date] | None,
+) -> None:
+    """Find the next occurrence."""
+    result = calendar.next(day, inclusive)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    ('day', 'inclusive', 'expected'),
+    [
+        (dt.date(2024, 5, 1), False, ('Easter Monday', dt.date(2024, 4, 1))),
+        (dt.date(2024, 5, 1), True, ('May Day', dt.date(2024, 5, 1))),
+        (dt.date(2023, 4, 10), False, None),
+    ],
+)
+def test_calendar_previous(
+    calendar: Calendar,
+    day: dt.date,
+    inclusive: bool,
+    expected: tuple[str, dt.date] | None,
+) -> None:
+    """Find the previous occurrence."""
+    result = calendar.previous(day, inclusive)
+
+    assert result == expected
+
+
+def test_calendar_between(calendar: Calendar) -> None:
+    """List the occurrences of a period."""
+    result = calendar.between(dt.date(2024, 1, 1), dt.date(2024, 5, 1))
+
+    assert result == [
+        ('Leap Day', dt.date(2024, 2, 29)),
+        ('Easter Monday', dt.date(2024, 4, 1)),
+    ]
+
+
+def test_calendar_rule_references() -> None:
+    """Rules of a calendar may refer to each other."""
+    cal = Calendar(
+        {
+            'Pentecost': '49 days after easter',
+            'Whit Monday': 'mon after Pentecost',
+        },
+        range(2024, 2025),
+        {'easter': lambda year: dt.date(year, 3, 31)},
+    )
+
+    result = cal.names_on(dt.date(2024, 5, 20))
+
+    assert result == ['Whit Monday']
@@ -2,15 +2,24 @@
 
 from __future__ import annotations
 
+import calendar
 import datetime as dt
 
 import pytest
 
 from annual.datecalc import (
+    NEVER,
     days_relative_to,
     last_wd_of_month,
+    month_length,
+    month_start,
+    month_start_weekday,
+    ordinal_last_wd_of_month,
+    ordinal_wd_of_month,
+    ordinal_weekday,
     wd_of_month,
     wd_relative_to,
+    year_start,
 )
 from annual.model import Month, WeekDay
 
@@ -151,3 +160,59 @@ def test_last_wd_of_month(
     result = last_wd_of_month(year, month, week_day)
 
     assert result == expected
+
+
+@pytest.mark.parametrize(
+    'year',
+    [1, 399, 400, 401, 1600, 1900, 2023, 2024, 2100, 2400, 9999],
+)
+def test_month_start(year: int) -> None:
+    """Day ordinals of the months agree with ``datetime``."""
+    result = [
+        (month_start(year, month), month_length(year, month))
+        for month in range(1, 13)
+    ]
+
+    expected = [
+        (
+            dt.date(year, month, 1).toordinal(),
+            calendar.monthrange(year, month)[1],
+        )
+        for month in range(1, 13)
+    ]
+    assert result == expected
+    assert year_start(year) == result[0][0]
+    assert [month_start_weekday(year, month) for month in range(1, 13)] == [
+        dt.date(year, month, 1).weekday() for month in range(1, 13)
+    ]
+
+
+def test_ordinal_weekday() -> None:
+    """Weekdays of day ordinals agree with ``datetime``."""
+    days = range(1, 800)
+
+    result = [ordinal_weekday(day) for day in days]
+
+    assert result == [dt.date.fromordinal(day).weekday() for day in days]
+
+
+@pytest.mark.parametrize('year', [400, 2023, 2024, 2100])
+def test_ordinal_wd_of_month(year: int) -> None:
+    """The n-th weekdays of the months agree with a naive search."""
+    for month in range(1, 13):
+        days = range(
+            month_start(year, month),
+            month_start(year, month) + month_length(year, month),
+        )
+        for week_day in range(7):
+            matches = [day for day in days if ordinal_weekday(day) == week_day]
+
+            result = [
+                ordinal_wd_of_month(year, month, ordinal, week_day)
+                for ordinal in range(6)
+            ]
+
+            assert result == [NEVER, *matches, NEVER][:6]
+            assert ordinal_last_wd_of_month(year, month, week_day) == (
+                matches[-1]
+            )
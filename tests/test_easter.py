@@ -4,10 +4,17 @@ See http://dates.gmarts.org/ for a full list of precomputed dates.
 """
 
 import datetime
+from collections.abc import Callable
 
 import pytest
 
 from annual.functions import easter, easter_julian, easter_orthodox
+from annual.functions.easter_funcs import (
+    _easter_day,
+    _easter_julian_day,
+    _easter_orthodox_day,
+    easter_day_to_date,
+)
 
 
 @pytest.mark.parametrize(
@@ -61,3 +68,63 @@ def test_easter_julian(year: int, expected: datetime.date | None) -> None:
     result = easter_julian(year)
 
     assert result == expected
+
+
+@pytest.mark.parametrize(
+    ('func', 'day_func', 'years'),
+    [
+        (easter, _easter_day, range(1583, 4100)),
+        (easter_orthodox, _easter_orthodox_day, range(1583, 4100)),
+        (easter_julian, _easter_julian_day, range(326, 5000)),
+    ],
+)
+def test_easter_table(
+    func: Callable[[int], datetime.date | None],
+    day_func: Callable[[int], int],
+    years: range,
+) -> None:
+    """The lookup tables agree with the arithmetic."""
+    result = [func(year) for year in years]
+
+    assert result == [
+        easter_day_to_date(year, day_func(year)) for year in years
+    ]
+
+
+@pytest.mark.parametrize('func', [easter, easter_orthodox, easter_julian])
+def test_easter_vectorized(
+    func: Callable[[int], datetime.date | None],
+) -> None:
+    """The vectorized companions agree with the scalar functions."""
+    years = range(300, 4200)
+
+    ordinals, missing = func.vectorized(years)  # type: ignore[attr-defined]
+
+    expected = [func(year) for year in years]
+    assert missing == [day is None for day in expected]
+    assert [
+        datetime.date.fromordinal(day) if not flag else None
+        for day, flag in zip(ordinals, missing)
+    ] == expected
+
+
+@pytest.mark.parametrize(
+    ('array_func', 'scalar_func'),
+    [
+        ('easter_array', easter),
+        ('easter_orthodox_array', easter_orthodox),
+        ('easter_julian_array', easter_julian),
+    ],
+)
+def test_easter_arrays(
+    array_func: str,
+    scalar_func: Callable[[int], datetime.date | None],
+) -> None:
+    """Compare the array functions with their scalar counterparts."""
+    easter_arrays = pytest.importorskip('annual.functions.easter_arrays')
+    years = list(range(1, 5000))
+
+    result = getattr(easter_arrays, array_func)(years)
+
+    expected = [scalar_func(year) for year in years]
+    assert easter_arrays.ordinals_to_datetime64(result).tolist() == expected
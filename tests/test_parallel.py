@@ -0,0 +1,82 @@
+"""Test the parallel evaluation of rules over many years."""
+
+from __future__ import annotations
+
+import pytest
+
+from annual.parallel import evaluate_grid
+from annual.registry import FunctionRegistry
+from annual.ruleset import RuleSet
+
+__all__ = []
+
+GRID_RULES = {
+    'Whit Monday': '1 day after pentecost',
+    'pentecost': '49 days after easter',
+    'Ascension': '39 days after easter',
+    'Easter Monday': 'mon after easter',
+    'Mothering Sunday': '3 weeks before easter',
+    'Thanksgiving': '4th thursday of november',
+    'leap day': 'feb 29',
+}
+
+
+@pytest.fixture(name='registry')
+def registry_fixture() -> FunctionRegistry:
+    """Create a registry with the easter functions."""
+    registry = FunctionRegistry(auto_plugins=False)
+    registry.add_from_module('annual.functions')
+    return registry
+
+
+@pytest.mark.parametrize(
+    ('rules_per_chunk', 'years_per_chunk'),
+    [(None, None), (1, 1), (2, 7), (3, 1000)],
+)
+def test_evaluate_grid(
+    registry: FunctionRegistry,
+    rules_per_chunk: int | None,
+    years_per_chunk: int | None,
+) -> None:
+    """The chunks cover the grid in order, with the results of a rule set."""
+    years = range(1980, 2030)
+    expected = RuleSet(GRID_RULES, registry).evaluate_range(1980, 2030)
+
+    chunks = list(
+        evaluate_grid(
+            GRID_RULES,
+            years,
+            registry,
+            max_workers=2,
+            rules_per_chunk=rules_per_chunk,
+            years_per_chunk=years_per_chunk,
+        ),
+    )
+
+    names = [name for chunk in chunks for name in chunk.names]
+    assert list(dict.fromkeys(names)) == list(GRID_RULES)
+    for name in GRID_RULES:
+        column = [
+            ordinal
+            for chunk in chunks
+            if name in chunk.names
+            for ordinal in chunk.column(name)
+        ]
+        assert column == list(expected[name])
+    tiles = [
+        (names.index(chunk.names[0]), chunk.years.start) for chunk in chunks
+    ]
+    assert tiles == sorted(tiles)
+
+
+def test_evaluate_grid_empty() -> None:
+    """No chunks are produced for an empty grid."""
+    result = list(evaluate_grid({}, range(2000, 2010), max_workers=1))
+
+    assert result == []
+
+
+def test_evaluate_grid_step() -> None:
+    """Non-consecutive years are rejected when the grid is requested."""
+    with pytest.raises(ValueError, match='consecutive'):
+        evaluate_grid({'a': 'may 1'}, range(2000, 2010, 2))
@@ -1,9 +1,18 @@
 """Test the registry of date functions."""
 
 import datetime
+import sys
+from collections.abc import Iterator
+from importlib.metadata import EntryPoint
+from pathlib import Path
 
-from annual.decorators import date_function
+import pytest
+
+from annual import registry
+from annual.decorators import DateIterator, date_function, date_generator
 from annual.registry import FunctionRegistry
+from annual.ruleparser import compile_rule, evaluate_rule
+from annual.ruleset import RuleSet
 
 __all__ = []
 
@@ -130,3 +139,340 @@ def test_auto_plugins() -> None:
 
     assert 'easter' in result
     assert result['easter'] == datetime.date(2000, 4, 23)
+
+
+def test_cache_info() -> None:
+    """Memoize date functions and report the statistics."""
+    reg = FunctionRegistry(auto_plugins=False, cache_size=2)
+    reg.add_date_function(new_year_date)
+    for year in (2000, 2001, 2000, 2002, 2001, 2001):
+        reg.evaluate(year)
+
+    result = reg.cache_info()['new-years-day']
+
+    assert (result.hits, result.misses) == (2, 4)
+    assert (result.maxsize, result.currsize) == (2, 2)
+
+
+def test_cache_clear() -> None:
+    """Clear the memoized results."""
+    reg = FunctionRegistry(auto_plugins=False, cache_size=8)
+    reg.add_date_function(new_year_date)
+    reg.evaluate(2000)
+
+    reg.cache_clear()
+
+    assert reg.cache_info()['new-years-day'].currsize == 0
+    assert reg.evaluate(2000) == {'new-years-day': datetime.date(2000, 1, 1)}
+
+
+def test_cache_disabled() -> None:
+    """Without a cache size no statistics are reported."""
+    reg = FunctionRegistry(auto_plugins=False)
+    reg.add_date_function(new_year_date)
+
+    result = reg.cache_info()
+
+    assert not result
+
+
+def test_evaluate_names() -> None:
+    """Evaluate only the requested functions."""
+    reg = FunctionRegistry(auto_plugins=False)
+    reg.add_date_function(never)
+    reg.add_date_function(new_year_date)
+
+    result = reg.evaluate(2000, names=['new-years-day', 'unknown'])
+
+    assert result == {'new-years-day': datetime.date(2000, 1, 1)}
+
+
+def test_evaluate_lazy() -> None:
+    """Functions of a lazy mapping are called on first lookup only."""
+    calls: list[int] = []
+
+    @date_function('counted')
+    def counted(year: int) -> datetime.date | None:
+        """Record the call."""
+        calls.append(year)
+        return datetime.date(year, 2, 1)
+
+    reg = FunctionRegistry(auto_plugins=False)
+    reg.add_date_function(counted)
+    reg.add_date_function(new_year_date)
+    lazy = reg.evaluate_lazy(2000)
+
+    result = evaluate_rule('1 day after new-years-day', 2000, lazy)
+
+    assert result == datetime.date(2000, 1, 2)
+    assert 'counted' in lazy
+    assert not calls
+    assert lazy['counted'] == lazy['counted'] == datetime.date(2000, 2, 1)
+    assert calls == [2000]
+    assert len(lazy) == 2
+    assert set(lazy) == {'counted', 'new-years-day'}
+
+
+def test_evaluate_compiled_names() -> None:
+    """Evaluate the functions referenced by a compiled rule."""
+    reg = FunctionRegistry(auto_plugins=False)
+    reg.add_from_module('annual.functions')
+    rule = compile_rule('49 days after easter')
+
+    result = reg.evaluate(2024, rule.names)
+
+    assert result == {'easter': datetime.date(2024, 3, 31)}
+    assert rule.evaluate(2024, result) == datetime.date(2024, 5, 19)
+
+
+def test_evaluate_many() -> None:
+    """Evaluate functions for many years in columns."""
+    reg = FunctionRegistry(auto_plugins=False)
+    reg.add_date_function(never)
+    reg.add_date_function(new_year_date)
+    years = range(1999, 2002)
+
+    result = reg.evaluate_many(years)
+
+    assert set(result) == {'never', 'new-years-day'}
+    assert list(result['never'].ordinals) == [0, 0, 0]
+    assert result['never'].missing == b'\x01\x01\x01'
+    assert result['new-years-day'].missing == bytes(3)
+    assert result['new-years-day'].dates() == [
+        reg.evaluate(year)['new-years-day'] for year in years
+    ]
+
+
+@pytest.mark.parametrize('cache_size', [0, 8])
+def test_evaluate_many_vectorized(cache_size: int) -> None:
+    """Evaluate functions with a vectorized implementation."""
+    calls: list[int] = []
+
+    def vectorized(years: range) -> tuple[list[int], list[bool]]:
+        """Compute new year's days of even years."""
+        return (
+            [datetime.date(year, 1, 1).toordinal() for year in years],
+            [year % 2 == 1 for year in years],
+        )
+
+    @date_function('even-new-year', vectorized=vectorized)
+    def even_new_year(year: int) -> datetime.date | None:
+        """Compute new year's day of even years."""
+        calls.append(year)
+        return datetime.date(year, 1, 1) if year % 2 == 0 else None
+
+    reg = FunctionRegistry(auto_plugins=False, cache_size=cache_size)
+    reg.add_date_function(even_new_year)
+
+    result = reg.evaluate_many(range(1999, 2002))
+
+    assert result['even-new-year'].missing == b'\x01\x00\x01'
+    assert result['even-new-year'].dates() == [
+        None,
+        datetime.date(2000, 1, 1),
+        None,
+    ]
+    assert not calls
+
+
+PLUGIN_SOURCE = """
+import datetime
+
+from annual.decorators import date_function
+
+
+@date_function('lazy-day')
+def lazy_day(year):
+    return datetime.date(year, 3, 3)
+"""
+
+
+def _install_plugin(
+    name: str,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    manifest: bool,
+) -> None:
+    """Provide a plugin module which has not been imported yet."""
+    (tmp_path / f'{name}.py').write_text(PLUGIN_SOURCE, encoding='utf-8')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    groups = {
+        'annual': [EntryPoint(name, name, 'annual')],
+        'annual.functions': [
+            EntryPoint('lazy-day', f'{name}:lazy_day', 'annual.functions'),
+        ]
+        if manifest
+        else [],
+    }
+    monkeypatch.setattr(
+        registry,
+        'entry_points',
+        lambda group: groups[group],
+    )
+
+
+def test_lazy_plugins(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A lazy plugin is imported when its function is requested."""
+    _install_plugin('annual_lazy_plugin', tmp_path, monkeypatch, False)
+    reg = FunctionRegistry(lazy=True)
+    assert 'annual_lazy_plugin' not in sys.modules
+
+    result = reg.evaluate(2000, ['lazy-day'])
+
+    assert result == {'lazy-day': datetime.date(2000, 3, 3)}
+    assert 'annual_lazy_plugin' in sys.modules
+
+
+def test_lazy_plugins_manifest(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Declared functions are looked up without importing the plugin."""
+    _install_plugin('annual_manifest_plugin', tmp_path, monkeypatch, True)
+    reg = FunctionRegistry(lazy=True)
+
+    result = 'lazy-day' in reg
+
+    assert result
+    assert 'unknown' not in reg
+    assert 'annual_manifest_plugin' not in sys.modules
+    assert reg.evaluate(2000) == {'lazy-day': datetime.date(2000, 3, 3)}
+    assert 'annual_manifest_plugin' in sys.modules
+
+
+def test_lazy_installed_plugins() -> None:
+    """Resolve functions of the installed plugins lazily."""
+    reg = FunctionRegistry(lazy=True)
+
+    result = reg.evaluate(2000, ['easter'])
+
+    assert result == {'easter': datetime.date(2000, 4, 23)}
+    assert 'easter_orthodox' in reg
+    assert len(reg) >= 3
+
+
+def _midsummer_generator(calls: list[int]) -> DateIterator:
+    """Create a date generator recording the years it runs for."""
+
+    @date_generator(['midsummer-eve', 'midsummer-day', 'never-day'])
+    def midsummer(year: int) -> Iterator[tuple[str, datetime.date]]:
+        """Compute the dates around midsummer."""
+        calls.append(year)
+        day = datetime.date(year, 6, 24)
+        yield 'midsummer-eve', day - datetime.timedelta(days=1)
+        yield 'midsummer-day', day
+
+    return midsummer
+
+
+@pytest.mark.parametrize('cache_size', [0, 8])
+def test_add_date_generator(cache_size: int) -> None:
+    """A date generator runs once per year for all its events."""
+    calls: list[int] = []
+    reg = FunctionRegistry(auto_plugins=False, cache_size=cache_size)
+    reg.add_date_generator(_midsummer_generator(calls))
+
+    result = reg.evaluate(2024)
+
+    assert result == {
+        'midsummer-eve': datetime.date(2024, 6, 23),
+        'midsummer-day': datetime.date(2024, 6, 24),
+        'never-day': None,
+    }
+    assert reg['midsummer-day'].__name__ == 'midsummer-day'
+    assert RuleSet({'a': 'sat before midsummer-day'}, reg).evaluate_range(
+        2024,
+        2026,
+    )['a'].tolist() == [
+        datetime.date(2024, 6, 22).toordinal(),
+        datetime.date(2025, 6, 21).toordinal(),
+    ]
+    assert reg.evaluate(2024) == result
+    assert calls == [2024, 2025]
+
+
+def test_date_generator_undeclared() -> None:
+    """A date generator must declare all its events."""
+
+    @date_generator(['declared'])
+    def undeclared(year: int) -> Iterator[tuple[str, datetime.date]]:
+        """Yield an event which has not been declared."""
+        yield 'undeclared', datetime.date(year, 1, 1)
+
+    reg = FunctionRegistry(auto_plugins=False)
+    reg.add_date_generator(undeclared)
+
+    with pytest.raises(ValueError, match='undeclared'):
+        reg['declared'](2000)
+
+
+GENERATOR_PLUGIN_SOURCE = """
+import datetime
+
+from annual.decorators import date_generator
+
+CALLS = []
+
+
+@date_generator(['lazy-eve', 'lazy-day'])
+def lazy_days(year):
+    CALLS.append(year)
+    yield 'lazy-eve', datetime.date(year, 3, 2)
+    yield 'lazy-day', datetime.date(year, 3, 3)
+"""
+
+
+def test_lazy_generator_manifest(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The events of a lazy date generator are declared one by one."""
+    name = 'annual_generator_plugin'
+    (tmp_path / f'{name}.py').write_text(
+        GENERATOR_PLUGIN_SOURCE,
+        encoding='utf-8',
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    groups = {
+        'annual': [EntryPoint(name, name, 'annual')],
+        'annual.functions': [
+            EntryPoint(event, f'{name}:lazy_days', 'annual.functions')
+            for event in ['lazy-eve', 'lazy-day']
+        ],
+    }
+    monkeypatch.setattr(registry, 'entry_points', lambda group: groups[group])
+    reg = FunctionRegistry(lazy=True)
+    assert name not in sys.modules
+
+    result = reg.evaluate(2000, ['lazy-day', 'lazy-eve'])
+
+    assert result == {
+        'lazy-day': datetime.date(2000, 3, 3),
+        'lazy-eve': datetime.date(2000, 3, 2),
+    }
+    assert sys.modules[name].CALLS == [2000]
+    assert sorted(reg) == ['lazy-day', 'lazy-eve']
+
+
+def test_add_from_module_generator(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Date generators are discovered in modules."""
+    name = 'annual_generator_module'
+    (tmp_path / f'{name}.py').write_text(
+        GENERATOR_PLUGIN_SOURCE,
+        encoding='utf-8',
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    reg = FunctionRegistry(auto_plugins=False)
+
+    reg.add_from_module(name)
+
+    assert reg.evaluate(2000) == {
+        'lazy-eve': datetime.date(2000, 3, 2),
+        'lazy-day': datetime.date(2000, 3, 3),
+    }
@@ -0,0 +1,121 @@
+"""Test the on-disk cache of compiled rules."""
+
+from __future__ import annotations
+
+import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from annual import rulecache
+from annual.rulecache import RuleCache
+from annual.ruleparser import CompiledRule
+
+__all__ = []
+
+
+def _fail_compile(text: str) -> CompiledRule:
+    """Replace ``compile_rule`` in order to detect cache misses."""
+    raise AssertionError(f'unexpected compilation of {text!r}')
+
+
+def test_rule_cache_stores_entry(tmp_path: Path) -> None:
+    """A compiled rule is written to the cache directory."""
+    cache = RuleCache(tmp_path)
+
+    result = cache.compile_rule('sunday after may 1')
+
+    assert result.evaluate(2024) == dt.date(2024, 5, 5)
+    assert len(list(cache.directory.glob('*.pickle'))) == 1
+
+
+def test_rule_cache_loads_entry(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A new cache instance loads the rule without parsing it."""
+    RuleCache(tmp_path).compile_rule('sunday after may 1')
+    monkeypatch.setattr(rulecache, 'compile_rule', _fail_compile)
+
+    result = RuleCache(tmp_path).compile_rule('sunday after may 1')
+
+    assert result.text == 'sunday after may 1'
+    assert result.evaluate(2024) == dt.date(2024, 5, 5)
+
+
+def test_rule_cache_grammar_change(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Entries of another grammar version are not used."""
+    cache = RuleCache(tmp_path)
+    monkeypatch.setattr(rulecache, 'grammar_digest', 'changed')
+
+    result = RuleCache(tmp_path)
+
+    assert result.directory != cache.directory
+
+
+def test_rule_cache_corrupt_entry(tmp_path: Path) -> None:
+    """Unreadable entries are replaced by a fresh compilation."""
+    cache = RuleCache(tmp_path)
+    cache.compile_rule('jun 1')
+    for path in cache.directory.glob('*.pickle'):
+        path.write_bytes(b'garbage')
+
+    result = RuleCache(tmp_path).compile_rule('jun 1')
+
+    assert result.evaluate(2024) == dt.date(2024, 6, 1)
+
+
+@pytest.mark.parametrize(
+    'content',
+    [
+        pytest.param(b'\x80\x09.', id='unsupported-protocol'),
+        pytest.param(b'\x80\x05\x95', id='truncated'),
+        pytest.param(
+            b'\x80\x04\x8c\x11annual.ruleparser\x8c\x07Missing\x93.',
+            id='renamed-class',
+        ),
+        pytest.param(
+            b'\x80\x04\x8c\x0bno_such_mod\x8c\x01X\x93.',
+            id='missing-module',
+        ),
+    ],
+)
+def test_rule_cache_garbage_entry(tmp_path: Path, content: bytes) -> None:
+    """Entries failing to unpickle are recompiled and rewritten."""
+    cache = RuleCache(tmp_path)
+    cache.compile_rule('jun 1')
+    paths = list(cache.directory.glob('*.pickle'))
+    for path in paths:
+        path.write_bytes(content)
+
+    result = RuleCache(tmp_path).compile_rule('jun 1')
+
+    assert result.evaluate(2024) == dt.date(2024, 6, 1)
+    assert all(path.read_bytes() != content for path in paths)
+
+
+def test_rule_cache_clear(tmp_path: Path) -> None:
+    """Clearing the cache removes all entries."""
+    cache = RuleCache(tmp_path)
+    cache.compile_rule('jun 1')
+
+    cache.clear()
+
+    assert not list(cache.directory.glob('*.pickle'))
+
+
+def test_rule_cache_concurrent_writers(tmp_path: Path) -> None:
+    """Concurrent writers of the same entry do not corrupt it."""
+    texts = ['last monday of may'] * 16
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        rules = list(executor.map(RuleCache(tmp_path).compile_rule, texts))
+
+    result = RuleCache(tmp_path).compile_rule(texts[0])
+
+    assert {rule.evaluate(2024) for rule in rules} == {dt.date(2024, 5, 27)}
+    assert result.evaluate(2024) == dt.date(2024, 5, 27)
+    assert not list(RuleCache(tmp_path).directory.glob('*.tmp'))
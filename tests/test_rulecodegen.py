@@ -0,0 +1,127 @@
+"""Test the generation of Python source code from rules."""
+
+from __future__ import annotations
+
+import importlib.util
+import marshal
+import warnings
+from pathlib import Path
+
+import pytest
+
+from annual.functions import easter
+from annual.rulecodegen import (
+    compile_function,
+    generate_source,
+    rule_code,
+    write_module,
+)
+from annual.ruleparser import compile_rule
+
+__all__ = []
+
+CODEGEN_RULES = [
+    'jun 1',
+    'jan 31',
+    'feb 29',
+    'feb 30',
+    'dec 31',
+    'never',
+    'unknown',
+    'easter',
+    '49 days after easter',
+    '2 weeks before never',
+    'sunday after mar 21',
+    'sunday not after mar 21',
+    'saturday before mar 21',
+    'saturday not before mar 21',
+    '2nd sunday not before easter',
+    'the first monday before easter',
+    '3rd friday after (easter if year is leap else jun 1)',
+    'the 2nd wednesday of may',
+    '5th wednesday of feb',
+    '5th sunday of dec',
+    'last monday of may',
+    'last sunday of feb',
+    'last friday of december',
+    'feb 29 if year is leap else feb 28',
+    'jun 1 if year is not 2 mod 4 else jun 2',
+    'jun 1 if year is 2000 else jun 2',
+    'jun 1 if year after 2000 and year is not before 2010 else never',
+    'jun 1 if year before 1990 or feb 29 exists else jun 3',
+    'jun 1 if easter in apr else jun 2',
+    'jun 1 if easter not in apr else jun 2',
+    'jun 1 if never not in apr else jun 2',
+    'jun 1 if easter is sunday else jun 2',
+    'jun 1 if jun 1 is not monday else jun 2',
+    'jun 1 if easter is not never else jun 2',
+    'jun 1 if easter is same as apr 1 else jun 2',
+    'jun 1 if easter is not same as apr 1 else jun 2',
+    'jun 1 if easter is before apr 1 else jun 2',
+    'jun 1 if easter is not after apr 1 else jun 2',
+    'jun 1 if true and false else (jun 2 if false else jun 3)',
+]
+
+
+@pytest.mark.parametrize('rule', CODEGEN_RULES)
+def test_compile_function(rule: str) -> None:
+    """Generated functions agree with the compiled rules."""
+    compiled = compile_rule(rule)
+
+    result = compile_function(compiled)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        for year in range(1583, 2600):
+            funcs = {'easter': easter(year)}
+            assert result(year, funcs) == compiled.evaluate(year, funcs)
+
+
+def test_compile_function_warns() -> None:
+    """Generated functions warn like the compiled rules."""
+    rule = compile_rule('feb 29 if unknown exists else never')
+    function = compile_function(rule)
+
+    with pytest.warns(UserWarning, match='Unknown date function unknown'):
+        result = function(2023, {})
+
+    assert result is None
+
+
+def test_rule_code_is_cached() -> None:
+    """Code objects are cached and can be marshalled."""
+    code = rule_code(compile_rule('last monday of may'))
+
+    result = rule_code(compile_rule('last monday of may'))
+
+    assert result is code
+    namespace: dict[str, object] = {}
+    exec(marshal.loads(marshal.dumps(code)), namespace)  # nosec B102
+    assert str(namespace['rule'](2024, {})) == '2024-05-27'
+
+
+def test_generate_source_name() -> None:
+    """Function names must be identifiers."""
+    with pytest.raises(ValueError, match='Not a valid function name'):
+        generate_source(compile_rule('jun 1'), 'Whit Monday')
+
+
+def test_write_module(tmp_path: Path) -> None:
+    """Write a module with rule functions."""
+    rules = {
+        'whit_monday': compile_rule('50 days after easter'),
+        'dst_end': compile_rule('last sunday of october'),
+    }
+
+    result = write_module(rules, tmp_path / 'holidays.py')
+
+    spec = importlib.util.spec_from_file_location('holidays', result)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    funcs = {'easter': easter(2024)}
+    assert module.whit_monday(2024, funcs) == rules['whit_monday'].evaluate(
+        2024,
+        funcs,
+    )
+    assert str(module.dst_end(2024, {})) == '2024-10-27'
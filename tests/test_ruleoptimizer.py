@@ -0,0 +1,126 @@
+"""Test the simplification of compiled rules."""
+
+from __future__ import annotations
+
+import warnings
+
+import pytest
+
+from annual.functions import easter
+from annual.ruleoptimizer import simplify_rule
+from annual.ruleparser import compile_rule
+
+__all__ = []
+
+SIMPLIFY_CASES = [
+    ('mar 1 if true else mar 2', None, 'mar 1'),
+    ('mar 1 if false else mar 2', None, 'mar 2'),
+    ('mar 1 if year is 0 mod 1 else mar 2', None, 'mar 1'),
+    ('mar 1 if year is 2024 mod 1 else mar 2', None, 'mar 2'),
+    ('mar 1 if year is 5 mod 4 else mar 2', None, 'mar 2'),
+    ('mar 1 if year is leap else mar 1', None, 'mar 1'),
+    ('3 days after never', None, 'never'),
+    ('sun after never', None, 'never'),
+    ('mon before (2 days after never)', None, 'never'),
+    ('(mar 1)', None, 'mar 1'),
+    (
+        '((mar 1 if year is leap else mar 2))',
+        None,
+        'mar 1 if year is leap else mar 2',
+    ),
+    ('0 days after easter', None, 'easter'),
+    (
+        'easter if easter exists and true else never',
+        None,
+        'easter if easter exists else never',
+    ),
+    ('easter if never exists or false else mar 1', None, 'mar 1'),
+    ('easter if never in mar or true else mar 1', None, 'easter'),
+    ('mar 1 if never is never else mar 2', None, 'mar 1'),
+    ('mar 1 if never is not never else mar 2', None, 'mar 2'),
+    ('mar 1 if never is sunday else mar 2', None, 'mar 2'),
+    ('mar 1 if easter is same as never else mar 2', None, 'mar 2'),
+    (
+        'mar 1 if year after 1500 else mar 2',
+        None,
+        'mar 1 if year after 1500 else mar 2',
+    ),
+    ('mar 1 if year after 1500 else mar 2', range(1583, 2100), 'mar 1'),
+    ('mar 1 if year not after 1500 else mar 2', range(1583, 2100), 'mar 2'),
+    ('mar 1 if year before 2000 else mar 2', range(1990, 2000), 'mar 1'),
+    (
+        'mar 1 if year before 2000 else mar 2',
+        range(1990, 2001),
+        'mar 1 if year before 2000 else mar 2',
+    ),
+    ('mar 1 if year is leap else mar 2', range(2024, 2025), 'mar 1'),
+    (
+        'mar 1 if year is leap else mar 2',
+        range(2024, 2026),
+        'mar 1 if year is leap else mar 2',
+    ),
+    ('mar 1 if year is 2000 else mar 2', range(2001, 2100), 'mar 2'),
+    ('mar 1 if year is 1 mod 4 else mar 2', range(2024, 2025), 'mar 2'),
+    (
+        'mar 1 if year before 2000 or year is leap else mar 2',
+        range(2000, 2100),
+        'mar 1 if year is leap else mar 2',
+    ),
+]
+
+EQUIVALENCE_RULES = [
+    'feb 29 if year is leap else feb 28',
+    'jun 1 if year is not 2 mod 4 else jun 2',
+    'jun 1 if year is 2000 else jun 2',
+    'jun 1 if year after 2000 and year is not before 2010 else never',
+    'jun 1 if year before 1990 or feb 29 exists else jun 3',
+    'jun 1 if easter is not never and true else jun 2',
+    'jun 1 if true and false else (jun 2 if false else jun 3)',
+    '(2 days after never) if year is leap else (0 weeks before easter)',
+    'mon after (sun before never) if never is never else never',
+]
+
+
+@pytest.mark.parametrize(('rule', 'years', 'expected'), SIMPLIFY_CASES)
+def test_simplify_rule(
+    rule: str,
+    years: range | None,
+    expected: str,
+) -> None:
+    """Fold constants into simpler rules."""
+    compiled = compile_rule(rule)
+
+    result = simplify_rule(compiled, years)
+
+    assert result.text == rule
+    assert result.tree == compile_rule(expected).tree
+
+
+@pytest.mark.parametrize('years', [None, range(1990, 2000), range(2000, 2001)])
+@pytest.mark.parametrize('rule', EQUIVALENCE_RULES)
+def test_simplify_rule_equivalence(rule: str, years: range | None) -> None:
+    """Simplified rules evaluate to the same dates."""
+    compiled = compile_rule(rule)
+
+    result = simplify_rule(compiled, years)
+
+    for year in years or range(1980, 2030):
+        funcs = {'easter': easter(year)}
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            assert result.evaluate(year, funcs) == compiled.evaluate(
+                year,
+                funcs,
+            )
+
+
+def test_simplify_rule_identity() -> None:
+    """Specialized rules are distinguished from general ones."""
+    rule = compile_rule('mar 1 if year after 2000 else never')
+
+    result = simplify_rule(rule, range(2001, 2010))
+
+    assert result.years == range(2001, 2010)
+    assert result != rule
+    assert len({rule, result, simplify_rule(rule)}) == 2
+    assert simplify_rule(result, range(2005, 2020)).years == range(2005, 2010)
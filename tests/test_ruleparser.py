@@ -3,39 +3,59 @@
 from __future__ import annotations
 
 import datetime as dt
+import functools
+import os
+import pickle
+import subprocess  # nosec B404
+import sys
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import pytest
+from lark import Lark
 
-from annual.ruleparser import rule_parser
-
-
-@pytest.mark.parametrize(
-    ('year', 'rule', 'expected'),
-    [
-        (1989, 'ymas', None),
-        (1989, '1 day after never', None),
-        (1989, 'sunday after never', None),
-        (2023, 'jun 1 if false else never', None),
-        (2023, 'jun 1 if true else never', dt.date(2023, 6, 1)),
-        (2024, 'jun 1 if jul 2 in jul else aug 3', dt.date(2024, 6, 1)),
-        (
-            2024,
-            'jun 1 if jul 2 is before never else aug 3',
-            dt.date(2024, 8, 3),
-        ),
-        (
-            2024,
-            'jun 1 if jul 2 is before jul 2 else aug 3',
-            dt.date(2024, 8, 3),
-        ),
-        (
-            2024,
-            'jun 1 if jul 2 is same as never else aug 3',
-            dt.date(2024, 8, 3),
-        ),
-        (2024, 'jun 1 if never is monday else aug 3', dt.date(2024, 8, 3)),
-    ],
+from annual import _ruleparser_data, ruleparser
+from annual.datecalc import NEVER
+from annual.functions import easter
+from annual.ruleparser import (
+    RuleEvaluator,
+    compile_rule,
+    evaluate_rule,
+    grammar_digest,
+    rule_grammar,
+    rule_parser,
+    shared_parser,
+    write_precompiled_parser,
 )
+
+RULE_CASES = [
+    (1989, 'ymas', None),
+    (1989, '1 day after never', None),
+    (1989, 'sunday after never', None),
+    (2023, 'jun 1 if false else never', None),
+    (2023, 'jun 1 if true else never', dt.date(2023, 6, 1)),
+    (2024, 'jun 1 if jul 2 in jul else aug 3', dt.date(2024, 6, 1)),
+    (
+        2024,
+        'jun 1 if jul 2 is before never else aug 3',
+        dt.date(2024, 8, 3),
+    ),
+    (
+        2024,
+        'jun 1 if jul 2 is before jul 2 else aug 3',
+        dt.date(2024, 8, 3),
+    ),
+    (
+        2024,
+        'jun 1 if jul 2 is same as never else aug 3',
+        dt.date(2024, 8, 3),
+    ),
+    (2024, 'jun 1 if never is monday else aug 3', dt.date(2024, 8, 3)),
+]
+
+
+@pytest.mark.parametrize(('year', 'rule', 'expected'), RULE_CASES)
 def test_parser(year: int, rule: str, expected: dt.date | None) -> None:
     """Test rules consisting of a literal only."""
     funcs = {
@@ -46,3 +66,237 @@ def test_parser(year: int, rule: str, expected: dt.date | None) -> None:
     result = rp.parse(rule)
 
     assert result == expected
+
+
+@pytest.mark.parametrize(('year', 'rule', 'expected'), RULE_CASES)
+def test_evaluate_rule(year: int, rule: str, expected: dt.date | None) -> None:
+    """Evaluate rules with the shared parser."""
+    funcs = {
+        'xmas': dt.date(year, 12, 25),
+    }
+
+    result = evaluate_rule(rule, year, funcs)
+
+    assert result == expected
+
+
+def test_evaluate_rule_threads() -> None:
+    """Evaluate rules with the shared parser from several threads."""
+    years = [year for year, _, _ in RULE_CASES]
+    rules = [rule for _, rule, _ in RULE_CASES]
+    funcs = [{'xmas': dt.date(year, 12, 25)} for year in years]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        result = list(executor.map(evaluate_rule, rules, years, funcs))
+
+    assert result == [expected for _, _, expected in RULE_CASES]
+
+
+def test_shared_parser_is_reused() -> None:
+    """The shared parser must be built only once."""
+    parser = shared_parser()
+
+    result = shared_parser()
+
+    assert result is parser
+
+
+@pytest.mark.parametrize(('year', 'rule', 'expected'), RULE_CASES)
+def test_compile_rule(year: int, rule: str, expected: dt.date | None) -> None:
+    """Evaluate compiled rules."""
+    funcs = {
+        'xmas': dt.date(year, 12, 25),
+    }
+    compiled = compile_rule(rule)
+
+    result = compiled.evaluate(year, funcs)
+
+    assert result == expected
+
+
+def test_compiled_rule_is_year_independent() -> None:
+    """A compiled rule can be evaluated for several years."""
+    compiled = compile_rule('2nd monday of october')
+
+    result = [compiled.evaluate(year) for year in range(2023, 2026)]
+
+    assert result == [
+        dt.date(2023, 10, 9),
+        dt.date(2024, 10, 14),
+        dt.date(2025, 10, 13),
+    ]
+
+
+def test_precompiled_parser_is_fresh() -> None:
+    """The shipped parser tables must match the grammar.
+
+    Run ``python -m annual.ruleparser`` if this test fails.
+    """
+    result = _ruleparser_data.GRAMMAR_DIGEST
+
+    assert result == grammar_digest
+
+
+def test_precompiled_parser_is_loaded() -> None:
+    """The parsers are loaded from the shipped tables.
+
+    Run ``python -m annual.ruleparser`` if this test fails,
+    e.g. after installing another version of ``lark``.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        result = [shared_parser(), rule_parser(2024)]
+
+    assert [parser.source_path for parser in result] == [
+        '<deserialized>',
+        '<deserialized>',
+    ]
+    assert result[1].parse('sunday after may 1') == dt.date(2024, 5, 5)
+
+
+def test_precompiled_parser_other_lark_version(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tables saved by another ``lark`` version are not loaded."""
+    monkeypatch.setattr(_ruleparser_data, 'LARK_VERSION', '0.0.0')
+    monkeypatch.setattr(
+        ruleparser,
+        '_load_precompiled',
+        functools.cache(ruleparser._load_precompiled.__wrapped__),
+    )
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        result = rule_parser(2024)
+
+    assert result.source_path == '<string>'
+    assert result.parse('sunday after may 1') == dt.date(2024, 5, 5)
+
+
+@pytest.mark.parametrize('rule', [case[1] for case in RULE_CASES])
+def test_precompiled_parser_trees(rule: str) -> None:
+    """The precompiled parser yields the same trees as a fresh one."""
+    fresh = Lark(rule_grammar, start='rule', parser='lalr')
+
+    result = shared_parser().parse(rule)
+
+    assert result == fresh.parse(rule)
+
+
+def test_write_precompiled_parser_reproducible(tmp_path: Path) -> None:
+    """Separate processes generate the same precompiled parser."""
+    paths = [tmp_path / 'data1.py', tmp_path / 'data2.py']
+    for seed, path in enumerate(paths):
+        subprocess.run(  # nosec B603
+            [
+                sys.executable,
+                '-c',
+                'import sys; from annual import ruleparser;'
+                ' ruleparser.write_precompiled_parser(sys.argv[1])',
+                str(path),
+            ],
+            check=True,
+            env={**os.environ, 'PYTHONHASHSEED': str(seed)},
+        )
+
+    result = [path.read_bytes() for path in paths]
+
+    assert result[0] == result[1]
+
+
+def test_write_precompiled_parser(tmp_path: Path) -> None:
+    """Generate the precompiled parser module into a given file."""
+    path = tmp_path / 'data.py'
+
+    result = write_precompiled_parser(path)
+
+    assert result == path
+    assert grammar_digest in path.read_text(encoding='utf-8')
+
+
+RANGE_RULES = [
+    'jun 1',
+    'feb 29',
+    'feb 30',
+    'never',
+    'unknown',
+    'easter',
+    '49 days after easter',
+    '2 weeks before never',
+    'sunday after mar 21',
+    '2nd sunday not before easter',
+    'the first monday before easter',
+    'the 2nd wednesday of may',
+    '5th wednesday of feb',
+    'last monday of may',
+    'last sunday of feb',
+    'last friday of december',
+    'feb 29 if year is leap else feb 28',
+    'jun 1 if year is not 2 mod 4 else jun 2',
+    'jun 1 if year is 2000 else jun 2',
+    'jun 1 if year after 2000 and year is not before 2010 else never',
+    'jun 1 if year before 1990 or feb 29 exists else jun 3',
+    'jun 1 if easter in apr else jun 2',
+    'jun 1 if easter not in apr else jun 2',
+    'jun 1 if easter is sunday else jun 2',
+    'jun 1 if easter is not never else jun 2',
+    'jun 1 if easter is same as apr 1 else jun 2',
+    'jun 1 if easter is not same as apr 1 else jun 2',
+    'jun 1 if easter is before apr 1 else jun 2',
+    'jun 1 if easter is not after apr 1 else jun 2',
+    'jun 1 if true and false else (jun 2 if false else jun 3)',
+]
+
+
+@pytest.mark.parametrize('rule', RANGE_RULES)
+def test_evaluate_range(rule: str) -> None:
+    """Range evaluation agrees with the evaluation per year."""
+    years = range(1583, 2200)
+    easter_dates = [easter(year) for year in years]
+    compiled = compile_rule(rule)
+
+    result = compiled.evaluate_range(
+        years.start,
+        years.stop,
+        {'easter': [day.toordinal() for day in easter_dates]},
+    )
+
+    expected = [
+        compiled.evaluate(year, {'easter': easter_date})
+        for year, easter_date in zip(years, easter_dates)
+    ]
+    assert [
+        dt.date.fromordinal(day) if day != NEVER else None for day in result
+    ] == expected
+
+
+@pytest.mark.parametrize('rule', RANGE_RULES)
+def test_closure_compiler(rule: str) -> None:
+    """Lowered functions agree with the rule evaluator."""
+    compiled = compile_rule(rule)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        result = [
+            compiled.function(year, {'easter': easter(year)})
+            for year in range(1980, 2030)
+        ]
+        expected = [
+            RuleEvaluator({'easter': easter(year)}, year).transform(
+                compiled.tree,
+            )
+            for year in range(1980, 2030)
+        ]
+
+    assert result == expected
+
+
+def test_compiled_rule_pickle() -> None:
+    """Compiled rules are picklable after their evaluation."""
+    compiled = compile_rule('2nd monday of october')
+    compiled.evaluate(2024)
+
+    result = pickle.loads(pickle.dumps(compiled))  # nosec B301
+
+    assert result == compiled
+    assert result.evaluate(2024) == dt.date(2024, 10, 14)
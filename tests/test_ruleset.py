@@ -0,0 +1,171 @@
+"""Test sets of rules referring to each other."""
+
+from __future__ import annotations
+
+import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
+from graphlib import CycleError
+
+import pytest
+
+from annual.decorators import date_function
+from annual.registry import FunctionRegistry
+from annual.ruleset import RuleSet
+
+__all__ = []
+
+RULES = {
+    'Whit Monday': '1 day after pentecost',
+    'pentecost': '49 days after easter',
+    'Ascension': '39 days after easter',
+    'Corpus Christi': '11 days after pentecost',
+}
+
+
+@pytest.fixture(name='registry')
+def registry_fixture() -> FunctionRegistry:
+    """Create a registry with the easter functions."""
+    registry = FunctionRegistry(auto_plugins=False)
+    registry.add_from_module('annual.functions')
+    return registry
+
+
+def test_ruleset_order(registry: FunctionRegistry) -> None:
+    """Rules are evaluated after the rules they refer to."""
+    rules = RuleSet(RULES, registry)
+
+    result = rules.order
+
+    assert result.index('pentecost') < result.index('Whit Monday')
+    assert result.index('pentecost') < result.index('Corpus Christi')
+    assert rules.function_names == {'easter'}
+
+
+def test_ruleset_evaluate(registry: FunctionRegistry) -> None:
+    """Evaluate rules referring to rules."""
+    rules = RuleSet(RULES, registry)
+
+    result = rules.evaluate(2024)
+
+    assert result == {
+        'pentecost': dt.date(2024, 5, 19),
+        'Ascension': dt.date(2024, 5, 9),
+        'Whit Monday': dt.date(2024, 5, 20),
+        'Corpus Christi': dt.date(2024, 5, 30),
+    }
+
+
+def test_ruleset_evaluates_once() -> None:
+    """Shared anchors are computed once per year."""
+    calls: list[int] = []
+
+    @date_function('anchor')
+    def anchor(year: int) -> dt.date | None:
+        """Record the call."""
+        calls.append(year)
+        return dt.date(year, 3, 1)
+
+    rules = RuleSet(
+        {'a': '1 day after anchor', 'b': '1 day after a', 'c': 'a'},
+        {'anchor': anchor},
+    )
+
+    result = rules.evaluate(2024)
+
+    assert result['b'] == dt.date(2024, 3, 3)
+    assert result['c'] == dt.date(2024, 3, 2)
+    assert calls == [2024]
+
+
+def test_ruleset_evaluate_range(registry: FunctionRegistry) -> None:
+    """Range evaluation agrees with the evaluation per year."""
+    rules = RuleSet(RULES, registry)
+
+    result = rules.evaluate_range(1990, 2030)
+
+    for offset, year in enumerate(range(1990, 2030)):
+        expected = rules.evaluate(year)
+        assert {
+            name: dt.date.fromordinal(ordinals[offset])
+            for name, ordinals in result.items()
+        } == expected
+
+
+@pytest.mark.parametrize(
+    'rules',
+    [
+        {'a': '1 day after a'},
+        {'a': '1 day after b', 'b': '1 day before a'},
+    ],
+)
+def test_ruleset_cycle(rules: dict[str, str]) -> None:
+    """Cyclic references are rejected."""
+    with pytest.raises(CycleError):
+        RuleSet(rules)
+
+
+SHARED_RULES = {
+    'a': 'sunday after mar 21',
+    'b': '1 day after sunday after mar 21',
+    'c': (
+        'mon before sunday after mar 21 '
+        'if sunday after Mar 21 in mar else never'
+    ),
+    'd': '2nd tue of may if year is leap else 2nd tue of may',
+    'e': 'may 1',
+}
+
+
+def test_ruleset_shared_nodes() -> None:
+    """Identical sub-expressions are evaluated once."""
+    rules = RuleSet(SHARED_RULES)
+
+    result = rules.shared_nodes
+
+    assert result == 4
+    assert rules.order == tuple(SHARED_RULES)
+    assert RuleSet(SHARED_RULES, share_subexpressions=False).shared_nodes == 0
+
+
+def test_ruleset_shared_results() -> None:
+    """Sharing sub-expressions does not change the results."""
+    shared = RuleSet(SHARED_RULES)
+    unshared = RuleSet(SHARED_RULES, share_subexpressions=False)
+
+    result = shared.evaluate_range(1990, 2030)
+
+    assert result == unshared.evaluate_range(1990, 2030)
+    for year in range(1990, 2030):
+        assert shared.evaluate(year) == unshared.evaluate(year)
+
+
+def test_ruleset_threads(registry: FunctionRegistry) -> None:
+    """A rule set is evaluated by several threads at once."""
+    rules = RuleSet({**RULES, **SHARED_RULES}, registry)
+    years = range(1900, 2100)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        result = list(executor.map(rules.evaluate, years))
+
+    assert result == [rules.evaluate(year) for year in years]
+
+
+def test_ruleset_evaluate_range_subset() -> None:
+    """Evaluate some rules with precomputed date functions."""
+    rules = RuleSet(RULES)
+    funcs = {
+        'easter': [
+            dt.date(2024, 3, 31).toordinal(),
+            dt.date(2025, 4, 20).toordinal(),
+        ],
+    }
+
+    result = rules.evaluate_range(2024, 2026, funcs, ['Whit Monday'])
+
+    assert list(result) == ['Whit Monday']
+    assert list(result['Whit Monday']) == [
+        dt.date(2024, 5, 20).toordinal(),
+        dt.date(2025, 6, 9).toordinal(),
+    ]
+    with pytest.raises(KeyError):
+        rules.evaluate_range(2024, 2026, funcs, ['easter'])
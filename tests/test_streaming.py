@@ -0,0 +1,128 @@
+"""Test streaming the occurrences of rules."""
+
+from __future__ import annotations
+
+import datetime as dt
+import itertools
+
+import pytest
+
+from annual.calendars import Calendar
+from annual.decorators import date_function
+from annual.registry import FunctionRegistry
+from annual.streaming import occurrences
+
+__all__ = []
+
+STREAM_RULES = {
+    'Easter': 'easter',
+    'Whit Monday': '50 days after easter',
+    'Christmas': 'dec 25',
+    'Epiphany': '12 days after dec 25',
+    'New Year': 'jan 1',
+    'leap day': 'feb 29',
+    'late': '1 day after (dec 31 if year is 2000 else jan 1)',
+}
+
+
+@pytest.fixture(name='registry')
+def registry_fixture() -> FunctionRegistry:
+    """Create a registry with the easter functions."""
+    registry = FunctionRegistry(auto_plugins=False)
+    registry.add_from_module('annual.functions')
+    return registry
+
+
+@pytest.mark.parametrize('block_years', [1, 3, 16])
+def test_occurrences(registry: FunctionRegistry, block_years: int) -> None:
+    """Occurrences are yielded in chronological order."""
+    start, end = dt.date(1990, 3, 1), dt.date(2030, 6, 1)
+    calendar = Calendar(STREAM_RULES, range(1989, 2031), registry)
+
+    result = list(
+        occurrences(STREAM_RULES, start, end, registry, block_years),
+    )
+
+    assert result == calendar.between(start, end)
+
+
+@pytest.mark.parametrize('block_years', [3, 16])
+def test_occurrences_offset_years(block_years: int) -> None:
+    """Dates more than a year apart from their year are not lost."""
+    rules = {
+        'after': '800 days after jan 1',
+        'before': '800 days before jan 1',
+    }
+    start, end = dt.date(2024, 1, 1), dt.date(2026, 12, 31)
+    calendar = Calendar(rules, range(2000, 2050))
+
+    result = list(occurrences(rules, start, end, None, block_years))
+
+    assert result == calendar.between(start, end)
+    assert ('after', dt.date(2024, 3, 11)) in result
+
+
+def test_occurrences_unbounded() -> None:
+    """Occurrences are computed on demand."""
+    start = dt.date(2024, 12, 26)
+
+    result = list(
+        itertools.islice(occurrences({'a': 'dec 26', 'b': 'jan 1'}, start), 4),
+    )
+
+    assert result == [
+        ('a', dt.date(2024, 12, 26)),
+        ('b', dt.date(2025, 1, 1)),
+        ('a', dt.date(2025, 12, 26)),
+        ('b', dt.date(2026, 1, 1)),
+    ]
+
+
+@pytest.mark.parametrize(
+    ('stopping', 'stopping_dates'),
+    [
+        (
+            'feb 29 if year before 2030 else never',
+            [dt.date(2024, 2, 29), dt.date(2028, 2, 29)],
+        ),
+        ('never', []),
+    ],
+)
+def test_occurrences_stopping_rule(
+    stopping: str,
+    stopping_dates: list[dt.date],
+) -> None:
+    """Rules which stop occurring do not delay the other rules."""
+    years: list[int] = []
+
+    @date_function('probe')
+    def probe(year: int) -> dt.date:
+        years.append(year)
+        return dt.date(year, 1, 1)
+
+    rules = {'stopping': stopping, 'New Year': 'probe'}
+
+    result = list(
+        itertools.islice(
+            occurrences(rules, dt.date(2024, 1, 1), None, {'probe': probe}),
+            20,
+        ),
+    )
+
+    expected = sorted(
+        [('stopping', day) for day in stopping_dates]
+        + [('New Year', dt.date(year, 1, 1)) for year in range(2024, 2050)],
+        key=lambda occurrence: occurrence[1],
+    )
+    assert result == expected[:20]
+    assert max(years) < 2100
+
+
+def test_occurrences_limits() -> None:
+    """Occurrences are bounded by the supported dates."""
+    result = list(occurrences({'a': 'dec 30'}, dt.date(9998, 12, 31)))
+
+    assert result == [('a', dt.date(9999, 12, 30))]
+    assert not list(
+        occurrences({'a': 'dec 30'}, dt.date(2000, 1, 1), dt.date(2000, 1, 1)),
+    )